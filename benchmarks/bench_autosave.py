@@ -0,0 +1,65 @@
+"""Benchmark of the time a save stops the game thread, writing it there against the autosave.
+
+The synchronous save snapshots and writes the game on the game thread. The autosave only
+snapshots it there, and the write runs on its own thread while the game goes on.
+
+Run it from the project root with: python -m benchmarks.bench_autosave
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import pygame
+
+from benchmarks.scenarios import get_scenario
+from game import Game
+from persistence.autosave import Autosave
+from persistence.gamedao import GameJSONDAO
+from presentation.headless_display import HeadlessDisplay
+from presentation.input_handler import InputHandler
+
+def measure(save, repeats: int, before=lambda: None) -> float:
+    """Gets the median milliseconds a save takes on the calling thread, without what runs before it."""
+    samples = []
+    for _ in range(repeats):
+        before()
+        start = time.perf_counter()
+        save()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--scenarios', nargs='+', default=['late', 'stress'])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+
+    with tempfile.TemporaryDirectory() as directory:
+        dao = GameJSONDAO(json_path=os.path.join(directory, 'save.json'))
+        autosave = Autosave(dao)
+
+        print("Game thread time of a save (ms, p50)")
+        for scenario_name in args.scenarios:
+            display = HeadlessDisplay()
+            world = get_scenario(scenario_name).build(display)
+            game = Game(world, InputHandler(world), dao)
+            entities = len(world.monsters) + len(world.bullets) + len(world.items)
+
+            synchronous = measure(lambda: dao.save_game(game), args.repeats)
+            background = measure(lambda: autosave.save(game), args.repeats, before=autosave.wait)
+            autosave.wait()
+
+            print(f"  {scenario_name:<6} {entities:6d} entities  synchronous {synchronous:8.2f}  "
+                  f"autosave {background:8.2f}")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
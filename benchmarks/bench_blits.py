@@ -0,0 +1,60 @@
+"""Benchmark of rendering a frame with thousands of bullets inside the camera.
+
+Run it from the project root with: python -m benchmarks.bench_blits
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+import pygame
+
+import settings
+from business.entities.bullets import NormalBullet
+from business.handlers.clock import GameClockSingleton
+from presentation.display import Display
+from presentation.sprite import preload_images
+from runner import initialize_game_world
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--bullets', type=int, default=2000)
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    display = Display()
+    preload_images()
+
+    random.seed(args.seed)
+    GameClockSingleton().reset()
+    world = initialize_game_world(display, {})
+    display.load_world(world)
+
+    # The player is at the center of the first screen, so the camera shows it whole
+    for _ in range(args.bullets):
+        pos_x = random.randint(0, settings.SCREEN_WIDTH)
+        pos_y = random.randint(0, settings.SCREEN_HEIGHT)
+        world.add_bullet(NormalBullet(pos_x, pos_y, pos_x + 1, pos_y, 4, 5, 50))
+    world.flush_changes()
+
+    samples = []
+    for _ in range(args.frames):
+        start = time.perf_counter()
+        display.render_frame(False, 0, False)
+        samples.append(time.perf_counter() - start)
+
+    pygame.quit()
+
+    samples.sort()
+    print(f"{args.bullets} bullets on screen, {args.frames} frames")
+    print(f"  render min {samples[0] * 1000:.3f} ms  p50 {statistics.median(samples) * 1000:.3f} ms  "
+          f"p95 {samples[int(len(samples) * 0.95)] * 1000:.3f} ms")
+
+if __name__ == "__main__":
+    main()
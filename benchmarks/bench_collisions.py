@@ -0,0 +1,68 @@
+"""Benchmark of the bullet-monster collisions with and without the spatial hash broad phase.
+
+Run it from the project root with: python -m benchmarks.bench_collisions
+"""
+
+import argparse
+import random
+import time
+
+import pygame
+
+import settings
+from business.handlers.colission_handler import CollisionHandler
+
+class BenchEntity:
+    """Minimal entity with a sprite rect that can take damage."""
+
+    def __init__(self, rect: pygame.Rect):
+        self.sprite = self
+        self.rect = rect
+        self.damage_amount = 0
+
+    def take_damage(self, amount):
+        """Does nothing, the benchmark only measures the collision checks."""
+
+def create_entities(amount: int, size: int) -> list[BenchEntity]:
+    """Creates entities spread across the whole world."""
+    return [
+        BenchEntity(pygame.Rect(random.randint(0, settings.WORLD_WIDTH), random.randint(0, settings.WORLD_HEIGHT), size, size))
+        for _ in range(amount)
+    ]
+
+def measure(handler, bullets, monsters, player, repeat: int) -> float:
+    """Gets the best time in seconds of a handler over some runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        handler(bullets, monsters, player)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help='Total entities per run.')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measure, the best one is kept.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    brute_force = CollisionHandler._CollisionHandler__handle_bullets_brute_force
+    spatial_hash = CollisionHandler._CollisionHandler__handle_bullets_spatial_hash
+    player = BenchEntity(pygame.Rect(0, 0, settings.TILE_WIDTH, settings.TILE_HEIGHT))
+
+    print(f"{'entities':>10} {'brute force (ms)':>18} {'spatial hash (ms)':>18} {'speedup':>9}")
+    for size in args.sizes:
+        monsters = create_entities(size // 2, settings.TILE_WIDTH)
+        bullets = create_entities(size - size // 2, settings.TILE_WIDTH)
+
+        # Every pair is checked, so the big sizes are measured only once
+        brute_force_repeat = args.repeat if size <= 1000 else 1
+        brute_force_time = measure(brute_force, bullets, monsters, player, brute_force_repeat)
+        spatial_hash_time = measure(spatial_hash, bullets, monsters, player, args.repeat)
+
+        print(f"{size:>10} {brute_force_time * 1000:>18.3f} {spatial_hash_time * 1000:>18.3f} "
+              f"{brute_force_time / spatial_hash_time:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark of restoring the world of a save, from the saved data already read from the file.
+
+Run it from the project root with: python -m benchmarks.bench_load
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import tempfile
+import time
+from unittest.mock import Mock
+
+import pygame
+
+from benchmarks.scenarios import Scenario
+from business.handlers.clock import GameClockSingleton
+from persistence.gamedao import GameJSONDAO
+from presentation.headless_display import HeadlessDisplay
+from runner import initialize_game_world
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entities', type=int, default=10000)
+    parser.add_argument('--repeats', type=int, default=10)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    display = HeadlessDisplay()
+
+    # Two fifths monsters, two fifths gems and one fifth bullets, split between the four bullet types
+    fifth = args.entities // 5
+    scenario = Scenario('load', monsters=2 * fifth, bullets=fifth // 4, gems=2 * fifth, bosses=True)
+    world = scenario.build(display)
+
+    with tempfile.TemporaryDirectory() as directory:
+        dao = GameJSONDAO(json_path=os.path.join(directory, 'game.json'))
+        dao.save_game(Mock(world=world))
+        saved_data = dao.load_game()
+
+    samples = []
+    restored = None
+    for _ in range(args.repeats):
+        # The world of the previous run is collected before, so it doesn't count in this one
+        restored = None
+        gc.collect()
+        GameClockSingleton().reset()
+        start = time.perf_counter()
+        restored = initialize_game_world(display, saved_data)
+        samples.append(time.perf_counter() - start)
+
+    entities = len(restored.monsters) + len(restored.bullets) + len(restored.items)
+    print(f"{entities} entities restored  p50 {statistics.median(samples) * 1000:.2f} ms  "
+          f"min {min(samples) * 1000:.2f} ms")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
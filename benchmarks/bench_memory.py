@@ -0,0 +1,120 @@
+"""Benchmark of the memory used by every monster, bullet and gem, counting its sprite and cooldowns.
+
+The same measure runs over a copy of an older tree, by default the one before the entities had
+`__slots__`, so the saving can be compared side by side.
+
+Run it from the project root with: python -m benchmarks.bench_memory [--baseline REV]
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import tracemalloc
+
+import pygame
+
+import settings
+from business.entities.bullets import NormalBullet
+from business.entities.items.experience_gem import ExperienceGem
+from business.entities.monsters.monster import Monster
+from business.handlers.clock import GameClockSingleton
+from presentation.sprite import preload_images
+
+# The last tree where the entities kept their attributes in a __dict__
+BASELINE = 'ab4e30d'
+
+def position(i: int) -> tuple[int, int]:
+    """Gets a position inside the world for the i-th entity."""
+    return 25 + i % (settings.WORLD_WIDTH - 50), 25 + i // (settings.WORLD_WIDTH - 50) % (settings.WORLD_HEIGHT - 50)
+
+KINDS = {
+    'monster': lambda i: Monster(*position(i)),
+    'bullet': lambda i: NormalBullet(*position(i), position(i)[0] + 1, position(i)[1], 4, 5, 50),
+    'gem': lambda i: ExperienceGem(*position(i), 1),
+}
+
+def measure(create, count: int) -> float:
+    """Gets the bytes allocated for every entity while creating many of them."""
+    # The first one loads the images, which are shared by all of them
+    create(0)
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [create(i) for i in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(entities)
+    tracemalloc.stop()
+
+    return allocated / count
+
+def measure_all(count: int) -> dict[str, float]:
+    """Gets the bytes of every kind of entity in this tree."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    preload_images()
+    GameClockSingleton().reset()
+
+    results = {kind: measure(create, count) for kind, create in KINDS.items()}
+
+    pygame.quit()
+    return results
+
+def measure_baseline(revision: str, count: int) -> dict[str, float] | None:
+    """Gets the bytes of every kind of entity in an older tree, or None if it can't be extracted.
+
+    The tree is extracted from git into a temporary directory, and this same script measures it
+    in another process that imports the modules of that tree.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        archive = os.path.join(directory, 'baseline.tar')
+        tree = os.path.join(directory, 'tree')
+        try:
+            subprocess.run(['git', 'archive', '--output', archive, revision], check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        with tarfile.open(archive) as tar:
+            tar.extractall(tree)
+
+        # The tree is the working directory for the assets and the first place to import from
+        env = dict(os.environ, PYTHONPATH=tree)
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--count', str(count), '--json'],
+            cwd=tree, env=env, check=True, capture_output=True, text=True
+        ).stdout
+        return json.loads(output.splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--baseline', default=BASELINE, help="git revision measured as the before")
+    parser.add_argument('--json', action='store_true', help="only print the bytes of this tree as JSON")
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps(measure_all(args.count)))
+        return
+
+    current = measure_all(args.count)
+    baseline = measure_baseline(args.baseline, args.count)
+
+    print(f"{args.count} instances of each kind, bytes each")
+    if baseline is None:
+        print(f"  (the baseline {args.baseline} couldn't be extracted with git)")
+        for kind, allocated in current.items():
+            print(f"  {kind:<8} {allocated:8.1f}")
+        return
+
+    print(f"  {'':<8} {args.baseline:>10} {'current':>10} {'saving':>8}")
+    for kind, allocated in current.items():
+        before = baseline[kind]
+        print(f"  {kind:<8} {before:10.1f} {allocated:10.1f} {(before - allocated) / before:8.1%}")
+
+if __name__ == "__main__":
+    main()
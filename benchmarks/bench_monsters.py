@@ -0,0 +1,67 @@
+"""Benchmark of the monsters movement with and without the NumPy monster store.
+
+Run it from the project root with: python -m benchmarks.bench_monsters
+"""
+
+import argparse
+import os
+import random
+import time
+from types import SimpleNamespace
+
+import pygame
+
+import settings
+from benchmarks.scenarios import random_position
+from business.entities.monsters.monster import Monster
+from business.world.monster_store import MonsterStore
+
+def measure(monsters: list[Monster], world, store: MonsterStore | None, ticks: int) -> float:
+    """Gets the mean time in seconds of moving every monster once."""
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if store is not None:
+            store.step_towards(world.player.pos_x, world.player.pos_y)
+        for monster in monsters:
+            monster.update(world)
+    return (time.perf_counter() - start) / ticks
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--ticks', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if not MonsterStore.available():
+        raise SystemExit("NumPy is not installed")
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    # Far away and out of attack range, so only the movement is measured
+    world = SimpleNamespace(player=SimpleNamespace(pos_x=-100000, pos_y=-100000))
+
+    print(f"{'monsters':>10} {'per object (ms)':>16} {'store (ms)':>12} {'speedup':>9} {'budget share':>13}")
+    for size in args.sizes:
+        random.seed(args.seed)
+        positions = [random_position() for _ in range(size)]
+
+        alone = [Monster(x, y) for x, y in positions]
+        per_object_time = measure(alone, world, None, args.ticks)
+
+        store = MonsterStore()
+        stored = [Monster(x, y) for x, y in positions]
+        for monster in stored:
+            store.attach(monster)
+        store_time = measure(stored, world, store, args.ticks)
+
+        budget_share = store_time * 1000 / (1000 / settings.FPS)
+        print(f"{size:>10} {per_object_time * 1000:>16.3f} {store_time * 1000:>12.3f} "
+              f"{per_object_time / store_time:>8.1f}x {budget_share:>12.1%}")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
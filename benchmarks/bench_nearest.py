@@ -0,0 +1,60 @@
+"""Benchmark of finding the nearest monster with the linear scans and with the monster index.
+
+Every tick the player and each homing bullet look for their nearest monster.
+
+Run it from the project root with: python -m benchmarks.bench_nearest
+"""
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+import settings
+from benchmarks.scenarios import random_position
+from business.world.monster_index import MonsterIndex
+
+def linear_nearest(monsters: list, pos_x: float, pos_y: float):
+    """The scan the bullet factories and the following bullets did before the index."""
+    monsters = monsters[:]
+    return min(monsters, key=lambda monster: (monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2)
+
+def measure(monsters: list, queries: list[tuple[float, float]], ticks: int, use_index: bool) -> float:
+    """Gets the mean time in seconds of answering every query once."""
+    index = MonsterIndex(monsters)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if use_index:
+            index.mark_dirty()
+            for pos_x, pos_y in queries:
+                index.nearest(pos_x, pos_y)
+        else:
+            for pos_x, pos_y in queries:
+                linear_nearest(monsters, pos_x, pos_y)
+    return (time.perf_counter() - start) / ticks
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--monsters', type=int, nargs='+', default=[20, 200, 2000])
+    parser.add_argument('--bullets', type=int, nargs='+', default=[1, 50, 500])
+    parser.add_argument('--ticks', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'monsters':>10} {'bullets':>8} {'linear (ms)':>12} {'index (ms)':>11} {'speedup':>9}")
+    for monsters_amount in args.monsters:
+        for bullets_amount in args.bullets:
+            random.seed(args.seed)
+            monsters = [SimpleNamespace(pos_x=x, pos_y=y) for x, y in
+                        (random_position() for _ in range(monsters_amount))]
+            queries = [(settings.WORLD_WIDTH / 2, settings.WORLD_HEIGHT / 2)]
+            queries += [random_position() for _ in range(bullets_amount)]
+
+            linear_time = measure(monsters, queries, args.ticks, use_index=False)
+            index_time = measure(monsters, queries, args.ticks, use_index=True)
+
+            print(f"{monsters_amount:>10} {bullets_amount:>8} {linear_time * 1000:>12.3f} "
+                  f"{index_time * 1000:>11.3f} {linear_time / index_time:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
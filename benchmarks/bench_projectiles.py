@@ -0,0 +1,73 @@
+"""Benchmark of the straight bullets movement and culling with and without the NumPy projectile store.
+
+Run it from the project root with: python -m benchmarks.bench_projectiles
+"""
+
+import argparse
+import os
+import random
+import time
+
+import pygame
+
+import settings
+from benchmarks.scenarios import random_position
+from business.entities.bullets import NormalBullet
+from business.handlers.boundaries_handler import BoundariesHandler
+from business.world.projectile_store import ProjectileStore
+
+def measure(bullets: list[NormalBullet], store: ProjectileStore | None, ticks: int) -> float:
+    """Gets the mean time in seconds of moving every bullet once and finding the ones to remove."""
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if store is not None:
+            store.integrate()
+            store.expired()
+        else:
+            for bullet in bullets:
+                bullet.update(None)
+            for bullet in bullets:
+                if bullet.health <= 0 or not BoundariesHandler.is_entity_within_world_boundaries(bullet):
+                    pass
+    return (time.perf_counter() - start) / ticks
+
+def create_bullets(positions: list[tuple[float, float]]) -> list[NormalBullet]:
+    """Creates a bullet in each position, shooting towards a random direction."""
+    return [NormalBullet(x, y, x + random.uniform(-1, 1), y + random.uniform(-1, 1), 1, 10, 1) for x, y in positions]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 1000])
+    parser.add_argument('--ticks', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if not ProjectileStore.available():
+        raise SystemExit("NumPy is not installed")
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'bullets':>10} {'per object (ms)':>16} {'store (ms)':>12} {'speedup':>9} {'budget share':>13}")
+    for size in args.sizes:
+        random.seed(args.seed)
+        positions = [random_position() for _ in range(size)]
+
+        # Creating the sprites is slow, so the same bullets are measured alone and then in the store
+        bullets = create_bullets(positions)
+        per_object_time = measure(bullets, None, args.ticks)
+
+        store = ProjectileStore()
+        for bullet in bullets:
+            store.attach(bullet)
+        store_time = measure(bullets, store, args.ticks)
+
+        budget_share = store_time * 1000 / (1000 / settings.FPS)
+        print(f"{size:>10} {per_object_time * 1000:>16.3f} {store_time * 1000:>12.3f} "
+              f"{per_object_time / store_time:>8.1f}x {budget_share:>12.1%}")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark of rendering full frames against dirty rectangles, with a still and a scrolling camera.
+
+In both scenes the monsters and bullets keep moving. In the scrolling one the player also walks,
+so the camera moves every frame and the dirty rectangle mode has to draw full frames.
+
+Run it from the project root with: python -m benchmarks.bench_render
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import pygame
+
+import settings
+from benchmarks.bench_tick import flushed
+from benchmarks.scenarios import get_scenario
+from presentation.display import Display
+from presentation.sprite import preload_images
+
+SCENES = ['still', 'scrolling']
+
+def measure(display: Display, scenario_name: str, scene: str, frames: int, dirty_rects: bool) -> list[float]:
+    """Gets the time in seconds of rendering every frame of a scene."""
+    settings.DIRTY_RECT_RENDERING = dirty_rects
+    world = get_scenario(scenario_name).build(display)
+    update = flushed(world, world.update)
+    player = world.player
+
+    samples = []
+    for frame in range(frames):
+        update()
+        if scene == 'scrolling':
+            # Back and forth, so the player never reaches the border of the world
+            player.move(1 if frame // 60 % 2 == 0 else -1, 0)
+
+        start = time.perf_counter()
+        display.render_frame(False, 0, False)
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--scenarios', nargs='+', default=['early', 'mid'])
+    parser.add_argument('--frames', type=int, default=240)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    display = Display()
+    preload_images()
+
+    print(f"{'scenario':<9} {'scene':<10} {'full p50 (ms)':>14} {'dirty p50 (ms)':>15} {'speedup':>8}")
+    for scenario_name in args.scenarios:
+        for scene in SCENES:
+            full = statistics.median(measure(display, scenario_name, scene, args.frames, dirty_rects=False))
+            dirty = statistics.median(measure(display, scenario_name, scene, args.frames, dirty_rects=True))
+            print(f"{scenario_name:<9} {scene:<10} {full * 1000:>14.3f} {dirty * 1000:>15.3f} {full / dirty:>7.2f}x")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark of the save file formats, with the time to save and load a world and the file size.
+
+The load time only counts reading the file into the saved data, not restoring the world from it.
+
+Run it from the project root with: python -m benchmarks.bench_save_formats
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from unittest.mock import Mock
+
+import pygame
+
+from benchmarks.scenarios import Scenario
+from persistence.binarydao import GameBinaryDAO
+from persistence.gamedao import GameJSONDAO
+from presentation.headless_display import HeadlessDisplay
+
+def measure(action, repeats: int) -> float:
+    """Gets the median milliseconds an action takes."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entities', type=int, default=10000)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+
+    # Two fifths monsters, two fifths gems and one fifth bullets, split between the four bullet types
+    fifth = args.entities // 5
+    scenario = Scenario('save', monsters=2 * fifth, bullets=fifth // 4, gems=2 * fifth, bosses=False)
+    world = scenario.build(HeadlessDisplay())
+    game = Mock(world=world)
+    entities = len(world.monsters) + len(world.bullets) + len(world.items)
+
+    with tempfile.TemporaryDirectory() as directory:
+        daos = {
+            'json': (GameJSONDAO(json_path=os.path.join(directory, 'game.json')), 'game.json'),
+            'binary': (GameBinaryDAO(save_path=os.path.join(directory, 'game.sav')), 'game.sav'),
+        }
+
+        print(f"{entities} entities, p50 of {args.repeats} runs")
+        for name, (dao, file_name) in daos.items():
+            save = measure(lambda: dao.save_game(game), args.repeats)
+            load = measure(dao.load_game, args.repeats)
+            size = os.path.getsize(os.path.join(directory, file_name)) / 1024
+
+            print(f"  {name:<7} save {save:8.2f} ms  load {load:8.2f} ms  size {size:9.1f} KiB")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
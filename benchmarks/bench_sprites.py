@@ -0,0 +1,69 @@
+"""Micro-benchmark of the construction of every sprite class with cold and warm image caches.
+
+The cold time clears the caches before every sprite, which is what creating a sprite cost before
+the images and tilesets were shared.
+
+Run it from the project root with: python -m benchmarks.bench_sprites
+"""
+
+import argparse
+import os
+import time
+
+import pygame
+
+from presentation.image_cache import IMAGE_CACHE
+from presentation.sprite import *
+from presentation.tileset import TILESETS
+
+SPRITES = {
+    PlayerSprite: (),
+    MonsterSprite: (1,),
+    GunMonsterSprite: (1,),
+    BossMonsterSprite: (5,),
+    BigBossMonsterSprite: (0.5,),
+    BulletSprite: (),
+    TurretBulletSprite: (),
+    FollowingBulletSprite: (),
+    MonsterBulletSprite: (),
+    ExperienceGemSprite: (),
+    RedExperienceGemSprite: (),
+    GreenExperienceGemSprite: (),
+    BlueExperienceGemSprite: (),
+    GuaymallenSprite: (),
+}
+
+def measure(sprite_type: type, args: tuple, repetitions: int, cold: bool) -> float:
+    """Gets the mean time in seconds of creating a sprite."""
+    elapsed = 0.0
+    for _ in range(repetitions):
+        if cold:
+            IMAGE_CACHE.clear()
+            TILESETS.clear()
+        start = time.perf_counter()
+        sprite_type(0, 0, *args)
+        elapsed += time.perf_counter() - start
+    return elapsed / repetitions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repetitions', type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'sprite':<26} {'cold (ms)':>10} {'warm (ms)':>10} {'speedup':>9}")
+    for sprite_type, sprite_args in SPRITES.items():
+        cold_time = measure(sprite_type, sprite_args, args.repetitions, cold=True)
+        preload_images()
+        warm_time = measure(sprite_type, sprite_args, args.repetitions, cold=False)
+
+        print(f"{sprite_type.__name__:<26} {cold_time * 1000:>10.3f} {warm_time * 1000:>10.4f} "
+              f"{cold_time / warm_time:>8.0f}x")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
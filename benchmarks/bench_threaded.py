@@ -0,0 +1,142 @@
+"""Benchmark of the game loop with the simulation in the same thread against a simulation thread.
+
+Every mode runs the real game loop for some seconds over a scenario world, and reports the
+rendered frames and simulated ticks per second with the p50 of the stages of each thread.
+The threads only run at the same time when the GIL is released, which pygame does while it
+blits and while the clock sleeps, or when Python is built without the GIL.
+
+To compare a build with the GIL against a free-threaded one, pass both interpreters, and each
+one runs the benchmark in its own process:
+
+    python -m benchmarks.bench_threaded --pythons python3.13 python3.13t
+
+Run it from the project root with: python -m benchmarks.bench_threaded
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pygame
+
+import settings
+from benchmarks.scenarios import get_scenario
+from business.handlers.frame_profiler import FrameProfiler
+from game import Game
+from headless import choose_upgrades
+from presentation.display import Display
+from presentation.input_handler import InputHandler
+from presentation.sprite import preload_images
+
+MODES = {'single': False, 'threaded': True}
+SIMULATION_STAGES = [FrameProfiler.INPUT, FrameProfiler.UPDATE, FrameProfiler.COLLISIONS, FrameProfiler.SNAPSHOT]
+
+class AutoUpgradeDisplay(Display):
+    """Display that picks the upgrades itself, as there is no one to choose them in the menu."""
+
+    def load_world(self, world):
+        super().load_world(world)
+        self.__world = world
+
+    def render_frame(self, paused=None, in_upgrade=None, dead=None, game=None):
+        if in_upgrade:
+            choose_upgrades(self.__world)
+            in_upgrade = 0
+        super().render_frame(paused, in_upgrade, dead, game)
+
+def run(display: Display, scenario_name: str, threaded: bool, seconds: float) -> Game:
+    """Runs the game loop over a new world of the scenario for some seconds."""
+    settings.THREADED_SIMULATION = threaded
+    world = get_scenario(scenario_name).build(display)
+    # The player must survive the whole run, or the simulation would stop
+    world.player._Player__health = 10 ** 9
+
+    game = Game(world, InputHandler(world), None)
+    timer = threading.Timer(seconds, game.close_game_loop)
+    timer.start()
+    game.run()
+    timer.cancel()
+    game.autosave.close()
+    return game
+
+def p50s(profiler: FrameProfiler, stages: list[str]) -> dict[str, float]:
+    """Gets the p50 of the stages measured by a profiler."""
+    return {stage: profiler.stats(stage)['p50'] for stage in stages if profiler.stats(stage)}
+
+def measure_all(scenarios: list[str], seconds: float) -> dict:
+    """Runs every mode over every scenario with this interpreter."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    display = AutoUpgradeDisplay()
+    preload_images()
+
+    results = {
+        'python': sys.version.split()[0],
+        'gil_enabled': getattr(sys, '_is_gil_enabled', lambda: True)(),
+        'scenarios': {},
+    }
+    for scenario_name in scenarios:
+        modes = results['scenarios'][scenario_name] = {}
+        for mode, threaded in MODES.items():
+            game = run(display, scenario_name, threaded, seconds)
+            modes[mode] = {
+                'frames_per_second': game.profiler.frames / seconds,
+                'ticks_per_second': game.simulation_profiler.frames / seconds,
+                'render_p50': p50s(game.profiler, [FrameProfiler.RENDER]),
+                'simulation_p50': p50s(game.simulation_profiler, SIMULATION_STAGES),
+            }
+
+    pygame.quit()
+    return results
+
+def measure_with(python: str, scenarios: list[str], seconds: float) -> dict | None:
+    """Runs this benchmark with another interpreter, or gets None if it can't be run."""
+    try:
+        output = subprocess.run(
+            [python, '-m', 'benchmarks.bench_threaded', '--json', '--seconds', str(seconds), '--scenarios', *scenarios],
+            check=True, capture_output=True, text=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return json.loads(output.splitlines()[-1])
+
+def print_results(python: str, results: dict):
+    """Prints the results of an interpreter."""
+    print(f"{python}: Python {results['python']}, GIL enabled: {results['gil_enabled']}")
+    for scenario_name, modes in results['scenarios'].items():
+        for mode, result in modes.items():
+            print(f"  {scenario_name:<6} {mode:<9} frames/s {result['frames_per_second']:6.1f}  "
+                  f"ticks/s {result['ticks_per_second']:6.1f}")
+            for thread in ('render', 'simulation'):
+                stages = '  '.join(f"{stage} {p50:.2f}" for stage, p50 in result[f'{thread}_p50'].items())
+                print(f"    {thread + ' thread p50 (ms):':<28}{stages}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', nargs='+', default=['early', 'mid'])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--pythons', nargs='+', default=None, help="interpreters to compare, this one by default")
+    parser.add_argument('--json', action='store_true', help="only print the results of this interpreter as JSON")
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps(measure_all(args.scenarios, args.seconds)))
+        return
+
+    if args.pythons is None:
+        print_results(sys.executable, measure_all(args.scenarios, args.seconds))
+        return
+
+    for python in args.pythons:
+        results = measure_with(python, args.scenarios, args.seconds)
+        if results is None:
+            print(f"{python}: couldn't be run")
+        else:
+            print_results(python, results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Benchmark of every stage of a tick on fixed scenarios.
+
+Run it from the project root with: python -m benchmarks.bench_tick
+Compare against a previous run with: python -m benchmarks.bench_tick --compare old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+
+import pygame
+
+from benchmarks.scenarios import SCENARIOS, Scenario, get_scenario
+from business.exceptions import DeadPlayerException
+from business.handlers.colission_handler import CollisionHandler
+from business.handlers.death_handler import DeathHandler
+from business.world.game_world import GameWorld
+from headless import choose_upgrades
+from presentation.display import Display
+
+STAGES = ['update', 'collisions', 'deaths', 'render']
+
+def check_deaths(world: GameWorld):
+    """Checks the deaths ignoring the player one, so the scenario keeps running."""
+    try:
+        DeathHandler.check_deaths(world)
+    except DeadPlayerException:
+        pass
+
+def percentiles(samples: list[float]) -> dict:
+    """Gets the summary of the samples in milliseconds."""
+    if len(samples) < 2:
+        samples = samples * 2
+    cut_points = statistics.quantiles(samples, n=100, method='inclusive')
+    return {
+        'mean': statistics.fmean(samples) * 1000,
+        'p50': cut_points[49] * 1000,
+        'p95': cut_points[94] * 1000,
+        'p99': cut_points[98] * 1000,
+    }
+
+def flushed(world: GameWorld, stage):
+    """Runs a stage and then applies the entities it added or removed, like Game.simulate_tick."""
+    def run():
+        try:
+            stage()
+        finally:
+            world.flush_changes()
+    return run
+
+def run_scenario(scenario: Scenario, display: Display, ticks: int, warmup: int, seed: int) -> dict:
+    """Runs a scenario timing every stage of every tick."""
+    world = scenario.build(display, seed)
+    stages = {
+        'update': flushed(world, world.update),
+        'collisions': flushed(world, lambda: CollisionHandler.handle_collisions(world)),
+        'deaths': flushed(world, lambda: check_deaths(world)),
+        'render': lambda: display.render_frame(False, 0, False),
+    }
+    samples = {stage: [] for stage in STAGES}
+
+    for tick in range(warmup + ticks):
+        for stage in STAGES:
+            start = time.perf_counter()
+            stages[stage]()
+            elapsed = time.perf_counter() - start
+
+            if tick >= warmup:
+                samples[stage].append(elapsed)
+
+        choose_upgrades(world)
+
+    total_time = sum(sum(stage_samples) for stage_samples in samples.values())
+    simulation_time = total_time - sum(samples['render'])
+
+    return {
+        'scenario': scenario.to_json(),
+        'ticks': ticks,
+        'ticks_per_sec': ticks / total_time,
+        'simulation_ticks_per_sec': ticks / simulation_time,
+        'stages': {stage: percentiles(samples[stage]) for stage in STAGES},
+    }
+
+def get_commit() -> str:
+    """Gets the current git commit, if there is one."""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def print_results(results: dict, baseline: dict | None = None):
+    """Prints the results, with the change against the baseline when there is one."""
+    for name, result in results['scenarios'].items():
+        base = baseline['scenarios'].get(name) if baseline else None
+
+        line = f"{name}: {result['ticks_per_sec']:.1f} ticks/s"
+        if base:
+            line += f" (was {base['ticks_per_sec']:.1f}, {result['ticks_per_sec'] / base['ticks_per_sec']:.2f}x)"
+        print(line)
+
+        for stage, summary in result['stages'].items():
+            line = f"  {stage:<11} p50 {summary['p50']:8.3f} ms  p95 {summary['p95']:8.3f} ms  p99 {summary['p99']:8.3f} ms"
+            if base:
+                line += f"  (p50 was {base['stages'][stage]['p50']:8.3f} ms)"
+            print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--scenarios', nargs='+', default=[scenario.name for scenario in SCENARIOS])
+    parser.add_argument('--ticks', type=int, default=120, help='Measured ticks per scenario.')
+    parser.add_argument('--warmup', type=int, default=10, help='Ticks run before measuring.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='Results file, benchmarks/results/<commit>.json by default.')
+    parser.add_argument('--compare', default=None, help='Previous results file to compare with.')
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    display = Display()
+
+    commit = get_commit()
+    results = {
+        'commit': commit,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'timestamp': time.time(),
+        'scenarios': {},
+    }
+    for name in args.scenarios:
+        results['scenarios'][name] = run_scenario(get_scenario(name), display, args.ticks, args.warmup, args.seed)
+
+    pygame.quit()
+
+    output = args.output or os.path.join('benchmarks', 'results', f'{commit}.json')
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w', encoding="utf-8") as file:
+        json.dump(results, file, indent=4)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    print_results(results, baseline)
+    print(f"Results saved to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Fixed scenarios used by the benchmarks."""
+
+import random
+
+import settings
+from business.entities.bullets import NormalBullet, TurretBullet, FollowingBullet
+from business.entities.items.experience_gem import ExperienceGem, RedExperienceGem, GreenExperienceGem, BlueExperienceGem
+from business.entities.monsters.boss import BossMonster
+from business.entities.monsters.boss2 import BigBossMonster
+from business.entities.monsters.bullets import MonsterBullet
+from business.entities.monsters.gunner import GunMonster
+from business.entities.monsters.monster import Monster
+from business.handlers.clock import GameClockSingleton
+from business.world.game_world import GameWorld
+from presentation.interfaces import IDisplay
+from runner import initialize_game_world
+
+class Scenario:
+    """A world population that is always built the same way for a given seed."""
+
+    def __init__(self, name: str, monsters: int, bullets: int, gems: int, bosses: bool):
+        """Creates the scenario.
+
+        Args:
+            name (str): The name used in the reports.
+            monsters (int): Amount of monsters, one of every seven is a gun monster.
+            bullets (int): Amount of bullets of each type.
+            gems (int): Amount of experience gems.
+            bosses (bool): If both bosses are present.
+        """
+        self.name = name
+        self.monsters = monsters
+        self.bullets = bullets
+        self.gems = gems
+        self.bosses = bosses
+
+    def to_json(self):
+        return {
+            'monsters': self.monsters,
+            'bullets_per_type': self.bullets,
+            'gems': self.gems,
+            'bosses': self.bosses
+        }
+
+    def build(self, display: IDisplay, seed: int = 0) -> GameWorld:
+        """Builds a new world populated with the scenario entities.
+
+        Args:
+            display (IDisplay): The display of the world.
+            seed (int): The seed for the random positions.
+
+        Returns:
+            GameWorld: The world.
+        """
+        random.seed(seed)
+        GameClockSingleton().reset()
+
+        world = initialize_game_world(display, {})
+        display.load_world(world)
+        player = world.player
+
+        for i in range(self.monsters):
+            monster_type = GunMonster if i % 7 == 0 else Monster
+            world.add_monster(monster_type(*random_position()))
+
+        if self.bosses:
+            world.add_monster(BossMonster(*random_position()))
+            world.add_monster(BigBossMonster(*random_position()))
+
+        for _ in range(self.bullets):
+            world.add_bullet(NormalBullet(player.pos_x, player.pos_y, *random_position(), 4, 5, 50))
+            world.add_bullet(TurretBullet(player.pos_x, player.pos_y, *random_position(), 10, 3, 5))
+            world.add_bullet(FollowingBullet(*random_position(), None, 3, 10, 20))
+            world.add_bullet(MonsterBullet(*random_position(), player.pos_x, player.pos_y, 5, 4, 1))
+
+        gem_types = [ExperienceGem, RedExperienceGem, GreenExperienceGem, BlueExperienceGem]
+        for i in range(self.gems):
+            world.add_item(gem_types[i % len(gem_types)](*random_position(), 1))
+
+        world.flush_changes()
+        return world
+
+SCENARIOS = [
+    Scenario('early', monsters=20, bullets=5, gems=20, bosses=False),
+    Scenario('mid', monsters=100, bullets=25, gems=100, bosses=True),
+    Scenario('late', monsters=500, bullets=100, gems=500, bosses=True),
+    Scenario('stress', monsters=2000, bullets=500, gems=2000, bosses=True),
+]
+
+def random_position() -> tuple[int, int]:
+    """Gets a random position inside the world boundaries."""
+    return random.randint(25, settings.WORLD_WIDTH - 25), random.randint(25, settings.WORLD_HEIGHT - 25)
+
+def get_scenario(name: str) -> Scenario:
+    """Gets a scenario by its name."""
+    for scenario in SCENARIOS:
+        if scenario.name == name:
+            return scenario
+    raise KeyError(name)
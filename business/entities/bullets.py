@@ -5,12 +5,32 @@ import math
 from business.entities.entity import MovableEntity
 from business.entities.interfaces import IBullet, IMonster, IDespawnable
 from business.world.interfaces import IGameWorld
+from business.world.entity_store import StoreField
+from business.world.monster_index import MonsterIndex
 from presentation.sprite import BulletSprite, TurretBulletSprite, FollowingBulletSprite
 from business.handlers.cooldown_handler import CooldownHandler
+from business.world.type_registry import TYPE_REGISTRY
 
+def straight_bullet_arguments(data: dict) -> tuple:
+    """Gets the arguments of the constructor of a bullet that moves straight from its saved data."""
+    return (data['pos_x'], data['pos_y'], data['pos_x'] + data['dir_x'], data['pos_y'] + data['dir_y'],
+            data['speed'], data['damage'], data['health'])
+
+def following_bullet_arguments(data: dict) -> tuple:
+    """Gets the arguments of the constructor of a following bullet from its saved data, which has no target."""
+    return data['pos_x'], data['pos_y'], None, data['speed'], data['damage'], data['health'], data['despawn_cooldown']
+
+@TYPE_REGISTRY.register('normal_bullet', saved_arguments=straight_bullet_arguments)
 class NormalBullet(MovableEntity, IBullet):
     """A bullet that moves towards a target direction."""
 
+    __slots__ = ('__dir_x_value', '__dir_y_value', '__damage_value', '__health_value', '__max_health')
+
+    __dir_x = StoreField('dir_x')
+    __dir_y = StoreField('dir_y')
+    __damage = StoreField('damage')
+    __health = StoreField('health')
+
     def __init__(self, src_x, src_y, dst_x, dst_y, speed, damage, health):
         super().__init__(src_x, src_y, speed, BulletSprite(src_x, src_y))
 
@@ -19,6 +39,14 @@ class NormalBullet(MovableEntity, IBullet):
         self.__max_health = health
         self.__health = self.__max_health 
 
+    def reset(self, src_x, src_y, dst_x, dst_y, speed, damage, health):
+        super().reset(src_x, src_y, speed)
+
+        self.__dir_x, self.__dir_y = self.__calculate_direction(dst_x - src_x, dst_y - src_y)
+        self.__damage = damage
+        self.__max_health = health
+        self.__health = self.__max_health
+
     def to_json(self):
         return {
             'pos_x': self.pos_x,
@@ -49,6 +77,9 @@ class NormalBullet(MovableEntity, IBullet):
         self.__health = max(0, self.__health - amount)
 
     def update(self, _: IGameWorld):
+        if self.in_store:
+            return
+
         self.move(self.__dir_x, self.__dir_y)
 
     @property
@@ -58,9 +89,17 @@ class NormalBullet(MovableEntity, IBullet):
     def __str__(self):
         return f"Bullet(pos=({self._pos_x, self._pos_y}), dir=({self.__dir_x, self.__dir_y}))"
     
+@TYPE_REGISTRY.register('turret_bullet', saved_arguments=straight_bullet_arguments)
 class TurretBullet(MovableEntity, IBullet):
     """A bullet that moves towards a target direction."""
 
+    __slots__ = ('__dir_x_value', '__dir_y_value', '__damage_value', '__health_value', '__max_health')
+
+    __dir_x = StoreField('dir_x')
+    __dir_y = StoreField('dir_y')
+    __damage = StoreField('damage')
+    __health = StoreField('health')
+
     def __init__(self, src_x, src_y, dst_x, dst_y, speed, damage, health):
         super().__init__(src_x, src_y, speed, TurretBulletSprite(src_x, src_y))
         
@@ -69,6 +108,14 @@ class TurretBullet(MovableEntity, IBullet):
         self.__max_health = health
         self.__health = self.__max_health 
 
+    def reset(self, src_x, src_y, dst_x, dst_y, speed, damage, health):
+        super().reset(src_x, src_y, speed)
+
+        self.__dir_x, self.__dir_y = self.__calculate_direction(dst_x - src_x, dst_y - src_y)
+        self.__damage = damage
+        self.__max_health = health
+        self.__health = self.__max_health
+
     def to_json(self):
         return {
             'pos_x': self.pos_x,
@@ -99,6 +146,9 @@ class TurretBullet(MovableEntity, IBullet):
         self.__health = max(0, self.__health - amount)
 
     def update(self, _: IGameWorld):
+        if self.in_store:
+            return
+
         self.move(self.__dir_x, self.__dir_y)
 
     @property
@@ -108,7 +158,10 @@ class TurretBullet(MovableEntity, IBullet):
     def __str__(self):
         return f"Bullet(pos=({self._pos_x, self._pos_y}), dir=({self.__dir_x, self.__dir_y}))"
     
+@TYPE_REGISTRY.register('following_bullet', saved_arguments=following_bullet_arguments)
 class FollowingBullet(MovableEntity, IBullet, IDespawnable):
+    __slots__ = ('__target_monster', '__damage', '__max_health', '__health', '__despawn_cooldown', '__dir_x', '__dir_y')
+
     BASE_DESPAWN_COOLDOWN = 2500
 
     def __init__(self, src_x, src_y, target_monster: IMonster, speed, damage, health, saved_cooldown: float | None = None):
@@ -127,6 +180,21 @@ class FollowingBullet(MovableEntity, IBullet, IDespawnable):
         if target_monster:
             self.__dir_x, self.__dir_y = self.__calculate_direction(self.__target_monster.pos_x - src_x, self.__target_monster.pos_y - src_y)
 
+    def reset(self, src_x, src_y, target_monster: IMonster, speed, damage, health, saved_cooldown: float | None = None):
+        super().reset(src_x, src_y, speed)
+
+        self.__target_monster = target_monster
+        self.__damage = damage
+        self.__max_health = health
+        self.__health = self.__max_health
+
+        self.__despawn_cooldown.put_on_cooldown()
+        if saved_cooldown:
+            self.__despawn_cooldown.last_action_time = saved_cooldown
+
+        if target_monster:
+            self.__dir_x, self.__dir_y = self.__calculate_direction(self.__target_monster.pos_x - src_x, self.__target_monster.pos_y - src_y)
+
     def to_json(self):
         return {
             'pos_x': self.pos_x,
@@ -161,17 +229,7 @@ class FollowingBullet(MovableEntity, IBullet, IDespawnable):
 
     def __get_nearest_monster(self, world: IGameWorld) -> IMonster:
         """Gets the nearest monster entity to the bullet position."""
-        if not world.monsters:
-            return None
-
-        monster = min(
-            world.monsters,
-            key=lambda monster: (
-                (monster.pos_x - self.pos_x) ** 2 + (monster.pos_y - self.pos_y) ** 2
-            ),
-        )
-
-        return monster
+        return MonsterIndex.find_nearest(world, self.pos_x, self.pos_y)
 
     def update(self, world: IGameWorld):
         """Update the bullet's position and movement direction, making it follow the target monster."""
@@ -1,20 +1,39 @@
 """Contains the base classes for all entities in the game."""
 
-import logging
 from abc import abstractmethod
 
+import settings
 from business.entities.interfaces import IHasPosition, ICanMove
 from business.world.interfaces import IGameWorld
+from business.world.entity_store import StoreField
 from presentation.sprite import Sprite
 
 class Entity(IHasPosition):
-    """Base class for all entities in the game."""
+    """Base class for all entities in the game.
+
+    The attributes of every entity class are declared in its `__slots__`, and entities have no
+    `__dict__`, so setting an attribute that isn't declared raises AttributeError.
+    """
+
+    __slots__ = ('_pos_x', '_pos_y', '_sprite')
 
     def __init__(self, pos_x: float, pos_y: float, sprite: Sprite):
         self._pos_x: float = pos_x
         self._pos_y: float = pos_y
         self._sprite: Sprite = sprite
-        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def reset(self, pos_x: float, pos_y: float, sprite_pos: tuple[float, float] | None = None):
+        """Places the entity again, so a pooled entity can be reused.
+
+        Args:
+            pos_x (float): The x-coordinate.
+            pos_y (float): The y-coordinate.
+            sprite_pos (tuple[float, float] | None): Where the constructor places the sprite, if it
+                is not the position of the entity.
+        """
+        self._pos_x = pos_x
+        self._pos_y = pos_y
+        self._sprite.reset(*(sprite_pos or (pos_x, pos_y)))
 
     def _get_distance_to(self, an_entity: IHasPosition) -> float:
         """Returns the distance to another entity using the Euclidean distance formula.
@@ -45,21 +64,62 @@ class Entity(IHasPosition):
         self.sprite.update()
 
 class MovableEntity(Entity, ICanMove):
-    """Base class for all entities that can move."""
+    """Base class for all entities that can move.
+
+    Its position and speed can be kept by an entity store, which moves many entities at once.
+    """
+
+    __slots__ = ('_pos_x_value', '_pos_y_value', '_speed_value', '_store', '_store_slot')
+
+    _pos_x = StoreField('pos_x')
+    _pos_y = StoreField('pos_y')
+    _speed = StoreField('speed')
 
     def __init__(self, pos_x: float, pos_y: float, speed: float, sprite: Sprite):
+        self._store = None
+        self._store_slot = None
         super().__init__(pos_x, pos_y, sprite)
         self._pos_x: float = pos_x
         self._pos_y: float = pos_y
         self._speed: float = speed
         self._sprite: Sprite = sprite
 
+    def reset(self, pos_x: float, pos_y: float, speed: float, sprite_pos: tuple[float, float] | None = None):
+        """Places the entity again with a speed, so a pooled entity can be reused.
+
+        Args:
+            pos_x (float): The x-coordinate.
+            pos_y (float): The y-coordinate.
+            speed (float): The speed.
+            sprite_pos (tuple[float, float] | None): Where the constructor places the sprite, if it
+                is not the position of the entity.
+        """
+        super().reset(pos_x, pos_y, sprite_pos)
+        self._speed = speed
+
     def move(self, direction_x: float, direction_y: float):
-        self._pos_x += direction_x * self._speed
-        self._pos_y += direction_y * self._speed
+        self._pos_x += direction_x * self._speed * settings.SPEED_SCALE
+        self._pos_y += direction_y * self._speed * settings.SPEED_SCALE
 
         self.sprite.update_pos(self._pos_x, self._pos_y)
 
     @property
     def speed(self) -> float:
-        return self._speed
\ No newline at end of file
+        return self._speed
+
+    @property
+    def store(self):
+        """The entity store the entity is attached to, or None."""
+        return self._store
+
+    def unstored_json(self) -> dict:
+        """Gets the saved values of the entity that the columns of its store don't have.
+
+        The JSON of an attached entity is the saved columns of its store followed by these values.
+        """
+        return {}
+
+    @property
+    def in_store(self) -> bool:
+        """If the entity is attached to an entity store."""
+        return self._store is not None
\ No newline at end of file
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 class IUpdatable(ABC):
     """Interface for entities that can be updated."""
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, world):
         """Update the state of the entity."""
@@ -19,6 +21,8 @@ class IUpdatable(ABC):
 class IHasSprite(ABC):
     """Interface for entities that have a sprite."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def sprite(self) -> "Sprite":
@@ -32,6 +36,8 @@ class IHasSprite(ABC):
 class IHasPosition(IHasSprite):
     """Interface for entities that have a position."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def pos_x(self) -> float:
@@ -54,6 +60,8 @@ class IHasPosition(IHasSprite):
 class ICanMove(IHasPosition):
     """Interface for entities that can move."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def speed(self) -> float:
@@ -77,6 +85,8 @@ class ICanMove(IHasPosition):
 class ICanDealDamage(ABC):
     """Interface for entities that can deal damage."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def damage_amount(self) -> int:
@@ -89,6 +99,8 @@ class ICanDealDamage(ABC):
 class IDamageable(ABC):
     """Interface for entities that can take damage."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def max_health(self) -> float:
@@ -118,6 +130,8 @@ class IDamageable(ABC):
 class ICanHeal(ABC):
     """Interface for entities that can heal themselves"""
 
+    __slots__ = ()
+
     @abstractmethod
     def heal(self, amount: float):
         """Heals the entity by that amount.
@@ -128,6 +142,9 @@ class ICanHeal(ABC):
 
 class IMonster(IUpdatable, ICanMove, IDamageable, ICanDealDamage, JSONable):
     """Interface for monster entities."""
+
+    __slots__ = ()
+
     @property
     @abstractmethod
     def max_health(self) -> float:
@@ -139,9 +156,13 @@ class IMonster(IUpdatable, ICanMove, IDamageable, ICanDealDamage, JSONable):
 
 class IBullet(IUpdatable, ICanMove, IDamageable, ICanDealDamage, JSONable):
     """Interface for bullet entities."""
+
+    __slots__ = ()
     
 class IItem(IHasPosition, IUpdatable, JSONable):
     """Interface for items that can be picked up by the player"""
+
+    __slots__ = ()
     
     @abstractmethod
     def in_player_range(self, player) -> bool:
@@ -157,6 +178,8 @@ class IItem(IHasPosition, IUpdatable, JSONable):
 class IDespawnable():
     """Interface for entities that can despawn after a set amount of time."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def can_despawn(self) -> bool:
@@ -169,6 +192,8 @@ class IDespawnable():
 class IExperienceGem(IDespawnable, IItem):
     """Interface for experience gem entities."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def amount(self) -> int:
@@ -181,6 +206,8 @@ class IExperienceGem(IDespawnable, IItem):
 class IPlayer(IUpdatable, ICanMove, IDamageable, ICanDealDamage, ICanHeal, JSONable):
     """Interface for the player entity."""
 
+    __slots__ = ()
+
     @abstractmethod
     def pickup_item(self, item: "IItem"):
         """Picks up an item.
@@ -238,6 +265,15 @@ class IPlayer(IUpdatable, ICanMove, IDamageable, ICanDealDamage, ICanHeal, JSONa
             list[IPerk]: The list of perks.
         """
 
+    @property
+    @abstractmethod
+    def inventory_version(self) -> int:
+        """A number that changes every time a perk is added to the inventory or upgraded.
+
+        Returns:
+            int: The version of the inventory.
+        """
+
     @property
     @abstractmethod
     def pick_range(self) -> float:
@@ -4,11 +4,19 @@ from business.entities.entity import Entity
 from business.entities.interfaces import IExperienceGem, IPlayer
 from presentation.sprite import ExperienceGemSprite, RedExperienceGemSprite, GreenExperienceGemSprite, BlueExperienceGemSprite
 from business.handlers.cooldown_handler import CooldownHandler
+from business.world.type_registry import TYPE_REGISTRY
 
+def gem_arguments(data: dict) -> tuple:
+    """Gets the arguments of the constructor of a gem from its saved data."""
+    return data['pos_x'], data['pos_y'], data['amount'], data['despawn_cooldown']
 
+
+@TYPE_REGISTRY.register('gem', saved_arguments=gem_arguments)
 class ExperienceGem(Entity, IExperienceGem):
     """Represents an experience gem in the game world."""
     
+    __slots__ = ('__despawn_cooldown', '__amount')
+
     BASE_DESPAWN_COOLDOWN = 10000
 
     def __init__(self, pos_x: float, pos_y: float, amount: int, saved_cooldown: float | None = None):
@@ -20,6 +28,14 @@ class ExperienceGem(Entity, IExperienceGem):
         if saved_cooldown:
             self.__despawn_cooldown.last_action_time = saved_cooldown
 
+    def reset(self, pos_x: float, pos_y: float, amount: int, saved_cooldown: float | None = None):
+        super().reset(pos_x, pos_y)
+        self.__amount = amount
+
+        self.__despawn_cooldown.put_on_cooldown()
+        if saved_cooldown:
+            self.__despawn_cooldown.last_action_time = saved_cooldown
+
     def to_json(self):
         return {
             'pos_x': self.pos_x,
@@ -42,9 +58,12 @@ class ExperienceGem(Entity, IExperienceGem):
     def in_player_range(self, player: IPlayer):
         return self._get_distance_to(player) <= player.pick_range
 
+@TYPE_REGISTRY.register('red_gem', saved_arguments=gem_arguments)
 class RedExperienceGem(Entity, IExperienceGem):
     """Represents a red experience gem in the game world."""
     
+    __slots__ = ('__despawn_cooldown', '__amount')
+
     BASE_DESPAWN_COOLDOWN = 30000
 
     def __init__(self, pos_x: float, pos_y: float, amount: int, saved_cooldown: float | None = None):
@@ -56,6 +75,14 @@ class RedExperienceGem(Entity, IExperienceGem):
         if saved_cooldown:
             self.__despawn_cooldown.last_action_time = saved_cooldown
 
+    def reset(self, pos_x: float, pos_y: float, amount: int, saved_cooldown: float | None = None):
+        super().reset(pos_x, pos_y)
+        self.__amount = amount
+
+        self.__despawn_cooldown.put_on_cooldown()
+        if saved_cooldown:
+            self.__despawn_cooldown.last_action_time = saved_cooldown
+
     def to_json(self):
         return {
             'pos_x': self.pos_x,
@@ -78,9 +105,12 @@ class RedExperienceGem(Entity, IExperienceGem):
     def in_player_range(self, player: IPlayer):
         return self._get_distance_to(player) <= player.pick_range
     
+@TYPE_REGISTRY.register('green_gem', saved_arguments=gem_arguments)
 class GreenExperienceGem(Entity, IExperienceGem):
     """Represents a green experience gem in the game world."""
     
+    __slots__ = ('__despawn_cooldown', '__amount')
+
     BASE_DESPAWN_COOLDOWN = 15000
 
     def __init__(self, pos_x: float, pos_y: float, amount: int, saved_cooldown: float | None = None):
@@ -92,6 +122,14 @@ class GreenExperienceGem(Entity, IExperienceGem):
         if saved_cooldown:
             self.__despawn_cooldown.last_action_time = saved_cooldown
 
+    def reset(self, pos_x: float, pos_y: float, amount: int, saved_cooldown: float | None = None):
+        super().reset(pos_x, pos_y)
+        self.__amount = amount
+
+        self.__despawn_cooldown.put_on_cooldown()
+        if saved_cooldown:
+            self.__despawn_cooldown.last_action_time = saved_cooldown
+
     def to_json(self):
         return {
             'pos_x': self.pos_x,
@@ -114,9 +152,12 @@ class GreenExperienceGem(Entity, IExperienceGem):
     def in_player_range(self, player: IPlayer):
         return self._get_distance_to(player) <= player.pick_range
     
+@TYPE_REGISTRY.register('blue_gem', saved_arguments=gem_arguments)
 class BlueExperienceGem(Entity, IExperienceGem):
     """Represents a blue experience gem in the game world."""
     
+    __slots__ = ('__despawn_cooldown', '__amount')
+
     BASE_DESPAWN_COOLDOWN = 20000
 
     def __init__(self, pos_x: float, pos_y: float, amount: int, saved_cooldown: float | None = None):
@@ -128,6 +169,14 @@ class BlueExperienceGem(Entity, IExperienceGem):
         if saved_cooldown:
             self.__despawn_cooldown.last_action_time = saved_cooldown
 
+    def reset(self, pos_x: float, pos_y: float, amount: int, saved_cooldown: float | None = None):
+        super().reset(pos_x, pos_y)
+        self.__amount = amount
+
+        self.__despawn_cooldown.put_on_cooldown()
+        if saved_cooldown:
+            self.__despawn_cooldown.last_action_time = saved_cooldown
+
     def to_json(self):
         return {
             'pos_x': self.pos_x,
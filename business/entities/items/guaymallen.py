@@ -3,11 +3,15 @@
 from business.entities.entity import Entity
 from business.entities.interfaces import IItem, IPlayer
 from presentation.sprite import GuaymallenSprite
+from business.world.type_registry import TYPE_REGISTRY
 
 
+@TYPE_REGISTRY.register('guaymallen', saved_arguments=lambda data: (data['pos_x'], data['pos_y']))
 class Guaymallen(Entity, IItem):
     """Guaymallen alfajor that heals 50% of player's max_health"""
 
+    __slots__ = ('__amount',)
+
     def __init__(self, pos_x: float, pos_y: float):
         super().__init__(pos_x, pos_y, GuaymallenSprite(pos_x, pos_y))
         self.__amount = 0.5
@@ -4,6 +4,8 @@ from business.entities.items.interfaces import IItemFactory
 from business.entities.items.experience_gem import *
 from business.entities.items.guaymallen import *
 from business.world.interfaces import IGameWorld
+from business.world.entity_pool import ENTITY_POOLS
+from business.world.type_registry import TYPE_REGISTRY
 
 class ItemFactory(IItemFactory):
     """Item factory that creates instances of all the possible items."""
@@ -18,16 +20,16 @@ class ItemFactory(IItemFactory):
     def create_item(type: str, entity: Entity, world: IGameWorld, xp_amount = None):
 
         if type == ItemFactory.COMMON_GEM:
-            world.add_item(ExperienceGem(entity.pos_x, entity.pos_y, xp_amount))
+            world.add_item(ENTITY_POOLS.acquire(ExperienceGem, entity.pos_x, entity.pos_y, xp_amount))
 
         elif type == ItemFactory.RED_GEM:
-            world.add_item(RedExperienceGem(entity.pos_x, entity.pos_y, xp_amount))
+            world.add_item(ENTITY_POOLS.acquire(RedExperienceGem, entity.pos_x, entity.pos_y, xp_amount))
 
         elif type == ItemFactory.GREEN_GEM:
-            world.add_item(GreenExperienceGem(entity.pos_x, entity.pos_y, xp_amount))
+            world.add_item(ENTITY_POOLS.acquire(GreenExperienceGem, entity.pos_x, entity.pos_y, xp_amount))
 
         elif type == ItemFactory.BLUE_GEM:
-            world.add_item(BlueExperienceGem(entity.pos_x, entity.pos_y, xp_amount))
+            world.add_item(ENTITY_POOLS.acquire(BlueExperienceGem, entity.pos_x, entity.pos_y, xp_amount))
 
         elif type == ItemFactory.GUAYMALLEN:
             world.add_item(Guaymallen(entity.pos_x, entity.pos_y))
@@ -36,43 +38,8 @@ class ItemFactory(IItemFactory):
     def load_items(world: IGameWorld, saved_data: dict):
         saved_data = saved_data.get('items')
 
-        for item_type in saved_data:
-            if 'experience_gem.ExperienceGem' in item_type:
-                for gem_data in saved_data[item_type]:
-                    pos_x = gem_data['pos_x']
-                    pos_y = gem_data['pos_y']
-                    amount = gem_data['amount']
-                    cooldown = gem_data['despawn_cooldown']
-
-                    world.add_item(ExperienceGem(pos_x, pos_y, amount, cooldown))
-            elif 'Red' in item_type:
-                for gem_data in saved_data[item_type]:
-                    pos_x = gem_data['pos_x']
-                    pos_y = gem_data['pos_y']
-                    amount = gem_data['amount']
-                    cooldown = gem_data['despawn_cooldown']
-
-                    world.add_item(RedExperienceGem(pos_x, pos_y, amount, cooldown))
-            elif 'Green' in item_type:
-                for gem_data in saved_data[item_type]:
-                    pos_x = gem_data['pos_x']
-                    pos_y = gem_data['pos_y']
-                    amount = gem_data['amount']
-                    cooldown = gem_data['despawn_cooldown']
-
-                    world.add_item(GreenExperienceGem(pos_x, pos_y, amount, cooldown))
-            elif 'Blue' in item_type:
-                for gem_data in saved_data[item_type]:
-                    pos_x = gem_data['pos_x']
-                    pos_y = gem_data['pos_y']
-                    amount = gem_data['amount']
-                    cooldown = gem_data['despawn_cooldown']
-
-                    world.add_item(BlueExperienceGem(pos_x, pos_y, amount, cooldown))
-
-            elif 'Guaymallen' in item_type:
-                for gem_data in saved_data[item_type]:
-                    pos_x = gem_data['pos_x']
-                    pos_y = gem_data['pos_y']
-
-                    world.add_item(Guaymallen(pos_x, pos_y))               
\ No newline at end of file
+        for item_tag, items_data in saved_data.items():
+            item_type = TYPE_REGISTRY.type_of(item_tag)
+            # Items of types that no longer exist are left out
+            if item_type is not None:
+                world.add_items(TYPE_REGISTRY.load_all(item_type, items_data))
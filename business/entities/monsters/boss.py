@@ -4,9 +4,12 @@ from business.entities.entity import MovableEntity
 from business.entities.interfaces import IDamageable, IHasPosition, IMonster
 from business.handlers.cooldown_handler import CooldownHandler
 from business.world.interfaces import IGameWorld
+from business.world.entity_store import StoreField
 from presentation.sprite import BossMonsterSprite
+from business.world.type_registry import TYPE_REGISTRY
 import math
 
+@TYPE_REGISTRY.register('boss', saved_arguments=lambda data: (data['pos_x'], data['pos_y'], data))
 class BossMonster(MovableEntity, IMonster):
     """A monster entity in the game."""
 
@@ -16,8 +19,12 @@ class BossMonster(MovableEntity, IMonster):
     BASE_ATTACK_RANGE = 100
     BASE_ATTACK_COOLDOWN = 2000
 
+    __slots__ = ('__health_value', '__speed', '__max_health', '__damage', '__attack_range', '__attack_cooldown')
+
+    __health = StoreField('health')
+
     def __init__(self, src_x: int, src_y: int, saved_data: dict | None = None):
-        super().__init__(src_x, src_y, BossMonster.BASE_SPEED, BossMonsterSprite(0, 0, 5))
+        super().__init__(src_x, src_y, BossMonster.BASE_SPEED, BossMonsterSprite(0, 0, BossMonsterSprite.BASE_SIZE))
 
         self.__speed = BossMonster.BASE_SPEED
         self.__max_health = BossMonster.BASE_HEALTH
@@ -40,9 +47,12 @@ class BossMonster(MovableEntity, IMonster):
             'pos_x': self._pos_x,
             'pos_y': self._pos_y,
             'health': self.__health,
-            'attack_cooldown': self.__attack_cooldown.last_action_time
+            **self.unstored_json()
         }
 
+    def unstored_json(self):
+        return {'attack_cooldown': self.__attack_cooldown.last_action_time}
+
     def attack(self, target: IDamageable):
         """Attacks the target."""
         if not self.__attack_cooldown.is_action_ready():
@@ -83,11 +93,13 @@ class BossMonster(MovableEntity, IMonster):
         return dir_x, dir_y
 
     def update(self, world: IGameWorld):
-        direction_x, direction_y = self.__get_direction_towards_the_player(world)
-        if (direction_x, direction_y) == (0, 0):
-            return
+        # When it is in a store, the world has already moved it towards the player
+        if not self.in_store:
+            direction_x, direction_y = self.__get_direction_towards_the_player(world)
+            if (direction_x, direction_y) == (0, 0):
+                return
 
-        self.move(direction_x, direction_y)
+            self.move(direction_x, direction_y)
 
         self.attack(world.player)
 
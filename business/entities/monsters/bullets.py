@@ -2,13 +2,24 @@
 
 import math
 
+from business.entities.bullets import straight_bullet_arguments
 from business.entities.monsters.interfaces import IMonsterBullet
 from business.world.interfaces import IGameWorld
+from business.world.entity_store import StoreField
 from presentation.sprite import MonsterBulletSprite
+from business.world.type_registry import TYPE_REGISTRY
 
+@TYPE_REGISTRY.register('monster_bullet', saved_arguments=straight_bullet_arguments)
 class MonsterBullet(IMonsterBullet):
     """A bullet that moves towards a target direction."""
 
+    __slots__ = ('__dir_x_value', '__dir_y_value', '__damage_value', '__health_value', '__max_health')
+
+    __dir_x = StoreField('dir_x')
+    __dir_y = StoreField('dir_y')
+    __damage = StoreField('damage')
+    __health = StoreField('health')
+
     def __init__(self, src_x, src_y, dst_x, dst_y, speed, damage, health):
         super().__init__(src_x, src_y, speed, MonsterBulletSprite(src_x, src_y))
 
@@ -17,6 +28,14 @@ class MonsterBullet(IMonsterBullet):
         self.__max_health = health
         self.__health = self.__max_health 
 
+    def reset(self, src_x, src_y, dst_x, dst_y, speed, damage, health):
+        super().reset(src_x, src_y, speed)
+
+        self.__dir_x, self.__dir_y = self.__calculate_direction(dst_x - src_x, dst_y - src_y)
+        self.__damage = damage
+        self.__max_health = health
+        self.__health = self.__max_health
+
     def to_json(self):
         return {
             'pos_x': self.pos_x,
@@ -47,6 +66,9 @@ class MonsterBullet(IMonsterBullet):
         self.__health = max(0, self.__health - amount)
 
     def update(self, _: IGameWorld):
+        if self.in_store:
+            return
+
         self.move(self.__dir_x, self.__dir_y)
 
     @property
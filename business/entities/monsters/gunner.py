@@ -3,11 +3,14 @@
 from business.entities.interfaces import IDamageable, IHasPosition
 from business.entities.monsters.upgrades.bullet_factory import MonsterBulletFactory
 from business.world.interfaces import IGameWorld
+from business.world.entity_store import StoreField
 from presentation.sprite import GunMonsterSprite
 from business.handlers.clock import GameClockSingleton
 from business.entities.monsters.interfaces import IMonsterGun
+from business.world.type_registry import TYPE_REGISTRY
 import math
 
+@TYPE_REGISTRY.register('gun_monster', saved_arguments=lambda data: (data['pos_x'], data['pos_y'], data))
 class GunMonster(IMonsterGun):
     """A monster entity that shoots bullets."""
 
@@ -15,6 +18,10 @@ class GunMonster(IMonsterGun):
     BASE_HEALTH = 10
     BASE_ATTACK_RANGE = 20000
 
+    __slots__ = ('__health_value', '__multiplier', '__speed', '__max_health', '__attack_range', '__inventory')
+
+    __health = StoreField('health')
+
     def __init__(self, src_x: int, src_y: int, saved_data: dict | None = None):
         if GameClockSingleton().game_clock / 66000 < 1:
             self.__multiplier = 1
@@ -33,26 +40,49 @@ class GunMonster(IMonsterGun):
         if saved_data:
             self.__load_saved_data(saved_data)
 
+    def reset(self, src_x: int, src_y: int, saved_data: dict | None = None):
+        previous_multiplier = self.__multiplier
+        if GameClockSingleton().game_clock / 66000 < 1:
+            self.__multiplier = 1
+        else:
+            self.__multiplier = GameClockSingleton().game_clock / 50000
+
+        # The size of the sprite depends on the multiplier
+        if self.__multiplier != previous_multiplier:
+            self._sprite = GunMonsterSprite(0, 0, self.__multiplier)
+        # Like in the constructor, the sprite stays at the origin until the monster first moves
+        super().reset(src_x, src_y, GunMonster.BASE_SPEED * self.__multiplier, sprite_pos=(0, 0))
+
+        self.__health = self.max_health
+        for gun in self.__inventory:
+            gun.reset()
+
+        if saved_data:
+            self.__load_saved_data(saved_data)
+
     def __load_saved_data(self, saved_data: dict):
         """Loads saved data from the data file."""
         self._pos_x = saved_data['pos_x']
         self._pos_y = saved_data['pos_y']
         self.__health = saved_data['health']
 
-        for gun in saved_data['inventory']:
-            if 'MonsterBulletFactory' in gun:
-                for bullet_factory in self.__inventory:
-                    if isinstance(gun, MonsterBulletFactory):
-                        bullet_factory.load_cooldown(gun['attack_cooldown'])
+        for gun_tag, gun_data in saved_data['inventory'].items():
+            gun_type = TYPE_REGISTRY.type_of(gun_tag)
+            for gun in self.__inventory:
+                if type(gun) is gun_type:
+                    gun.load_cooldown(gun_data['attack_cooldown'])
 
     def to_json(self):
         return {
             'pos_x': self._pos_x,
             'pos_y': self._pos_y,
             'health': self.__health,
-            'inventory':{str(type(perk)): perk.to_json() for perk in self.__inventory}
+            **self.unstored_json()
         }
 
+    def unstored_json(self):
+        return {'inventory': {TYPE_REGISTRY.tag_of(perk): perk.to_json() for perk in self.__inventory}}
+
     def attack(self, target: IDamageable, world: IGameWorld):
         """Attacks the target."""
         if self._get_distance_to(target) < self.__attack_range:
@@ -94,6 +124,11 @@ class GunMonster(IMonsterGun):
         return dir_x, dir_y
 
     def update(self, world: IGameWorld):
+        # When it is in a store, the world has already made it attack and then moved it towards the player
+        if self.in_store:
+            self.sprite.update()
+            return
+
         direction_x, direction_y = self.__get_direction_towards_the_player(world)
         if (direction_x, direction_y) == (0, 0):
             return
@@ -8,6 +8,8 @@ from business.entities.interfaces import IBullet
 
 class IMonsterGun(MovableEntity, IMonster):
     """The monster interface that shoots bullets."""
+
+    __slots__ = ()
     
     @property
     @abstractmethod
@@ -28,4 +30,6 @@ class IMonsterGun(MovableEntity, IMonster):
         """
 
 class IMonsterBullet(MovableEntity, IBullet):
-    """Interface for monster's bullets."""
\ No newline at end of file
+    """Interface for monster's bullets."""
+
+    __slots__ = ()
\ No newline at end of file
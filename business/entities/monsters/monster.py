@@ -4,10 +4,13 @@ from business.entities.entity import MovableEntity
 from business.entities.interfaces import IDamageable, IHasPosition, IMonster
 from business.handlers.cooldown_handler import CooldownHandler
 from business.world.interfaces import IGameWorld
+from business.world.entity_store import StoreField
 from presentation.sprite import MonsterSprite
 from business.handlers.clock import GameClockSingleton
+from business.world.type_registry import TYPE_REGISTRY
 import math
 
+@TYPE_REGISTRY.register('monster', saved_arguments=lambda data: (data['pos_x'], data['pos_y'], data))
 class Monster(MovableEntity, IMonster):
     """A monster entity in the game."""
 
@@ -17,6 +20,12 @@ class Monster(MovableEntity, IMonster):
     BASE_ATTACK_RANGE = 50
     BASE_ATTACK_COOLDOWN = 1000
 
+    __slots__ = (
+        '__health_value', '__multiplier', '__speed', '__max_health', '__damage', '__attack_range', '__attack_cooldown',
+    )
+
+    __health = StoreField('health')
+
     def __init__(self, src_x: int, src_y: int, saved_data: dict | None = None):
         if GameClockSingleton().game_clock / 66000 < 1:
             self.__multiplier = 1
@@ -35,6 +44,25 @@ class Monster(MovableEntity, IMonster):
         if saved_data:
             self.__load_saved_data(saved_data)
 
+    def reset(self, src_x: int, src_y: int, saved_data: dict | None = None):
+        previous_multiplier = self.__multiplier
+        if GameClockSingleton().game_clock / 66000 < 1:
+            self.__multiplier = 1
+        else:
+            self.__multiplier = GameClockSingleton().game_clock / 50000
+
+        # The size of the sprite depends on the multiplier
+        if self.__multiplier != previous_multiplier:
+            self._sprite = MonsterSprite(0, 0, self.__multiplier)
+        # Like in the constructor, the sprite stays at the origin until the monster first moves
+        super().reset(src_x, src_y, Monster.BASE_SPEED * self.__multiplier, sprite_pos=(0, 0))
+
+        self.__health = self.max_health
+        self.__attack_cooldown.put_on_cooldown()
+
+        if saved_data:
+            self.__load_saved_data(saved_data)
+
     def __load_saved_data(self, saved_data: dict):
         """Loads the saved data from the data file."""
         self._pos_x = saved_data['pos_x']
@@ -47,9 +75,12 @@ class Monster(MovableEntity, IMonster):
             'pos_x': self._pos_x,
             'pos_y': self._pos_y,
             'health': self.__health,
-            'attack_cooldown': self.__attack_cooldown.last_action_time
+            **self.unstored_json()
         }
 
+    def unstored_json(self):
+        return {'attack_cooldown': self.__attack_cooldown.last_action_time}
+
     def attack(self, target: IDamageable):
         """Attacks the target."""
         if not self.__attack_cooldown.is_action_ready():
@@ -90,11 +121,13 @@ class Monster(MovableEntity, IMonster):
         return dir_x, dir_y
 
     def update(self, world: IGameWorld):
-        direction_x, direction_y = self.__get_direction_towards_the_player(world)
-        if (direction_x, direction_y) == (0, 0):
-            return
+        # When it is in a store, the world has already moved it towards the player
+        if not self.in_store:
+            direction_x, direction_y = self.__get_direction_towards_the_player(world)
+            if (direction_x, direction_y) == (0, 0):
+                return
 
-        self.move(direction_x, direction_y)
+            self.move(direction_x, direction_y)
 
         self.attack(world.player)
 
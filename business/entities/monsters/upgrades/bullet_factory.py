@@ -6,7 +6,10 @@ from business.entities.bullets import *
 from business.handlers.cooldown_handler import CooldownHandler
 from presentation.sprite import *
 from business.entities.monsters.bullets import MonsterBullet
+from business.world.entity_pool import ENTITY_POOLS
+from business.world.type_registry import TYPE_REGISTRY
 
+@TYPE_REGISTRY.register('monster_gun')
 class MonsterBulletFactory(IBulletFactory):
     """Monster bullet factory implementation."""
 
@@ -28,6 +31,10 @@ class MonsterBulletFactory(IBulletFactory):
 
             self.__cooldown_handler = CooldownHandler(self.cooldown)
 
+    def reset(self):
+        """Starts the cooldown again for a reused monster, whose multiplier can be other."""
+        self.__cooldown_handler.reset(self.cooldown)
+
     def load_cooldown(self, amount):
         """Loads the cooldown from the data."""
         self.__cooldown_handler.last_action_time = amount
@@ -41,19 +48,7 @@ class MonsterBulletFactory(IBulletFactory):
     @staticmethod
     def load_bullets(data, world: IGameWorld):
         """Loads the bullets from the data"""
-        for bullet_data in data:
-            pos_x = bullet_data['pos_x']
-            pos_y = bullet_data['pos_y']
-            dir_x = bullet_data['dir_x']
-            dir_y = bullet_data['dir_y']
-            damage = bullet_data['damage']
-            health = bullet_data['health']
-            speed = bullet_data['speed']
-
-            dst_x = pos_x + dir_x
-            dst_y = pos_y + dir_y
-
-            bullet = MonsterBullet(pos_x,pos_y,dst_x,dst_y,speed,damage,health)
+        for bullet in TYPE_REGISTRY.load_all(MonsterBullet, data):
             world.add_bullet(bullet)
 
     def create_bullet(self, world: IGameWorld):
@@ -63,7 +58,7 @@ class MonsterBulletFactory(IBulletFactory):
         """Shoots at player."""
         player = world.player
 
-        bullet = MonsterBullet(self.__monster.pos_x, self.__monster.pos_y, player.pos_x, player.pos_y, 
+        bullet = ENTITY_POOLS.acquire(MonsterBullet, self.__monster.pos_x, self.__monster.pos_y, player.pos_x, player.pos_y, 
         self.speed, self.damage, self.health)
         world.add_bullet(bullet)
 
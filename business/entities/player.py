@@ -1,6 +1,7 @@
 """Player entity module."""
 
 import pygame
+import settings
 
 from business.entities.entity import MovableEntity
 from business.entities.items.experience_gem import IExperienceGem
@@ -10,6 +11,7 @@ from business.upgrades.interfaces import IBulletFactory
 from business.handlers.cooldown_handler import CooldownHandler
 from business.upgrades.perks import *
 from business.world.interfaces import IGameWorld
+from business.world.type_registry import TYPE_REGISTRY
 from presentation.sprite import Sprite
 
 class Player(MovableEntity, IPlayer):
@@ -17,6 +19,12 @@ class Player(MovableEntity, IPlayer):
 
     The player is the main character of the game. It can move around the game world and shoot at monsters."""
 
+    __slots__ = (
+        '__experience', '__level', '__damage_multiplier', '__max_health', '__health', '__health_regen',
+        '__cooldown_multiplier', '__pick_range', '__health_regen_cooldown', '__speed_multiplier',
+        '__static_inventory', '__updatable_inventory', '__inventory_version',
+    )
+
     BASE_COOLDOWN_MULTIPLIER = 1.0
     BASE_DAMAGE_MULTIPLIER = 1.0
     BASE_HEALTH_REGEN_COOLDWON = 1000
@@ -78,6 +86,7 @@ class Player(MovableEntity, IPlayer):
 
         self.__static_inventory: list[IPerk] = []
         self.__updatable_inventory: list[IBulletFactory] = []
+        self.__inventory_version = 0
 
         if saved_data:
             self.__load_saved_data(saved_data)
@@ -102,8 +111,8 @@ class Player(MovableEntity, IPlayer):
             'level': self.__level,
             'health': self.__health,
             'health_regen_cooldown': self.__health_regen_cooldown.last_action_time,
-            'static':{str(type(perk)): perk.to_json() for perk in self.__static_inventory},
-            'updatable':{str(type(perk)): perk.to_json() for perk in self.__updatable_inventory}
+            'static':{TYPE_REGISTRY.tag_of(perk): perk.to_json() for perk in self.__static_inventory},
+            'updatable':{TYPE_REGISTRY.tag_of(perk): perk.to_json() for perk in self.__updatable_inventory}
         }
 
     @property
@@ -183,6 +192,10 @@ class Player(MovableEntity, IPlayer):
 
         return perks
 
+    @property
+    def inventory_version(self) -> int:
+        return self.__inventory_version
+
     @property
     def experience_progress(self) -> float:
         if self.__level == 1:
@@ -192,8 +205,8 @@ class Player(MovableEntity, IPlayer):
         return 0
 
     def move(self, direction_x: float, direction_y: float):
-        self._pos_x += direction_x * self._speed * self.speed_multiplier
-        self._pos_y += direction_y * self._speed * self.speed_multiplier
+        self._pos_x += direction_x * self._speed * self.speed_multiplier * settings.SPEED_SCALE
+        self._pos_y += direction_y * self._speed * self.speed_multiplier * settings.SPEED_SCALE
 
         self.sprite.update_pos(self._pos_x, self._pos_y)
 
@@ -244,6 +257,8 @@ class Player(MovableEntity, IPlayer):
         else:
             perk.upgrade()
 
+        self.__inventory_version += 1
+
     def update(self, world: IGameWorld):
         self.sprite.update()
 
@@ -6,9 +6,13 @@ from business.entities.entity import Entity
 class BoundariesHandler:
     """Class that handles things related to the world boundaries."""
 
+    MARGIN_X = 20
+    MARGIN_Y = 25
+
     @staticmethod
     def is_entity_within_world_boundaries(entity: Entity):
         """If the entity is inside the world."""
         return (
-            20 <= entity.pos_x <= settings.WORLD_WIDTH - 20 and 25 <= entity.pos_y <= settings.WORLD_HEIGHT - 25
-        )
\ No newline at end of file
+            BoundariesHandler.MARGIN_X <= entity.pos_x <= settings.WORLD_WIDTH - BoundariesHandler.MARGIN_X
+            and BoundariesHandler.MARGIN_Y <= entity.pos_y <= settings.WORLD_HEIGHT - BoundariesHandler.MARGIN_Y
+        )
@@ -26,5 +26,5 @@ class GameClockSingleton:
         return self.__game_clock
 
     def update(self):
-        """Updates every tick by the amount of ms determined by the FPS of the settings."""
-        self.__game_clock += 1000 / settings.FPS
\ No newline at end of file
+        """Updates every tick by the amount of ms determined by the simulation rate of the settings."""
+        self.__game_clock += 1000 / settings.SIMULATION_RATE
\ No newline at end of file
@@ -5,10 +5,16 @@ from typing import List
 from business.entities.interfaces import IBullet, IItem, IHasSprite, IMonster, IPlayer
 from business.world.interfaces import IGameWorld
 from business.entities.monsters.interfaces import IMonsterBullet
+from business.handlers.spatial_hash import SpatialHash
 
 class CollisionHandler:
     """Handles collisions between entities in the game world."""
 
+    # Below this amount of bullet-monster pairs building the grid costs more than testing every pair
+    BROAD_PHASE_MIN_PAIRS = 4096
+
+    __monsters_grid = SpatialHash()
+
     @staticmethod
     def __collides_with(an_entity: IHasSprite, another_entity: IHasSprite):
         return an_entity.sprite.rect.colliderect(another_entity.sprite.rect)
@@ -16,15 +22,51 @@ class CollisionHandler:
     @staticmethod
     def __handle_bullets(bullets: list[IBullet], monsters: list[IMonster], player: IPlayer):
         """Handles bullet collisions with the monsters and the player."""
+        if len(bullets) * len(monsters) < CollisionHandler.BROAD_PHASE_MIN_PAIRS:
+            CollisionHandler.__handle_bullets_brute_force(bullets, monsters, player)
+        else:
+            CollisionHandler.__handle_bullets_spatial_hash(bullets, monsters, player)
+
+    @staticmethod
+    def __handle_bullets_brute_force(bullets: list[IBullet], monsters: list[IMonster], player: IPlayer):
+        """Tests every bullet against every monster.
+
+        The rect of every monster is read once, since reading a rect can move it to the position of its monster.
+        """
+        monster_rects = [monster.sprite.rect for monster in monsters]
         for bullet in bullets:
-            for monster in monsters:
-                if CollisionHandler.__collides_with(bullet, monster) and not isinstance(bullet, IMonsterBullet):
+            bullet_rect = bullet.sprite.rect
+            for monster, monster_rect in zip(monsters, monster_rects):
+                if bullet_rect.colliderect(monster_rect) and not isinstance(bullet, IMonsterBullet):
                     monster.take_damage(bullet.damage_amount)
                     bullet.take_damage(bullet.damage_amount)
             if CollisionHandler.__collides_with(bullet, player) and isinstance(bullet, IMonsterBullet):
                 player.take_damage(bullet.damage_amount)
                 bullet.take_damage(bullet.damage_amount)
 
+    @staticmethod
+    def __handle_bullets_spatial_hash(bullets: list[IBullet], monsters: list[IMonster], player: IPlayer):
+        """Tests every bullet only against the monsters that share a grid cell with it.
+
+        The candidates keep the monsters order, so the hits are the same as the brute force ones.
+        """
+        grid = CollisionHandler.__monsters_grid
+        grid.rebuild(monsters)
+
+        for bullet in bullets:
+            if isinstance(bullet, IMonsterBullet):
+                if CollisionHandler.__collides_with(bullet, player):
+                    player.take_damage(bullet.damage_amount)
+                    bullet.take_damage(bullet.damage_amount)
+                continue
+
+            for monster in grid.query(bullet.sprite.rect):
+                if CollisionHandler.__collides_with(bullet, monster):
+                    monster.take_damage(bullet.damage_amount)
+                    bullet.take_damage(bullet.damage_amount)
+
+        grid.clear()
+
     @staticmethod
     def __handle_items(items: list[IItem], player: IPlayer, world: IGameWorld):
         """Handles items collisions with the player."""
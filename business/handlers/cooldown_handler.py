@@ -5,10 +5,17 @@ from business.handlers.clock import GameClockSingleton
 class CooldownHandler:
     """A handler for cooldowns."""
 
+    __slots__ = ('last_action_time', '__cooldown_time')
+
     def __init__(self, cooldown_time: int):
         self.last_action_time = GameClockSingleton().game_clock
         self.__cooldown_time = cooldown_time
 
+    def reset(self, cooldown_time: int):
+        """Starts the handler again with a cooldown, as if it was just created."""
+        self.last_action_time = GameClockSingleton().game_clock
+        self.__cooldown_time = cooldown_time
+
     def is_action_ready(self):
         """Check if the action is ready to be performed."""
         current_time = GameClockSingleton().game_clock
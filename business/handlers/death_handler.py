@@ -20,8 +20,18 @@ class DeathHandler:
         Args:
             world (IGameWorld): The game world to check for dead entities.
         """
-        
+        # The straight bullets kept in the projectile store are checked all at once
+        projectile_store = world.projectile_store
+        if projectile_store is not None:
+            for bullet in projectile_store.expired():
+                world.remove_bullet(bullet)
+        else:
+            projectile_store = ()
+
         for bullet in world.bullets:
+            if bullet in projectile_store:
+                continue
+
             if bullet.health <= 0:
                 world.remove_bullet(bullet)
             elif not BoundariesHandler.is_entity_within_world_boundaries(bullet):
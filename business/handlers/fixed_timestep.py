@@ -0,0 +1,58 @@
+"""Module that contains the FixedTimestep class."""
+
+import settings
+
+class FixedTimestep:
+    """Turns the real time of every frame into simulation steps that always last the same.
+
+    The time that doesn't fill a whole step is kept for the next frame. When a frame needs more
+    than `max_steps` steps the extra time is dropped, so a slow frame doesn't make the next ones
+    even slower trying to catch up.
+    """
+
+    STEP_MS = 1000 / settings.SIMULATION_RATE
+    MAX_STEPS = settings.MAX_CATCH_UP_STEPS
+
+    def __init__(self, step_ms: float = STEP_MS, max_steps: int = MAX_STEPS):
+        self.__step_ms = step_ms
+        self.__max_steps = max_steps
+        self.__accumulated_ms = 0.0
+        self.__dropped_ms = 0.0
+
+    @property
+    def step_ms(self) -> float:
+        """The game time every step simulates, in milliseconds."""
+        return self.__step_ms
+
+    @property
+    def alpha(self) -> float:
+        """How far the real time is between the last step and the next one, from 0 to 1."""
+        return self.__accumulated_ms / self.__step_ms
+
+    @property
+    def dropped_ms(self) -> float:
+        """The real time that was not simulated because of the cap on steps, in milliseconds."""
+        return self.__dropped_ms
+
+    def advance(self, elapsed_ms: float) -> int:
+        """Adds the real time of a frame and gets how many steps have to be simulated.
+
+        Args:
+            elapsed_ms (float): The real time since the last frame, in milliseconds.
+
+        Returns:
+            int: The amount of steps, at most `max_steps`.
+        """
+        self.__accumulated_ms += elapsed_ms
+        steps = int(self.__accumulated_ms // self.__step_ms)
+        self.__accumulated_ms -= steps * self.__step_ms
+
+        if steps > self.__max_steps:
+            self.__dropped_ms += (steps - self.__max_steps) * self.__step_ms
+            steps = self.__max_steps
+
+        return steps
+
+    def reset(self):
+        """Forgets the time that was not simulated yet, like while the game is paused."""
+        self.__accumulated_ms = 0.0
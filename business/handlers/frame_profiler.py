@@ -0,0 +1,175 @@
+"""Module that contains the FrameProfiler class."""
+
+import bisect
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Callable
+
+import settings
+
+class FrameProfiler:
+    """Times every stage of the game loop and keeps the last frames of each one.
+
+    Stages are measured with the `measure` context manager and the frame is closed with `end_frame`,
+    which also logs the stages that went over their budget. Every thread needs its own profiler,
+    but the times of a profiler can be read from any thread.
+    """
+
+    INPUT = 'input'
+    UPDATE = 'update'
+    COLLISIONS = 'collisions'
+    DEATHS = 'deaths'
+    CLOCK = 'clock'
+    SNAPSHOT = 'snapshot'
+    RENDER = 'render'
+
+    HISTORY_SIZE = 300
+    FRAME_BUDGET_MS = 1000 / settings.FPS
+    HISTOGRAM_EDGES_MS = (0.25, 0.5, 1, 2, 4, 8, 16, 33)
+
+    def __init__(self, history_size: int = HISTORY_SIZE, budget_ms: float = FRAME_BUDGET_MS, enabled: bool = True):
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__history_size = history_size
+        self.__budget_ms = budget_ms
+        self.__enabled = enabled
+        self.__history: dict[str, deque] = {}
+        self.__history_lock = threading.Lock()
+        self.__frame: dict[str, float] = {}
+        self.__frames = 0
+        self.overlay_visible = False
+
+    @property
+    def enabled(self) -> bool:
+        """If the stages are being measured."""
+        return self.__enabled
+
+    @property
+    def frames(self) -> int:
+        """The amount of closed frames."""
+        return self.__frames
+
+    @property
+    def stages(self) -> list[str]:
+        """The measured stages, in the order they were first seen."""
+        with self.__history_lock:
+            return list(self.__history)
+
+    @property
+    def budget_ms(self) -> float:
+        """The time a single stage can take before being logged."""
+        return self.__budget_ms
+
+    def toggle_overlay(self):
+        """Shows or hides the on-screen overlay."""
+        self.overlay_visible = not self.overlay_visible
+
+    def measure(self, stage: str):
+        """Measures the time spent inside the block as part of a stage of the current frame.
+
+        Args:
+            stage (str): The name of the stage.
+        """
+        if not self.__enabled:
+            return nullcontext()
+        return self.__measure(stage)
+
+    @contextmanager
+    def __measure(self, stage: str):
+        """Measures the block and adds it to the stage time."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.__frame[stage] = self.__frame.get(stage, 0) + elapsed_ms
+
+    def end_frame(self, entity_counts: Callable[[], dict] | None = None):
+        """Stores the times of the current frame and logs the stages over budget.
+
+        Args:
+            entity_counts (Callable[[], dict] | None): Gets the amount of entities in the world. It is only called
+                when there is something to log.
+        """
+        if not self.__enabled:
+            return
+
+        over_budget = {}
+        with self.__history_lock:
+            for stage, elapsed_ms in self.__frame.items():
+                if stage not in self.__history:
+                    self.__history[stage] = deque(maxlen=self.__history_size)
+                self.__history[stage].append(elapsed_ms)
+
+                if elapsed_ms > self.__budget_ms:
+                    over_budget[stage] = elapsed_ms
+
+        if over_budget:
+            counts = entity_counts() if entity_counts else {}
+            stages = ', '.join(f'{stage}={elapsed_ms:.2f}ms' for stage, elapsed_ms in over_budget.items())
+            self.__logger.warning("Frame %d over the %.2fms budget: %s, entities: %s",
+                                  self.__frames, self.__budget_ms, stages, counts)
+
+        self.__frame.clear()
+        self.__frames += 1
+
+    def last(self, stage: str) -> float:
+        """Gets the time of the stage in the last frame it was measured.
+
+        Args:
+            stage (str): The stage.
+
+        Returns:
+            float: The time in milliseconds.
+        """
+        with self.__history_lock:
+            history = self.__history.get(stage)
+            return history[-1] if history else 0.0
+
+    def __samples(self, stage: str) -> list[float]:
+        """Copies the recent times of a stage."""
+        with self.__history_lock:
+            return list(self.__history.get(stage, ()))
+
+    def stats(self, stage: str) -> dict:
+        """Gets the summary of the recent times of a stage.
+
+        Args:
+            stage (str): The stage.
+
+        Returns:
+            dict: The mean, max, p50, p95 and p99 in milliseconds, or an empty dict if it was never measured.
+        """
+        samples = self.__samples(stage)
+        if not samples:
+            return {}
+        if len(samples) == 1:
+            samples = samples * 2
+
+        cut_points = statistics.quantiles(samples, n=100, method='inclusive')
+        return {
+            'mean': statistics.fmean(samples),
+            'max': max(samples),
+            'p50': cut_points[49],
+            'p95': cut_points[94],
+            'p99': cut_points[98],
+        }
+
+    def histogram(self, stage: str) -> list[int]:
+        """Gets how many recent frames fall in each bucket of HISTOGRAM_EDGES_MS.
+
+        Args:
+            stage (str): The stage.
+
+        Returns:
+            list[int]: The count per bucket. The last bucket holds the times over the last edge.
+        """
+        counts = [0] * (len(self.HISTOGRAM_EDGES_MS) + 1)
+        for elapsed_ms in self.__samples(stage):
+            counts[bisect.bisect_left(self.HISTOGRAM_EDGES_MS, elapsed_ms)] += 1
+        return counts
+
+DISABLED_PROFILER = FrameProfiler(enabled=False)
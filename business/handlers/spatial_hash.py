@@ -0,0 +1,85 @@
+"""Module that contains the SpatialHash class."""
+
+from collections import defaultdict
+
+import pygame
+
+import settings
+from business.entities.interfaces import IHasSprite
+
+class SpatialHash:
+    """A uniform grid that buckets entities by the cells their sprite rect overlaps.
+
+    It is used as a broad phase so an entity is only tested against the entities that share a cell with it.
+    """
+
+    def __init__(self, cell_width: int = settings.TILE_WIDTH, cell_height: int = settings.TILE_HEIGHT):
+        self.__cell_width = cell_width
+        self.__cell_height = cell_height
+        self.__cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+        self.__entities: list[IHasSprite] = []
+
+    def __len__(self):
+        return len(self.__entities)
+
+    def __cell_range(self, rect: pygame.Rect):
+        """Gets the range of cell columns and rows covered by a rect."""
+        first_col = rect.left // self.__cell_width
+        last_col = rect.right // self.__cell_width
+        first_row = rect.top // self.__cell_height
+        last_row = rect.bottom // self.__cell_height
+
+        return range(first_col, last_col + 1), range(first_row, last_row + 1)
+
+    def clear(self):
+        """Removes every entity from the grid."""
+        self.__cells.clear()
+        self.__entities.clear()
+
+    def insert(self, entity: IHasSprite):
+        """Inserts an entity in every cell its sprite rect overlaps.
+
+        Args:
+            entity (IHasSprite): The entity.
+        """
+        index = len(self.__entities)
+        self.__entities.append(entity)
+
+        cols, rows = self.__cell_range(entity.sprite.rect)
+        for col in cols:
+            for row in rows:
+                self.__cells[(col, row)].append(index)
+
+    def rebuild(self, entities: list[IHasSprite]):
+        """Clears the grid and inserts all the given entities.
+
+        Args:
+            entities (list[IHasSprite]): The entities.
+        """
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def query(self, rect: pygame.Rect) -> list[IHasSprite]:
+        """Gets the entities that share at least one cell with the rect.
+
+        The result keeps the insertion order and has no duplicates, but it can
+        contain entities that don't actually collide with the rect.
+
+        Args:
+            rect (pygame.Rect): The rect to look around.
+
+        Returns:
+            list[IHasSprite]: The candidate entities.
+        """
+        cols, rows = self.__cell_range(rect)
+        cells = self.__cells
+
+        indexes = set()
+        for col in cols:
+            for row in rows:
+                cell = cells.get((col, row))
+                if cell:
+                    indexes.update(cell)
+
+        return [self.__entities[index] for index in sorted(indexes)]
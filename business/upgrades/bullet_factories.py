@@ -4,8 +4,12 @@ from business.entities.interfaces import IPlayer, IUpdatable
 from business.upgrades.interfaces import IBulletFactory
 from business.entities.bullets import *
 from business.handlers.cooldown_handler import CooldownHandler
+from business.world.entity_pool import ENTITY_POOLS
+from business.world.monster_index import MonsterIndex
 from presentation.sprite import BulletSprite, TurretBulletSprite, FollowingBulletSprite
+from business.world.type_registry import TYPE_REGISTRY
 
+@TYPE_REGISTRY.register('normal_gun')
 class NormalBulletFactory(IBulletFactory):
     """Normal bullet factory implementation."""
     BASE_LEVEL_STATS = {
@@ -59,19 +63,7 @@ class NormalBulletFactory(IBulletFactory):
 
     @staticmethod
     def load_bullets(data, world: IGameWorld):
-        for bullet_data in data:
-            pos_x = bullet_data['pos_x']
-            pos_y = bullet_data['pos_y']
-            dir_x = bullet_data['dir_x']
-            dir_y = bullet_data['dir_y']
-            damage = bullet_data['damage']
-            health = bullet_data['health']
-            speed = bullet_data['speed']
-
-            dst_x = pos_x + dir_x
-            dst_y = pos_y + dir_y
-
-            bullet = NormalBullet(pos_x,pos_y,dst_x,dst_y,speed,damage,health)
+        for bullet in TYPE_REGISTRY.load_all(NormalBullet, data):
             world.add_bullet(bullet)
 
     def create_bullet(self, world: IGameWorld):
@@ -121,19 +113,13 @@ class NormalBulletFactory(IBulletFactory):
         return "DESBLOQUEAR ARMA COMUN"
 
     def __shoot_at_nearest_enemy(self, world: IGameWorld):
-        if not world.monsters:
-            return  # No monsters to shoot at
-
         # Find the nearest monster
-        monster = min(
-            world.monsters,
-            key=lambda monster: (
-                (monster.pos_x - world.player.pos_x) ** 2 + (monster.pos_y - world.player.pos_y) ** 2
-            ),
-        )
+        monster = MonsterIndex.find_nearest(world, world.player.pos_x, world.player.pos_y)
+        if monster is None:
+            return  # No monsters to shoot at
 
         # Create a bullet towards the nearest monster
-        bullet = NormalBullet(world.player.pos_x, world.player.pos_y, monster.pos_x, monster.pos_y, 
+        bullet = ENTITY_POOLS.acquire(NormalBullet, world.player.pos_x, world.player.pos_y, monster.pos_x, monster.pos_y, 
         self.speed, self.damage, self.health)
         world.add_bullet(bullet)
 
@@ -141,6 +127,7 @@ class NormalBulletFactory(IBulletFactory):
         # Not possible to be implemented
         pass
 
+@TYPE_REGISTRY.register('turret_gun')
 class TurretBulletFactory(IBulletFactory, IUpdatable):
     """Turret bullet factory implementation."""
     BASE_LEVEL_STATS = {
@@ -194,19 +181,7 @@ class TurretBulletFactory(IBulletFactory, IUpdatable):
 
     @staticmethod
     def load_bullets(data, world: IGameWorld):
-        for bullet_data in data:
-            pos_x = bullet_data['pos_x']
-            pos_y = bullet_data['pos_y']
-            dir_x = bullet_data['dir_x']
-            dir_y = bullet_data['dir_y']
-            damage = bullet_data['damage']
-            health = bullet_data['health']
-            speed = bullet_data['speed']
-
-            dst_x = pos_x + dir_x
-            dst_y = pos_y + dir_y
-
-            bullet = TurretBullet(pos_x,pos_y,dst_x,dst_y,speed,damage,health)
+        for bullet in TYPE_REGISTRY.load_all(TurretBullet, data):
             world.add_bullet(bullet)
 
     def create_bullet(self, world: IGameWorld):
@@ -256,20 +231,14 @@ class TurretBulletFactory(IBulletFactory, IUpdatable):
         return 'DESBLOQUEAR TORRETA'
 
     def __shoot_at_nearest_enemy(self, world: IGameWorld):
-        if not world.monsters:
-            return  # No monsters to shoot at
-
         # Find the nearest monster
-        monster = min(
-            world.monsters,
-            key=lambda monster: (
-                (monster.pos_x - world.player.pos_x) ** 2 + (monster.pos_y - world.player.pos_y) ** 2
-            ),
-        )
+        monster = MonsterIndex.find_nearest(world, world.player.pos_x, world.player.pos_y)
+        if monster is None:
+            return  # No monsters to shoot at
 
         # Create a bullet towards the nearest monster
-        bullet = TurretBullet(
-            world.player.pos_x, world.player.pos_y, monster.pos_x, monster.pos_y, self.speed, self.damage, self.health)
+        bullet = ENTITY_POOLS.acquire(
+            TurretBullet, world.player.pos_x, world.player.pos_y, monster.pos_x, monster.pos_y, self.speed, self.damage, self.health)
         
         world.add_bullet(bullet)
 
@@ -277,6 +246,7 @@ class TurretBulletFactory(IBulletFactory, IUpdatable):
         # Not possible to be implemented
         pass
 
+@TYPE_REGISTRY.register('following_gun')
 class FollowingBulletFactory(IBulletFactory, IUpdatable):
     """Following bullet factory implementation."""
     BASE_LEVEL_STATS = {
@@ -330,15 +300,7 @@ class FollowingBulletFactory(IBulletFactory, IUpdatable):
 
     @staticmethod
     def load_bullets(data, world: IGameWorld):
-        for bullet_data in data:
-            pos_x = bullet_data['pos_x']
-            pos_y = bullet_data['pos_y']
-            damage = bullet_data['damage']
-            health = bullet_data['health']
-            speed = bullet_data['speed']
-            cooldown = bullet_data['despawn_cooldown']
-
-            bullet = FollowingBullet(pos_x, pos_y, None, speed, damage, health, cooldown)
+        for bullet in TYPE_REGISTRY.load_all(FollowingBullet, data):
             world.add_bullet(bullet)
 
     def create_bullet(self, world: IGameWorld):
@@ -388,18 +350,13 @@ class FollowingBulletFactory(IBulletFactory, IUpdatable):
         return 'DESBLOQUEAR ARMA TELEDERIGIDA'
 
     def __shoot_at_nearest_enemy(self, world: IGameWorld):
-        if not world.monsters:
+        monster = MonsterIndex.find_nearest(world, world.player.pos_x, world.player.pos_y)
+        if monster is None:
             return
 
-        monster = min(
-            world.monsters,
-            key=lambda monster: (
-                (monster.pos_x - world.player.pos_x) ** 2 + (monster.pos_y - world.player.pos_y) ** 2
-            ),
-        )   
-
         try:
-            bullet = FollowingBullet(world.player.pos_x, world.player.pos_y, monster, self.speed, self.damage, self.health)
+            bullet = ENTITY_POOLS.acquire(
+                FollowingBullet, world.player.pos_x, world.player.pos_y, monster, self.speed, self.damage, self.health)
         except Exception as error:
             print(error)
 
@@ -3,7 +3,9 @@
 from business.upgrades.interfaces import IPerk
 from business.entities.interfaces import IPlayer
 from presentation.sprite import RegenerationPerkSprite, MaxHealthPerkSprite, DamageMultiplierPerkSprite, SpeedPerkSprite
+from business.world.type_registry import TYPE_REGISTRY
 
+@TYPE_REGISTRY.register('regeneration')
 class RegenerationPerk(IPerk):
     """Regeneration perk implementation."""
 
@@ -51,6 +53,7 @@ class RegenerationPerk(IPerk):
         
         return f'AUMENTO DE REGENERACIÓN: {self.upgrade_amount()}'
 
+@TYPE_REGISTRY.register('max_health')
 class MaxHealthPerk(IPerk):
     """Max health perk implementation."""
 
@@ -98,6 +101,7 @@ class MaxHealthPerk(IPerk):
         
         return f'AUMENTO DE VIDA MÁXIMA: {self.upgrade_amount()}'
 
+@TYPE_REGISTRY.register('damage_multiplier')
 class DamageMultiplierPerk(IPerk):
     """Damage multiplier perk implemetation"""
 
@@ -145,6 +149,7 @@ class DamageMultiplierPerk(IPerk):
         
         return f'MULTIPLICACION DE DAÑO: {1 + self.upgrade_amount()}'
 
+@TYPE_REGISTRY.register('speed')
 class SpeedPerk(IPerk):
     """Speed perk implemetation"""
 
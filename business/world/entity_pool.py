@@ -0,0 +1,178 @@
+"""Module with the pools that reuse the entities removed from the world."""
+
+import settings
+
+class EntityPool:
+    """Keeps removed entities of a type to reuse them instead of creating new ones.
+
+    The entity type must have a `reset` method that takes the same arguments as its constructor
+    and leaves the entity as if it was just created. Entities are only reset when they are
+    acquired again, so a released entity keeps its last state until then.
+    """
+
+    CAPACITY = 1024
+
+    def __init__(self, entity_type: type, capacity: int = CAPACITY):
+        self.__entity_type = entity_type
+        self.__capacity = capacity
+        self.__free: list = []
+        self.__free_ids: set[int] = set()
+        self.__hits = 0
+        self.__allocations = 0
+        self.__releases = 0
+
+    def __len__(self):
+        return len(self.__free)
+
+    @property
+    def entity_type(self) -> type:
+        """The type of the pooled entities."""
+        return self.__entity_type
+
+    @property
+    def hits(self) -> int:
+        """The amount of acquired entities that were reused."""
+        return self.__hits
+
+    @property
+    def allocations(self) -> int:
+        """The amount of acquired entities that had to be created."""
+        return self.__allocations
+
+    @property
+    def releases(self) -> int:
+        """The amount of entities kept to be reused."""
+        return self.__releases
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of acquired entities that were reused."""
+        acquired = self.__hits + self.__allocations
+        return self.__hits / acquired if acquired else 0.0
+
+    def acquire(self, *args, **kwargs):
+        """Gets a free entity reset with the arguments, or a new one if there is none.
+
+        Returns:
+            The entity.
+        """
+        if self.__free:
+            entity = self.__free.pop()
+            self.__free_ids.discard(id(entity))
+            entity.reset(*args, **kwargs)
+            self.__hits += 1
+            return entity
+
+        self.__allocations += 1
+        return self.__entity_type(*args, **kwargs)
+
+    def release(self, entity):
+        """Keeps an entity that is no longer used, unless the pool is full.
+
+        Args:
+            entity: The entity, which must not be used again until it is acquired.
+        """
+        if len(self.__free) >= self.__capacity or id(entity) in self.__free_ids:
+            return
+
+        self.__free.append(entity)
+        self.__free_ids.add(id(entity))
+        self.__releases += 1
+
+    def clear(self):
+        """Forgets the free entities."""
+        self.__free.clear()
+        self.__free_ids.clear()
+
+class EntityPools:
+    """The pools of every entity type, created the first time an entity of the type is acquired.
+
+    The released entities only go into their pools when the tick ends, so an entity removed
+    during a tick is never reset while the rest of that tick, the frame drawn after it or its
+    save can still see it.
+
+    They can be turned off with `settings.ENTITY_POOLS`, and then entities are always created.
+    """
+
+    def __init__(self):
+        self.__pools: dict[type, EntityPool] = {}
+        self.__released: list = []
+        self.__tick_start = (0, 0)
+        self.__last_tick = {'hits': 0, 'allocations': 0}
+
+    def __iter__(self):
+        return iter(self.__pools.values())
+
+    @property
+    def last_tick(self) -> dict:
+        """The amount of reused and created entities during the last tick."""
+        return self.__last_tick
+
+    def acquire(self, entity_type: type, *args, **kwargs):
+        """Gets an entity of a type, reusing a released one if possible.
+
+        Args:
+            entity_type (type): The entity type.
+            *args: The arguments of the constructor of the type.
+
+        Returns:
+            The entity.
+        """
+        if not settings.ENTITY_POOLS:
+            return entity_type(*args, **kwargs)
+
+        pool = self.__pools.get(entity_type)
+        if pool is None:
+            pool = EntityPool(entity_type)
+            self.__pools[entity_type] = pool
+        return pool.acquire(*args, **kwargs)
+
+    def release(self, entity):
+        """Keeps an entity removed from the world to be reused when the tick ends, if there is a pool for its type.
+
+        Args:
+            entity: The entity.
+        """
+        if settings.ENTITY_POOLS:
+            self.__released.append(entity)
+
+    def end_tick(self):
+        """Gives the entities released during the tick that just finished to their pools and closes its counts."""
+        for entity in self.__released:
+            pool = self.__pools.get(type(entity))
+            if pool is not None:
+                pool.release(entity)
+        self.__released.clear()
+
+        hits = sum(pool.hits for pool in self.__pools.values())
+        allocations = sum(pool.allocations for pool in self.__pools.values())
+        start_hits, start_allocations = self.__tick_start
+
+        self.__last_tick = {'hits': hits - start_hits, 'allocations': allocations - start_allocations}
+        self.__tick_start = (hits, allocations)
+
+    def stats(self) -> dict[str, dict]:
+        """Gets the counts of every pool by the name of its type.
+
+        Returns:
+            dict[str, dict]: The hits, allocations, releases, free entities and hit rate of every pool.
+        """
+        return {
+            pool.entity_type.__name__: {
+                'hits': pool.hits,
+                'allocations': pool.allocations,
+                'releases': pool.releases,
+                'free': len(pool),
+                'hit_rate': pool.hit_rate,
+            }
+            for pool in self.__pools.values()
+        }
+
+    def clear(self):
+        """Forgets every pool and its counts."""
+        self.__pools.clear()
+        self.__released.clear()
+        self.__tick_start = (0, 0)
+        self.__last_tick = {'hits': 0, 'allocations': 0}
+
+ENTITY_POOLS = EntityPools()
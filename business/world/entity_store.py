@@ -0,0 +1,294 @@
+"""Module with the base of the array-backed entity stores.
+
+A store keeps some attributes of its entities in NumPy columns so they can be updated all at once.
+NumPy is optional: without it no entity is ever attached and they keep their attributes as usual.
+"""
+
+import itertools
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class StoreField:
+    """An entity attribute that lives in a column of its store while the entity is attached to one.
+
+    While the entity is detached the value is kept in the entity itself, so the attribute
+    works the same with or without a store. It is kept in the `<attribute>_value` slot,
+    which the class declares next to the field, and the entity must have the `_store` and
+    `_store_slot` attributes.
+    """
+
+    def __init__(self, column: str):
+        self.__column = column
+        self.__storage = None
+
+    def __set_name__(self, owner, name):
+        self.__storage = f'{name}_value'
+
+    @property
+    def column(self) -> str:
+        """The store column of the attribute."""
+        return self.__column
+
+    def detached_value(self, entity):
+        """Gets the value kept in the entity itself."""
+        return getattr(entity, self.__storage)
+
+    def set_detached_value(self, entity, value):
+        """Sets the value kept in the entity itself."""
+        setattr(entity, self.__storage, value)
+
+    def __get__(self, entity, owner=None):
+        if entity is None:
+            return self
+
+        store = entity._store
+        if store is None:
+            return getattr(entity, self.__storage)
+        return store.value(self.__column, entity._store_slot)
+
+    def __set__(self, entity, value):
+        store = entity._store
+        if store is None:
+            setattr(entity, self.__storage, value)
+        else:
+            store.set_value(self.__column, entity._store_slot, value)
+
+
+class StoreSnapshot:
+    """Copy of the saved columns of a store, which can be read from another thread."""
+
+    def __init__(self, columns: dict, integers: dict[str, list[bool]]):
+        self.__columns = columns
+        self.__integers = integers
+
+    def rows(self) -> list[dict]:
+        """Gets the saved values of every slot, with the ints set as ints back as ints."""
+        columns = []
+        for column, values in self.__columns.items():
+            values = values.tolist()
+            integers = self.__integers.get(column)
+            if integers is not None:
+                values = [int(value) if is_int else value for value, is_int in zip(values, integers)]
+            columns.append(values)
+
+        return [dict(zip(self.__columns, row)) for row in zip(*columns)]
+
+
+class EntityStore:
+    """Structure of arrays that holds some attributes of many entities.
+
+    Every attached entity has a slot, and slots are always packed at the start of the columns,
+    so the vectorized operations work over `[:len(store)]`.
+
+    The sprites of the attached entities follow the store, so the operations that move the
+    entities only change the version of the store and every rect is moved the next time it is read.
+
+    The columns are floats, but the values of the integer columns that were set as ints are read
+    back as ints, so they are saved the same as in a detached entity.
+    """
+
+    COLUMNS: tuple[str, ...] = ()
+    # The vectorized operations must not change these columns, or their ints would be read truncated
+    INTEGER_COLUMNS: tuple[str, ...] = ()
+    # The columns that the entities save in their JSON, with the same keys and in the same order
+    SAVED_COLUMNS: tuple[str, ...] = ()
+    # The columns that the sprites follow, which every store must have
+    POSITION_COLUMNS = ('pos_x', 'pos_y')
+    INITIAL_CAPACITY = 64
+
+    # Shared by every store, so two stores never have the same version
+    __versions = itertools.count()
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.version = next(EntityStore.__versions)
+        self.__capacity = capacity
+        self.__entities: list = []
+        self.__fields_by_type: dict[type, dict[str, StoreField] | None] = {}
+        self.columns = {column: np.zeros(capacity) for column in self.COLUMNS}
+        # If the value of every slot was set as an int, for every integer column
+        self.__integers: dict[str, list[bool]] = {column: [] for column in self.INTEGER_COLUMNS}
+        # The positions as sprite centers, converted at once for the version they were taken at
+        self.__centers: tuple[list[int], list[int]] = ([], [])
+        self.__centers_version = self.version
+
+    @staticmethod
+    def available() -> bool:
+        """If NumPy is installed, so the stores can be used."""
+        return np is not None
+
+    def __len__(self):
+        return len(self.__entities)
+
+    def __contains__(self, entity):
+        return getattr(entity, '_store', None) is self
+
+    @property
+    def entities(self) -> list:
+        """The attached entities, in slot order."""
+        return self.__entities
+
+    def __fields(self, entity_type: type) -> dict[str, StoreField] | None:
+        """Gets the field of every column for an entity type, or None if it doesn't have all of them."""
+        if entity_type not in self.__fields_by_type:
+            fields = {}
+            for klass in reversed(entity_type.__mro__):
+                for attribute in vars(klass).values():
+                    if isinstance(attribute, StoreField):
+                        fields[attribute.column] = attribute
+
+            has_all_columns = all(column in fields for column in self.COLUMNS)
+            self.__fields_by_type[entity_type] = fields if has_all_columns else None
+
+        return self.__fields_by_type[entity_type]
+
+    def value(self, column: str, slot: int) -> float:
+        """Gets a value of a column, as an int if it was set as one.
+
+        Args:
+            column (str): The column.
+            slot (int): The slot of the entity.
+        """
+        value = self.columns[column][slot].item()
+        integers = self.__integers.get(column)
+        if integers is not None and integers[slot]:
+            return int(value)
+        return value
+
+    def set_value(self, column: str, slot: int, value: float):
+        """Sets a value of a column.
+
+        Args:
+            column (str): The column.
+            slot (int): The slot of the entity.
+            value (float): The value.
+        """
+        self.columns[column][slot] = value
+        integers = self.__integers.get(column)
+        if integers is not None:
+            integers[slot] = isinstance(value, int)
+        if column in EntityStore.POSITION_COLUMNS:
+            self._moved()
+
+    def _moved(self):
+        """Changes the version after the positions were changed in the columns."""
+        self.version = next(EntityStore.__versions)
+
+    def center_of(self, entity) -> tuple[int, int]:
+        """Gets the position of an attached entity as the center of its sprite.
+
+        The positions of all the entities are converted at once the first time one is asked for after they moved.
+
+        Args:
+            entity: The entity.
+        """
+        if self.__centers_version != self.version:
+            size = len(self.__entities)
+            self.__centers = (
+                self.columns['pos_x'][:size].astype(int).tolist(),
+                self.columns['pos_y'][:size].astype(int).tolist(),
+            )
+            self.__centers_version = self.version
+
+        slot = entity._store_slot
+        return self.__centers[0][slot], self.__centers[1][slot]
+
+    def slot_of(self, entity) -> int | None:
+        """Gets the slot of an entity, or None if it is not attached to the store.
+
+        Args:
+            entity: The entity.
+        """
+        return entity._store_slot if getattr(entity, '_store', None) is self else None
+
+    def snapshot(self) -> StoreSnapshot:
+        """Copies the saved columns of every slot at once, so they can be read while the store changes."""
+        size = len(self.__entities)
+        return StoreSnapshot(
+            {column: self.columns[column][:size].copy() for column in self.SAVED_COLUMNS},
+            {column: list(integers) for column, integers in self.__integers.items() if column in self.SAVED_COLUMNS},
+        )
+
+    def supports(self, entity) -> bool:
+        """If the entity has a field for every column of the store.
+
+        Args:
+            entity: The entity.
+        """
+        return self.__fields(type(entity)) is not None
+
+    def __grow(self):
+        """Doubles the capacity of every column."""
+        self.__capacity *= 2
+        for column, values in self.columns.items():
+            grown = np.zeros(self.__capacity)
+            grown[:len(values)] = values
+            self.columns[column] = grown
+
+    def attach(self, entity) -> bool:
+        """Moves the attributes of the entity into the store.
+
+        Args:
+            entity: The entity.
+
+        Returns:
+            bool: If the entity was attached, which only happens when the store supports it.
+        """
+        fields = self.__fields(type(entity))
+        if fields is None or entity._store is not None:
+            return False
+
+        slot = len(self.__entities)
+        if slot == self.__capacity:
+            self.__grow()
+
+        for column in self.COLUMNS:
+            value = fields[column].detached_value(entity)
+            self.columns[column][slot] = value
+            integers = self.__integers.get(column)
+            if integers is not None:
+                integers.append(isinstance(value, int))
+
+        self.__entities.append(entity)
+        entity._store = self
+        entity._store_slot = slot
+        for centers, column in zip(self.__centers, EntityStore.POSITION_COLUMNS):
+            centers.append(int(self.columns[column][slot]))
+        entity.sprite.follow(self, entity)
+        return True
+
+    def detach(self, entity):
+        """Moves the attributes of the entity back into it and frees its slot.
+
+        The last entity takes the freed slot, so the slots stay packed.
+
+        Args:
+            entity: The entity.
+        """
+        if getattr(entity, '_store', None) is not self:
+            return
+
+        entity.sprite.follow(None)
+
+        fields = self.__fields(type(entity))
+        slot = entity._store_slot
+        for column in self.COLUMNS:
+            fields[column].set_detached_value(entity, self.value(column, slot))
+
+        entity._store = None
+        entity._store_slot = None
+
+        last_slot = len(self.__entities) - 1
+        last_entity = self.__entities.pop()
+        if slot != last_slot:
+            for values in self.columns.values():
+                values[slot] = values[last_slot]
+            for slot_values in (*self.__centers, *self.__integers.values()):
+                slot_values[slot] = slot_values[last_slot]
+            self.__entities[slot] = last_entity
+            last_entity._store_slot = slot
+        for slot_values in (*self.__centers, *self.__integers.values()):
+            slot_values.pop()
@@ -1,7 +1,12 @@
 """This module contains the implementation of the game world."""
 
+import gc
 import random
+from collections.abc import Callable, Sequence
+
+import settings
 from business.entities.interfaces import IBullet, IMonster, IPlayer, IItem
+from business.entities.monsters.interfaces import IMonsterGun
 from business.world.interfaces import IGameWorld, IMonsterSpawner, ITileMap
 from business.upgrades.interfaces import *
 from business.upgrades.perks import *
@@ -11,20 +16,34 @@ from business.handlers.boundaries_handler import BoundariesHandler
 from business.exceptions import * 
 from presentation.interfaces import IDisplay
 from business.entities.items.experience_gem import *
-from business.entities.monsters.upgrades.bullet_factory import MonsterBulletFactory
 from business.entities.items.item_factory import ItemFactory
+from business.world.monster_store import MonsterStore
+from business.world.projectile_store import ProjectileStore
+from business.world.monster_index import MonsterIndex
+from business.world.slot_map import SlotMap, EntityHandle
+from business.world.entity_pool import ENTITY_POOLS
+from business.world.type_registry import TYPE_REGISTRY
 
 class GameWorld(IGameWorld):
     """Represents the game world."""
 
     def __init__(self, spawner: IMonsterSpawner, tile_map: ITileMap, player: IPlayer, display: IDisplay, saved_data: dict | None = None):
         self.__player: IPlayer = player
-        self.__monsters: list[IMonster] = []
-        self.__bullets: list[IBullet] = []
-        self.__items: list[IItem] = []
+        self.__monsters = SlotMap('monsters')
+        self.__bullets = SlotMap('bullets')
+        self.__items = SlotMap('items')
         self.__in_upgrade = 0
         self.__game = None
         self.__display = display
+        self.__monster_store = MonsterStore() if settings.MONSTER_STORE and MonsterStore.available() else None
+        self.__monster_index = MonsterIndex(self.__monsters.entities)
+        self.__projectile_store = ProjectileStore() if settings.PROJECTILE_STORE and ProjectileStore.available() else None
+
+        # Additions and removals wait until flush_changes, so the entities can be iterated without copies
+        self.__pending_changes: list[tuple[Callable, object]] = []
+        self.__pending_presence: dict[tuple[str, int], bool] = {}
+        self.__views_served = 0
+        self.__copies_saved = 0
 
         self.PERKS_U = []
         self.PERKS_S = []
@@ -42,12 +61,25 @@ class GameWorld(IGameWorld):
         else:
             self.__initialize_perks()
 
-    def __load_saved_data(self, saved_data: dict):
-        """Loads saved data from the data file."""
-        self.monster_spawner.load_saved_data(self, saved_data)
+        self.flush_changes()
 
-        self.__load_bullets(saved_data)
-        self.__load_items(saved_data)
+    def __load_saved_data(self, saved_data: dict):
+        """Loads saved data from the data file.
+
+        The garbage collector is paused meanwhile. Every loaded entity is kept, so collecting
+        while they are created would only walk over them again and again.
+        """
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            self.monster_spawner.load_saved_data(self, saved_data)
+
+            self.__load_bullets(saved_data)
+            self.__load_items(saved_data)
+            self.flush_changes()
+        finally:
+            if collecting:
+                gc.enable()
 
     def __initialize_perks(self, saved_data: dict | None = None):
         """Initialize perk's instances."""
@@ -63,39 +95,34 @@ class GameWorld(IGameWorld):
             player = saved_data.get('player')
 
             # Load static perks
-            for perk_type in player['static']:
-                for perk in self.PERKS_S:
-                    if perk_type == str(type(perk)):
-                        for _ in range(player['static'][perk_type]['level']):
-                            self.give_perk_to_player(perk)
+            static_perks = {type(perk): perk for perk in self.PERKS_S}
+            for perk_tag, perk_data in player['static'].items():
+                perk = static_perks.get(TYPE_REGISTRY.type_of(perk_tag))
+                if perk is not None:
+                    for _ in range(perk_data['level']):
+                        self.give_perk_to_player(perk)
 
             # Load updatable perks
-            for perk_type in player['updatable']:
-                for perk in self.PERKS_U:
-                    if perk_type == str(type(perk)):
-                        for _ in range(player['updatable'][perk_type]['level']):
-                            self.give_perk_to_player(perk)
-                            perk.load_cooldown(player['updatable'][perk_type]['attack_cooldown'])
+            updatable_perks = {type(perk): perk for perk in self.PERKS_U}
+            for perk_tag, perk_data in player['updatable'].items():
+                perk = updatable_perks.get(TYPE_REGISTRY.type_of(perk_tag))
+                if perk is not None:
+                    for _ in range(perk_data['level']):
+                        self.give_perk_to_player(perk)
+                        perk.load_cooldown(perk_data['attack_cooldown'])
         else:
             # NormalBulletFactory - INITIAL PERK
             self.__player.handle_perk(self.PERKS_U[0])
 
     def __load_bullets(self, saved_data: dict):
-        """Loads the bullets giving the saved data to the bullet factories."""
+        """Loads the bullets of every saved type."""
         saved_data = saved_data.get('bullets')
 
-        for bullet_type in saved_data:
-            if 'NormalBullet' in bullet_type:
-                NormalBulletFactory(self.__player).load_bullets(saved_data[bullet_type], self)
-
-            if 'Turret' in bullet_type:
-                TurretBulletFactory(self.__player).load_bullets(saved_data[bullet_type], self)
-
-            if 'FollowingBullet' in bullet_type:
-                FollowingBulletFactory(self.__player).load_bullets(saved_data[bullet_type], self)
-
-            if 'MonsterBullet' in bullet_type:
-                MonsterBulletFactory().load_bullets(saved_data[bullet_type], self)
+        for bullet_tag, bullets_data in saved_data.items():
+            bullet_type = TYPE_REGISTRY.type_of(bullet_tag)
+            # Bullets of types that no longer exist are left out
+            if bullet_type is not None:
+                self.add_bullets(TYPE_REGISTRY.load_all(bullet_type, bullets_data))
 
     def __load_items(self, saved_data: dict):
         """Loads the items from the saved data."""
@@ -118,16 +145,39 @@ class GameWorld(IGameWorld):
         self.__player.handle_perk(perk)
 
     def update(self):
+        self.__copies_saved = self.__views_served
+        self.__views_served = 0
+        ENTITY_POOLS.end_tick()
+
+        self.__monster_index.mark_dirty()
+
         self.player.update(self)
 
         self.monster_spawner.update(self)
 
+        # The entities added or removed by the previous stage are applied before each loop, so
+        # they take part in it like when the loops went through copies of the lists
+        self.flush_changes()
+        if self.__projectile_store is not None:
+            self.__projectile_store.integrate()
+
         for bullet in self.bullets:
             bullet.update(self)
 
+        self.flush_changes()
+        if self.__monster_store is not None:
+            # The monsters with guns shoot before they move, so they do it before the store moves them
+            for monster in self.monsters:
+                if isinstance(monster, IMonsterGun) and monster.in_store:
+                    monster.attack(self.__player, self)
+            self.__monster_store.step_towards(self.__player.pos_x, self.__player.pos_y)
+
         for monster in self.monsters:
             monster.update(self)
 
+        self.__monster_index.mark_dirty()
+
+        self.flush_changes()
         for item in self.items:
             item.update(self)
 
@@ -136,24 +186,168 @@ class GameWorld(IGameWorld):
 
     def add_monster(self, monster: IMonster):
         if BoundariesHandler.is_entity_within_world_boundaries(monster):
-            self.__monsters.append(monster)
+            self.__queue_change(self.__monsters, monster, True, self.__insert_monster)
         else:
             raise EntityOutOfBounds
 
     def remove_monster(self, monster: IMonster):
-        self.__monsters.remove(monster)
+        self.__queue_change(self.__monsters, monster, False, self.__delete_monster)
 
     def add_item(self, item):
-        self.__items.append(item)
+        self.__queue_change(self.__items, item, True, self.__items.add)
 
     def remove_item(self, item):
-        self.__items.remove(item)
+        self.__queue_change(self.__items, item, False, self.__delete_item)
 
     def add_bullet(self, bullet: IBullet):
-        self.__bullets.append(bullet)
+        self.__queue_change(self.__bullets, bullet, True, self.__insert_bullet)
 
     def remove_bullet(self, bullet: IBullet):
+        self.__queue_change(self.__bullets, bullet, False, self.__delete_bullet)
+
+    def add_monsters(self, monsters: list[IMonster]):
+        for monster in monsters:
+            if not BoundariesHandler.is_entity_within_world_boundaries(monster):
+                raise EntityOutOfBounds
+        self.__queue_additions(self.__monsters, monsters, self.__insert_monster)
+
+    def add_items(self, items: list[IItem]):
+        self.__queue_additions(self.__items, items, self.__items.add)
+
+    def add_bullets(self, bullets: list[IBullet]):
+        self.__queue_additions(self.__bullets, bullets, self.__insert_bullet)
+
+    def flush_changes(self):
+        changes = self.__pending_changes
+        if not changes:
+            return
+
+        self.__pending_changes = []
+        self.__pending_presence.clear()
+        for apply, entity in changes:
+            apply(entity)
+
+        # The monster index reads the list of monsters without going through the slot map
+        self.__monsters.compact()
+
+    def __queue_change(self, entities: SlotMap, entity, added: bool, apply: Callable):
+        """Queues the addition or removal of an entity until the next flush.
+
+        The entity is checked right away, so the errors are the same as changing the entities at once.
+        """
+        key = (entities.kind, id(entity))
+        present = self.__pending_presence.get(key)
+        if present is None:
+            present = entity in entities
+
+        if added and present:
+            raise ValueError(f"{entity} is already in the {entities.kind}")
+        if not added and not present:
+            raise ValueError(f"{entity} is not in the {entities.kind}")
+
+        self.__pending_presence[key] = added
+        self.__pending_changes.append((apply, entity))
+
+    def __queue_additions(self, entities: SlotMap, added: list, apply: Callable):
+        """Queues the addition of many entities until the next flush, checking all of them first.
+
+        If any of them can't be added, none is, and the error is the same as adding them one by one.
+        """
+        kind = entities.kind
+        keys = [(kind, id(entity)) for entity in added]
+        pending_presence = self.__pending_presence
+
+        for key, entity in zip(keys, added):
+            present = pending_presence.get(key)
+            if present or (present is None and entity in entities):
+                raise ValueError(f"{entity} is already in the {kind}")
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"An entity is added twice to the {kind}")
+
+        pending_presence.update(dict.fromkeys(keys, True))
+        self.__pending_changes.extend([(apply, entity) for entity in added])
+
+    def __insert_monster(self, monster: IMonster):
+        """Adds a monster to the world and to its store."""
+        self.__monsters.add(monster)
+        self.__monster_index.mark_dirty()
+        if self.__monster_store is not None:
+            self.__monster_store.attach(monster)
+
+    def __delete_monster(self, monster: IMonster):
+        """Removes a monster from the world and from its store, and gives it back to its pool."""
+        self.__monsters.remove(monster)
+        self.__monster_index.mark_dirty()
+        if self.__monster_store is not None:
+            self.__monster_store.detach(monster)
+        ENTITY_POOLS.release(monster)
+
+    def __insert_bullet(self, bullet: IBullet):
+        """Adds a bullet to the world and to its store."""
+        self.__bullets.add(bullet)
+        if self.__projectile_store is not None:
+            self.__projectile_store.attach(bullet)
+
+    def __delete_bullet(self, bullet: IBullet):
+        """Removes a bullet from the world and from its store, and gives it back to its pool."""
         self.__bullets.remove(bullet)
+        if self.__projectile_store is not None:
+            self.__projectile_store.detach(bullet)
+        ENTITY_POOLS.release(bullet)
+
+    def __delete_item(self, item: IItem):
+        """Removes an item from the world and gives it back to its pool."""
+        self.__items.remove(item)
+        ENTITY_POOLS.release(item)
+
+    @property
+    def copies_saved(self) -> int:
+        """How many list copies the entity views saved during the last tick."""
+        return self.__copies_saved
+
+    @property
+    def monster_store(self) -> MonsterStore | None:
+        """The store that moves the monsters, if NumPy is available and it is enabled."""
+        return self.__monster_store
+
+    def handle_of(self, entity) -> EntityHandle | None:
+        """Gets a handle of a monster, bullet or item of the world.
+
+        Args:
+            entity: The entity.
+
+        Returns:
+            EntityHandle | None: The handle, or None if the entity is not in the world.
+        """
+        for entities in (self.__monsters, self.__bullets, self.__items):
+            handle = entities.handle_of(entity)
+            if handle is not None:
+                return handle
+        return None
+
+    def resolve(self, handle: EntityHandle):
+        """Gets the entity of a handle.
+
+        Args:
+            handle (EntityHandle): The handle.
+
+        Returns:
+            The entity, or None if it was removed from the world.
+        """
+        for entities in (self.__monsters, self.__bullets, self.__items):
+            if entities.kind == handle.kind:
+                return entities.get(handle)
+        return None
+
+    @property
+    def monster_index(self) -> MonsterIndex:
+        """The index used to find the nearest monster to a position."""
+        return self.__monster_index
+
+    @property
+    def projectile_store(self) -> ProjectileStore | None:
+        """The store that moves the straight bullets, if NumPy is available and it is enabled."""
+        return self.__projectile_store
 
     @property
     def monster_spawner(self):
@@ -180,13 +374,16 @@ class GameWorld(IGameWorld):
         return self.__player
 
     @property
-    def monsters(self) -> list[IMonster]:
-        return self.__monsters[:]
+    def monsters(self) -> Sequence[IMonster]:
+        self.__views_served += 1
+        return self.__monsters.view
 
     @property
-    def bullets(self) -> list[IBullet]:
-        return self.__bullets[:]
+    def bullets(self) -> Sequence[IBullet]:
+        self.__views_served += 1
+        return self.__bullets.view
 
     @property
-    def items(self) -> list[IItem]:
-        return self.__items[:]
\ No newline at end of file
+    def items(self) -> Sequence[IItem]:
+        self.__views_served += 1
+        return self.__items.view
@@ -1,6 +1,7 @@
 """This module contains interfaces for the game world."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from business.entities.interfaces import IBullet, IMonster, IPlayer, IItem
 from business.upgrades.interfaces import IPerk
@@ -12,11 +13,16 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from game import Game
     from business.world.interfaces import IMonsterSpawner
+    from business.world.monster_index import MonsterIndex
+    from business.world.projectile_store import ProjectileStore
 
 class IGameWorld(ABC):
     """Interface for the game world.
 
     The game world is the environment in which the game entities exist.
+
+    The monsters, bullets and items are kept in the order they were added, which is the order
+    they are drawn, tested for collisions and chosen among when they are equally near.
     """
 
     @abstractmethod
@@ -67,10 +73,43 @@ class IGameWorld(ABC):
             bullet (IBullet): The bullet to remove.
         """
 
+    def add_monsters(self, monsters: list[IMonster]):
+        """Adds many monsters to the world, like adding them one by one.
+
+        Args:
+            monsters (list[IMonster]): The monsters to add.
+        """
+        for monster in monsters:
+            self.add_monster(monster)
+
+    def add_items(self, items: list[IItem]):
+        """Adds many items to the world, like adding them one by one.
+
+        Args:
+            items (list[IItem]): The items.
+        """
+        for item in items:
+            self.add_item(item)
+
+    def add_bullets(self, bullets: list[IBullet]):
+        """Adds many bullets to the world, like adding them one by one.
+
+        Args:
+            bullets (list[IBullet]): The bullets to add.
+        """
+        for bullet in bullets:
+            self.add_bullet(bullet)
+
     @abstractmethod
     def update(self):
         """Updates the state of the world and all updatable entities within it."""
 
+    def flush_changes(self):
+        """Applies the additions and removals of entities made since the last flush.
+
+        Worlds that add and remove their entities right away don't need to override it.
+        """
+
     @abstractmethod
     def get_perks_for_display(self):
         """Gets a random set of perks for the upgrade menu."""
@@ -118,29 +157,47 @@ class IGameWorld(ABC):
 
     @property
     @abstractmethod
-    def monsters(self) -> list[IMonster]:
-        """Gets the list of monsters in the world.
+    def monsters(self) -> Sequence[IMonster]:
+        """Gets the monsters in the world.
+
+        Returns:
+            Sequence[IMonster]: A read-only view of the monsters in the world.
+        """
+
+    @property
+    @abstractmethod
+    def bullets(self) -> Sequence[IBullet]:
+        """Gets the bullets in the world.
 
         Returns:
-            list[IMonster]: A copy of the list of monsters in the world.
+            Sequence[IBullet]: A read-only view of the bullets in the world.
         """
 
     @property
     @abstractmethod
-    def bullets(self) -> list[IBullet]:
-        """Gets the list of bullets in the world.
+    def items(self) -> Sequence[IItem]:
+        """Gets the items in the world.
 
         Returns:
-            list[IBullet]: A copy of the list of bullets in the world.
+            Sequence[IItem]: A read-only view of the items in the world.
         """
 
     @property
     @abstractmethod
-    def items(self) -> list[IItem]:
-        """Gets the list of items in the world.
+    def monster_index(self) -> "MonsterIndex | None":
+        """Gets the index used to find the nearest monster to a position.
 
         Returns:
-            list[IItem]: A copy of the list of items in the world.
+            MonsterIndex | None: The index, or None if the monsters are checked one by one.
+        """
+
+    @property
+    @abstractmethod
+    def projectile_store(self) -> "ProjectileStore | None":
+        """Gets the store that moves the straight bullets.
+
+        Returns:
+            ProjectileStore | None: The store, or None if the bullets move one by one.
         """
 
 
@@ -196,3 +253,14 @@ class ITileMap(ABC):
         Returns:
             int: The tile at the specified row and column.
         """
+
+    @property
+    def version(self) -> int:
+        """A number that changes every time a tile changes, so anything drawn from the map knows when to redraw.
+
+        Maps that never change can keep the default.
+
+        Returns:
+            int: The version of the tiles.
+        """
+        return 0
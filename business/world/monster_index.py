@@ -0,0 +1,144 @@
+"""Module that contains the MonsterIndex class."""
+
+import math
+
+import settings
+from business.entities.interfaces import IMonster
+from business.world.interfaces import IGameWorld
+
+class MonsterIndex:
+    """A grid of the monster positions to find the nearest monster without checking all of them.
+
+    The grid is rebuilt lazily, the first time it is queried after being marked as dirty, so it is
+    built at most once per tick no matter how many bullets look for a target.
+    """
+
+    CELL_SIZE = settings.TILE_WIDTH * 4
+    LINEAR_SCAN_MAX = 32
+
+    def __init__(self, monsters: list[IMonster], cell_size: float = CELL_SIZE, linear_scan_max: int = LINEAR_SCAN_MAX):
+        self.__monsters = monsters
+        self.__cell_size = cell_size
+        self.__linear_scan_max = linear_scan_max
+        self.__cells: dict[tuple[int, int], list[tuple[int, IMonster]]] = {}
+        self.__bounds = (0, 0, 0, 0)
+        self.__dirty = True
+        self.__builds = 0
+
+    @property
+    def builds(self) -> int:
+        """The amount of times the grid was rebuilt."""
+        return self.__builds
+
+    def mark_dirty(self):
+        """Makes the next query rebuild the grid, because the monsters moved, appeared or died."""
+        self.__dirty = True
+
+    def __rebuild(self):
+        """Buckets every monster by the cell of its position."""
+        cells = {}
+        size = self.__cell_size
+        for index, monster in enumerate(self.__monsters):
+            cell = (int(monster.pos_x // size), int(monster.pos_y // size))
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [(index, monster)]
+            else:
+                bucket.append((index, monster))
+
+        if cells:
+            cols = [col for col, _ in cells]
+            rows = [row for _, row in cells]
+            self.__bounds = (min(cols), max(cols), min(rows), max(rows))
+
+        self.__cells = cells
+        self.__dirty = False
+        self.__builds += 1
+
+    def __ring(self, col: int, row: int, ring: int):
+        """Gets the cells at a Chebyshev distance of `ring` cells from a cell."""
+        if ring == 0:
+            yield (col, row)
+            return
+
+        for d_col in range(-ring, ring + 1):
+            yield (col + d_col, row - ring)
+            yield (col + d_col, row + ring)
+        for d_row in range(-ring + 1, ring):
+            yield (col - ring, row + d_row)
+            yield (col + ring, row + d_row)
+
+    def nearest(self, pos_x: float, pos_y: float) -> IMonster | None:
+        """Gets the nearest monster to a position.
+
+        It gives the same monster as a `min` over the monsters list by squared distance,
+        so ties are won by the monster that was added first.
+
+        Args:
+            pos_x (float): The x-coordinate of the position.
+            pos_y (float): The y-coordinate of the position.
+
+        Returns:
+            IMonster | None: The nearest monster, or None if there are no monsters.
+        """
+        # With a few monsters it is faster to check all of them than to use the grid
+        if len(self.__monsters) <= self.__linear_scan_max:
+            return MonsterIndex.__linear_nearest(self.__monsters, pos_x, pos_y)
+
+        if self.__dirty:
+            self.__rebuild()
+        if not self.__cells:
+            return None
+
+        size = self.__cell_size
+        col = int(pos_x // size)
+        row = int(pos_y // size)
+        min_col, max_col, min_row, max_row = self.__bounds
+        last_ring = max(abs(col - min_col), abs(col - max_col), abs(row - min_row), abs(row - max_row))
+
+        best = None
+        best_key = (math.inf, 0)
+        for ring in range(last_ring + 1):
+            # Every position in this ring is at least (ring - 1) cells away
+            if best is not None and best_key[0] < ((ring - 1) * size) ** 2:
+                break
+
+            for cell in self.__ring(col, row, ring):
+                for index, monster in self.__cells.get(cell, ()):
+                    key = ((monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2, index)
+                    if key < best_key:
+                        best_key = key
+                        best = monster
+
+        return best
+
+    @staticmethod
+    def find_nearest(world: IGameWorld, pos_x: float, pos_y: float) -> IMonster | None:
+        """Gets the nearest monster of the world to a position, using its index if it has one.
+
+        Args:
+            world (IGameWorld): The game world.
+            pos_x (float): The x-coordinate of the position.
+            pos_y (float): The y-coordinate of the position.
+
+        Returns:
+            IMonster | None: The nearest monster, or None if there are no monsters.
+        """
+        index = world.monster_index
+        if index is not None:
+            return index.nearest(pos_x, pos_y)
+
+        return MonsterIndex.__linear_nearest(world.monsters, pos_x, pos_y)
+
+    @staticmethod
+    def __linear_nearest(monsters: list[IMonster], pos_x: float, pos_y: float) -> IMonster | None:
+        """Gets the nearest monster to a position checking all of them."""
+        if not monsters:
+            return None
+
+        return min(
+            monsters,
+            key=lambda monster: (
+                (monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2
+            ),
+        )
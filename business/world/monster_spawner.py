@@ -4,6 +4,7 @@ import random
 
 import pygame
 
+import settings
 from business.entities.interfaces import *
 from business.entities.monsters.gunner import GunMonster
 from business.entities.monsters.monster import Monster
@@ -14,6 +15,8 @@ from presentation.interfaces import IDisplay
 from business.handlers.cooldown_handler import CooldownHandler
 from business.exceptions import EntityOutOfBounds
 from business.handlers.clock import GameClockSingleton
+from business.world.entity_pool import ENTITY_POOLS
+from business.world.type_registry import TYPE_REGISTRY
 
 class MonsterSpawner(IMonsterSpawner):
     """Spawns monsters in the game world."""
@@ -34,20 +37,11 @@ class MonsterSpawner(IMonsterSpawner):
     def load_saved_data(self, world: IGameWorld, saved_data: dict):
         mosnters_data = saved_data.get('monsters')
 
-        for monster_type in mosnters_data:
-            for monster_data in mosnters_data[monster_type]:
-                if 'monster.Monster' in monster_type:
-                    monster = Monster(0, 0, monster_data)
-                    world.add_monster(monster)
-                elif 'boss.BossMonster' in monster_type:
-                    monster = BossMonster(0, 0, monster_data)
-                    world.add_monster(monster)
-                elif 'boss2.BigBossMonster' in monster_type:
-                    monster = BigBossMonster(0, 0, monster_data)
-                    world.add_monster(monster)
-                elif 'Gun' in monster_type:
-                    monster = GunMonster(0, 0, monster_data)
-                    world.add_monster(monster)
+        for monster_tag, monsters_data in mosnters_data.items():
+            monster_type = TYPE_REGISTRY.type_of(monster_tag)
+            # Monsters of types that no longer exist are left out
+            if monster_type is not None:
+                world.add_monsters(TYPE_REGISTRY.load_all(monster_type, monsters_data))
 
         self.__minute_boss_added = saved_data['monster_spawner']['minute_boss_added']
         self.__second_minute_boss_added = saved_data['monster_spawner']['second_minute_boss_added']
@@ -59,7 +53,7 @@ class MonsterSpawner(IMonsterSpawner):
         }
 
     def update(self, world: IGameWorld):
-        if self.__spawn_cooldown.is_action_ready() and len(world.monsters) <= 20:
+        if self.__spawn_cooldown.is_action_ready() and len(world.monsters) <= settings.MAX_MONSTERS:
             self.spawn_monster(world)
             self.__spawn_cooldown.put_on_cooldown()
 
@@ -92,7 +86,7 @@ class MonsterSpawner(IMonsterSpawner):
                 else:
                     monster_choice = 0
                 monster = self.__monsters[monster_choice]
-                world.add_monster(monster(pos_x, pos_y))
+                world.add_monster(ENTITY_POOLS.acquire(monster, pos_x, pos_y))
 
                 if GameClockSingleton().game_clock > 60000 and not self.__minute_boss_added:
                     world.add_monster(BossMonster(pos_x, pos_y))
@@ -0,0 +1,39 @@
+"""Module that contains the MonsterStore class."""
+
+import settings
+from business.world.entity_store import EntityStore, np
+
+class MonsterStore(EntityStore):
+    """Keeps the positions, speeds and health of the monsters in arrays and moves them all at once."""
+
+    COLUMNS = ('pos_x', 'pos_y', 'speed', 'health')
+    INTEGER_COLUMNS = ('speed', 'health')
+    SAVED_COLUMNS = ('pos_x', 'pos_y', 'health')
+
+    def step_towards(self, target_x: float, target_y: float):
+        """Moves every monster towards a position, each one by its own speed.
+
+        It does the same as calling `move` on every monster with its normalized direction to the target.
+
+        Args:
+            target_x (float): The x-coordinate of the target.
+            target_y (float): The y-coordinate of the target.
+        """
+        size = len(self)
+        if size == 0:
+            return
+
+        pos_x = self.columns['pos_x'][:size]
+        pos_y = self.columns['pos_y'][:size]
+        speed = self.columns['speed'][:size] * settings.SPEED_SCALE
+
+        vector_x = target_x - pos_x
+        vector_y = target_y - pos_y
+
+        magnitude = np.sqrt(vector_x * vector_x + vector_y * vector_y)
+        magnitude[magnitude == 0] = 0.00000001 # ZERO DIVISION ERROR
+
+        pos_x += vector_x / magnitude * speed
+        pos_y += vector_y / magnitude * speed
+
+        self._moved()
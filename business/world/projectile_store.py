@@ -0,0 +1,52 @@
+"""Module that contains the ProjectileStore class."""
+
+import settings
+from business.world.entity_store import EntityStore, np
+from business.handlers.boundaries_handler import BoundariesHandler
+
+class ProjectileStore(EntityStore):
+    """Keeps the straight bullets in arrays, moves them all at once and finds the ones that have to be removed."""
+
+    COLUMNS = ('pos_x', 'pos_y', 'dir_x', 'dir_y', 'speed', 'damage', 'health')
+    INTEGER_COLUMNS = ('speed', 'damage', 'health')
+    SAVED_COLUMNS = ('pos_x', 'pos_y', 'dir_x', 'dir_y', 'damage', 'health', 'speed')
+
+    def integrate(self):
+        """Moves every bullet one step in its direction.
+
+        It does the same as calling `move` on every bullet with its direction.
+        """
+        size = len(self)
+        if size == 0:
+            return
+
+        pos_x = self.columns['pos_x'][:size]
+        pos_y = self.columns['pos_y'][:size]
+        speed = self.columns['speed'][:size] * settings.SPEED_SCALE
+
+        pos_x += self.columns['dir_x'][:size] * speed
+        pos_y += self.columns['dir_y'][:size] * speed
+
+        self._moved()
+
+    def expired(self) -> list:
+        """Gets the bullets without health or outside of the world boundaries.
+
+        Returns:
+            list: The bullets, in slot order.
+        """
+        size = len(self)
+        if size == 0:
+            return []
+
+        pos_x = self.columns['pos_x'][:size]
+        pos_y = self.columns['pos_y'][:size]
+
+        inside = (
+            (pos_x >= BoundariesHandler.MARGIN_X) & (pos_x <= settings.WORLD_WIDTH - BoundariesHandler.MARGIN_X)
+            & (pos_y >= BoundariesHandler.MARGIN_Y) & (pos_y <= settings.WORLD_HEIGHT - BoundariesHandler.MARGIN_Y)
+        )
+        mask = (self.columns['health'][:size] <= 0) | ~inside
+
+        entities = self.entities
+        return [entities[slot] for slot in np.flatnonzero(mask).tolist()]
@@ -0,0 +1,198 @@
+"""Module that contains the SlotMap class and the handles of its entities."""
+
+from collections.abc import Sequence
+from typing import NamedTuple
+
+class EntityHandle(NamedTuple):
+    """A reference to an entity of a slot map that can tell when the entity was removed.
+
+    The index of a removed entity is reused by the next one added, but with a new generation,
+    so old handles don't point to the new entity.
+    """
+
+    kind: str
+    index: int
+    generation: int
+
+class EntityView(Sequence):
+    """A read-only view of the entities of a slot map that is iterated without copying them.
+
+    The view follows the slot map, so the entities must not be added or removed while iterating it.
+    """
+
+    def __init__(self, slot_map: "SlotMap"):
+        self.__slot_map = slot_map
+
+    def __len__(self):
+        return len(self.__slot_map)
+
+    def __getitem__(self, index):
+        return self.__slot_map.entities[index]
+
+    def __iter__(self):
+        return iter(self.__slot_map.entities)
+
+    def __contains__(self, entity):
+        return entity in self.__slot_map
+
+    def __eq__(self, other):
+        if isinstance(other, (EntityView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"EntityView({self.__slot_map.entities!r})"
+
+# What a removed entity leaves in the list until the holes are closed
+_REMOVED = object()
+
+class SlotMap:
+    """Keeps entities in a list in the order they were added, and adds or removes any of them in constant time.
+
+    Removing an entity leaves a hole, and all the holes are closed at once the next time the
+    entities are read, so removing many entities only moves the others once and keeps their order.
+    """
+
+    def __init__(self, kind: str):
+        self.__kind = kind
+        self.__entities: list = []
+        self.__dense_indexes: list[int] = []
+        self.__positions: list[int | None] = []
+        self.__generations: list[int] = []
+        self.__free_indexes: list[int] = []
+        # By identity, like the entities are compared, and it also works with unhashable ones
+        self.__indexes_by_entity: dict[int, int] = {}
+        self.__first_hole: int | None = None
+        self.__holes = 0
+        self.__view = EntityView(self)
+
+    def __len__(self):
+        return len(self.__entities) - self.__holes
+
+    def __contains__(self, entity):
+        return id(entity) in self.__indexes_by_entity
+
+    def __iter__(self):
+        return iter(self.entities)
+
+    @property
+    def kind(self) -> str:
+        """The kind of the entities, which is also part of their handles."""
+        return self.__kind
+
+    @property
+    def entities(self) -> list:
+        """The entities. It is the list used by the slot map, so it must not be changed."""
+        if self.__holes:
+            self.compact()
+        return self.__entities
+
+    @property
+    def view(self) -> EntityView:
+        """A read-only view of the entities."""
+        return self.__view
+
+    def add(self, entity) -> EntityHandle:
+        """Adds an entity.
+
+        Args:
+            entity: The entity.
+
+        Returns:
+            EntityHandle: The handle of the entity.
+
+        Raises:
+            ValueError: If the entity was already added.
+        """
+        if id(entity) in self.__indexes_by_entity:
+            raise ValueError(f"{entity} is already in the {self.__kind}")
+
+        if self.__free_indexes:
+            index = self.__free_indexes.pop()
+        else:
+            index = len(self.__positions)
+            self.__positions.append(None)
+            self.__generations.append(0)
+
+        self.__positions[index] = len(self.__entities)
+        self.__entities.append(entity)
+        self.__dense_indexes.append(index)
+        self.__indexes_by_entity[id(entity)] = index
+
+        return EntityHandle(self.__kind, index, self.__generations[index])
+
+    def remove(self, entity):
+        """Removes an entity.
+
+        Args:
+            entity: The entity.
+
+        Raises:
+            ValueError: If the entity is not in the slot map, like `list.remove`.
+        """
+        index = self.__indexes_by_entity.pop(id(entity), None)
+        if index is None:
+            raise ValueError(f"{entity} is not in the {self.__kind}")
+
+        position = self.__positions[index]
+        self.__entities[position] = _REMOVED
+        self.__holes += 1
+        if self.__first_hole is None or position < self.__first_hole:
+            self.__first_hole = position
+
+        self.__positions[index] = None
+        self.__generations[index] += 1
+        self.__free_indexes.append(index)
+
+    def compact(self):
+        """Closes the holes left by the removed entities, keeping the order of the others."""
+        if not self.__holes:
+            return
+
+        entities = self.__entities
+        dense_indexes = self.__dense_indexes
+        positions = self.__positions
+
+        kept = self.__first_hole
+        for position in range(self.__first_hole, len(entities)):
+            entity = entities[position]
+            if entity is _REMOVED:
+                continue
+            index = dense_indexes[position]
+            entities[kept] = entity
+            dense_indexes[kept] = index
+            positions[index] = kept
+            kept += 1
+
+        del entities[kept:]
+        del dense_indexes[kept:]
+        self.__first_hole = None
+        self.__holes = 0
+
+    def handle_of(self, entity) -> EntityHandle | None:
+        """Gets the handle of an entity.
+
+        Args:
+            entity: The entity.
+
+        Returns:
+            EntityHandle | None: The handle, or None if the entity is not in the slot map.
+        """
+        index = self.__indexes_by_entity.get(id(entity))
+        if index is None:
+            return None
+        return EntityHandle(self.__kind, index, self.__generations[index])
+
+    def get(self, handle: EntityHandle):
+        """Gets the entity of a handle.
+
+        Args:
+            handle (EntityHandle): The handle.
+
+        Returns:
+            The entity, or None if the handle is stale or from another slot map.
+        """
+        kind, index, generation = handle
+        if kind != self.__kind or index >= len(self.__generations) or self.__generations[index] != generation:
+            return None
+        return self.__entities[self.__positions[index]]
@@ -9,6 +9,7 @@ class TileMap(ITileMap):
 
     def __init__(self):
         self.map_data = self.__generate_tile_map()
+        self.__version = 0
 
     def __generate_tile_map(self):
         """Generates the tile map."""
@@ -18,4 +19,13 @@ class TileMap(ITileMap):
 
     def get(self, row, col) -> int:
         """Gets a certain tile."""
-        return self.map_data[row][col]
\ No newline at end of file
+        return self.map_data[row][col]
+
+    def set(self, row, col, tile: int):
+        """Sets a certain tile."""
+        self.map_data[row][col] = tile
+        self.__version += 1
+
+    @property
+    def version(self) -> int:
+        return self.__version
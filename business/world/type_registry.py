@@ -0,0 +1,79 @@
+"""Module with the registry of the types that are saved with the game."""
+
+from collections.abc import Callable
+
+class TypeRegistry:
+    """Gives every saved type a short tag, which is the key of its data in the saves.
+
+    The tags don't depend on the module of the type, so moving a class doesn't break the saves.
+    The saves of older versions, whose keys are the `str` of the types, are still found.
+    """
+
+    def __init__(self):
+        self.__types_by_key: dict[str, type] = {}
+        self.__tags_by_type: dict[type, str] = {}
+        self.__saved_arguments: dict[type, Callable[[dict], tuple]] = {}
+
+    def register(self, tag: str, saved_arguments: Callable[[dict], tuple] | None = None):
+        """Decorator that registers a class with a tag.
+
+        Args:
+            tag (str): The tag, which must not change once there are saves with it.
+            saved_arguments (Callable[[dict], tuple] | None): Gets the arguments of the constructor
+                from the saved data of an instance, for the types restored with `load_all`.
+
+        Raises:
+            ValueError: If the tag is already used by another class.
+        """
+        def decorator(saved_type: type) -> type:
+            registered = self.__types_by_key.get(tag)
+            if registered is not None and registered.__qualname__ != saved_type.__qualname__:
+                raise ValueError(f"The tag {tag} is already used by {registered.__qualname__}")
+
+            self.__types_by_key[tag] = saved_type
+            self.__types_by_key[str(saved_type)] = saved_type
+            self.__tags_by_type[saved_type] = tag
+            if saved_arguments is not None:
+                self.__saved_arguments[saved_type] = saved_arguments
+            return saved_type
+
+        return decorator
+
+    def tag_of(self, instance) -> str:
+        """Gets the tag of the type of an instance, or the `str` of the type if it is not registered.
+
+        Args:
+            instance: The instance.
+
+        Returns:
+            str: The tag.
+        """
+        instance_type = type(instance)
+        tag = self.__tags_by_type.get(instance_type)
+        return tag if tag is not None else str(instance_type)
+
+    def type_of(self, key: str) -> type | None:
+        """Gets the type saved with a key, which can be its tag or the `str` of the type.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            type | None: The type, or None if no type was registered with the key.
+        """
+        return self.__types_by_key.get(key)
+
+    def load_all(self, saved_type: type, saved_data: list[dict]) -> list:
+        """Creates the instances of a type from their saved data.
+
+        Args:
+            saved_type (type): The type, which must have been registered with `saved_arguments`.
+            saved_data (list[dict]): The data of every instance.
+
+        Returns:
+            list: The instances.
+        """
+        saved_arguments = self.__saved_arguments[saved_type]
+        return [saved_type(*saved_arguments(data)) for data in saved_data]
+
+TYPE_REGISTRY = TypeRegistry()
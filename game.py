@@ -1,6 +1,8 @@
 """This module defines the Game class."""
 
 import logging
+import threading
+import time
 
 import pygame
 
@@ -9,8 +11,13 @@ from business.handlers.colission_handler import CollisionHandler
 from business.handlers.death_handler import DeathHandler
 from business.world.interfaces import IGameWorld
 from business.handlers.clock import GameClockSingleton
+from business.handlers.fixed_timestep import FixedTimestep
+from business.handlers.frame_profiler import FrameProfiler, DISABLED_PROFILER
+from business.world.entity_pool import ENTITY_POOLS
 from business.exceptions import DeadPlayerException, ResetGame
 from presentation.interfaces import IInputHandler
+from presentation.world_snapshot import SnapshotBuffer, WorldSnapshot
+from persistence.autosave import Autosave
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from persistence.daointerfaces import IGameDAO
@@ -34,6 +41,17 @@ class Game:
         self.__dead = False
         self.__winned = False
         self.__dao = dao
+        self.__autosave = Autosave(dao)
+        self.__profiler = FrameProfiler()
+        self.__timestep = FixedTimestep()
+        self.__frame_ms = 0
+
+        # Only used when the simulation runs in its own thread
+        self.__world_lock = threading.Lock()
+        self.__snapshots = SnapshotBuffer()
+        self.__simulation_profiler = FrameProfiler() if settings.THREADED_SIMULATION else self.__profiler
+        self.__pressed_keys = None
+        self.__simulation_error: Exception | None = None
 
     @property
     def paused(self):
@@ -50,6 +68,56 @@ class Game:
         """The gameworld"""
         return self.__world
 
+    @property
+    def profiler(self) -> FrameProfiler:
+        """The profiler that times every stage of the game loop."""
+        return self.__profiler
+
+    @property
+    def simulation_profiler(self) -> FrameProfiler:
+        """The profiler of the simulation stages, which is the same one of the game loop unless the
+        simulation runs in its own thread."""
+        return self.__simulation_profiler
+
+    @property
+    def snapshots(self) -> SnapshotBuffer:
+        """The snapshots published by the simulation thread."""
+        return self.__snapshots
+
+    @property
+    def timestep(self) -> FixedTimestep:
+        """The fixed timestep that decides how many ticks are simulated every frame."""
+        return self.__timestep
+
+    def __is_simulation_stopped(self) -> bool:
+        """If the world must not be simulated, because of a menu or the end of the game."""
+        return self.__paused or self.__world.in_upgrade != 0 or self.__dead or self.__winned
+
+    def __entity_counts(self) -> dict:
+        """Counts the entities of the world, for the profiler logs.
+
+        It takes the world lock, so it must not be called while holding it.
+        """
+        with self.__world_lock:
+            return Game.count_entities(self.__world)
+
+    @staticmethod
+    def count_entities(world: IGameWorld) -> dict:
+        """Counts the entities of a world, for the profiler logs.
+
+        Args:
+            world (IGameWorld): The world.
+
+        Returns:
+            dict: The amount of monsters, bullets and items, and the entities created in the last tick.
+        """
+        return {
+            'monsters': len(world.monsters),
+            'bullets': len(world.bullets),
+            'items': len(world.items),
+            'pool_allocations': ENTITY_POOLS.last_tick['allocations']
+        }
+
     def win(self):
         """Wins the game"""
         self.__winned = True
@@ -65,15 +133,51 @@ class Game:
                 self.__logger.debug("QUIT event detected")
                 self.__running = False
 
+    @property
+    def autosave(self) -> Autosave:
+        """The autosave, which also writes the saves asked for."""
+        return self.__autosave
+
     def save_game(self):
-        """Saves the game if the player is not dead"""
+        """Saves the game if the player is not dead, and waits until it is written."""
         if not self.__dead:
-            self.__dao.save_game(self)
+            self.__autosave.save(self)
+            self.__autosave.wait()
 
     def clear_save(self):
-        """Clears the save file."""
+        """Clears the save file, after any save that is still being written."""
+        self.__autosave.wait()
         self.__dao.clear_save()
 
+    def __update_autosave(self):
+        """Saves the game in the background when it is time to."""
+        if self.__dao is not None and not self.__dead:
+            self.__autosave.update(self)
+
+    @staticmethod
+    def simulate_tick(world: IGameWorld, profiler: FrameProfiler = DISABLED_PROFILER):
+        """Advances the simulation of the world by one tick.
+
+        Args:
+            world (IGameWorld): The world to simulate.
+            profiler (FrameProfiler): The profiler that times every stage.
+        """
+        # The entities added or removed at each stage are applied before the next one
+        world.flush_changes()
+        with profiler.measure(FrameProfiler.UPDATE):
+            world.update()
+            world.flush_changes()
+        with profiler.measure(FrameProfiler.COLLISIONS):
+            CollisionHandler.handle_collisions(world)
+            world.flush_changes()
+        with profiler.measure(FrameProfiler.DEATHS):
+            try:
+                DeathHandler.check_deaths(world)
+            finally:
+                world.flush_changes()
+        with profiler.measure(FrameProfiler.CLOCK):
+            GameClockSingleton().update()
+
     def unpause_event(self):
         """Unpauses the game."""
         self.__paused = not self.__paused
@@ -84,6 +188,9 @@ class Game:
         Returns:
             __type__: A game event after the loop closes.
         """
+        if settings.THREADED_SIMULATION:
+            return self.__run_threaded()
+
         while self.__running:
             try:
                 self.process_game_events()
@@ -91,17 +198,32 @@ class Game:
                 if not self.__world.in_upgrade and self.__input_handler.is_pause_pressed() and not self.__dead:
                     self.__paused = self.__input_handler.process_pause(self)
 
-                if self.__paused or self.__world.in_upgrade != 0 or self.__dead or self.__winned:
-                    pass
+                if self.__input_handler.is_profiler_toggle_pressed():
+                    self.__profiler.toggle_overlay()
+
+                if self.__is_simulation_stopped():
+                    # The time in menus is not simulated later, so the game doesn't jump forward when it resumes
+                    self.__timestep.reset()
                 else:
-                    self.__input_handler.process_input()
-                    self.__world.update()
-                    CollisionHandler.handle_collisions(self.__world)
-                    DeathHandler.check_deaths(self.__world)
-                    GameClockSingleton().update()
-        
-                self.__world.display.render_frame(self.__paused, self.__world.in_upgrade, self.__dead, self)
-                self.__clock.tick(settings.FPS)
+                    steps = self.__timestep.advance(self.__frame_ms)
+                    for step in range(steps):
+                        if settings.INTERPOLATE_POSITIONS and step == steps - 1:
+                            self.__world.display.remember_positions()
+
+                        with self.__profiler.measure(FrameProfiler.INPUT):
+                            self.__input_handler.process_input()
+                        Game.simulate_tick(self.__world, self.__profiler)
+
+                        # A level up opens the upgrade menu, which has to be shown before the next tick
+                        if self.__is_simulation_stopped():
+                            break
+
+                    self.__update_autosave()
+
+                with self.__profiler.measure(FrameProfiler.RENDER):
+                    self.__world.display.render_frame(self.__paused, self.__world.in_upgrade, self.__dead, self)
+                self.__profiler.end_frame(self.__entity_counts)
+                self.__frame_ms = self.__clock.tick(settings.FPS)
             except DeadPlayerException:
                 self.__dead = True
             except ResetGame:
@@ -110,4 +232,112 @@ class Game:
             
             except Exception as error:
                 # For debugging
-                print(f'{type(error)} : {error}')
\ No newline at end of file
+                print(f'{type(error)} : {error}')
+
+    def __run_threaded(self):
+        """Runs the game loop while another thread simulates the world.
+
+        This thread handles the events, samples the keys that the simulation reads and draws the
+        latest snapshot. The world lock is held by the simulation during every tick and by this
+        thread whenever it reads or changes the world.
+
+        Returns:
+            __type__: A game event after the loop closes.
+
+        Raises:
+            Exception: The error that stopped the simulation thread.
+        """
+        # SDL must only be read from this thread
+        self.__pressed_keys = self.__input_handler.sample_input()
+        simulation = threading.Thread(target=self.__simulate_in_background, name='simulation', daemon=True)
+        simulation.start()
+        try:
+            while self.__running:
+                if self.__simulation_error is not None:
+                    raise self.__simulation_error
+
+                try:
+                    self.process_game_events()
+                    pressed_keys = self.__input_handler.sample_input()
+
+                    with self.__world_lock:
+                        self.__pressed_keys = pressed_keys
+                        if not self.__world.in_upgrade and self.__input_handler.is_pause_pressed() and not self.__dead:
+                            self.__paused = self.__input_handler.process_pause(self)
+                        stopped = self.__is_simulation_stopped()
+
+                    if self.__input_handler.is_profiler_toggle_pressed():
+                        self.__profiler.toggle_overlay()
+
+                    snapshot = self.__snapshots.latest()
+                    with self.__profiler.measure(FrameProfiler.RENDER):
+                        if stopped or snapshot is None:
+                            # The menus change the world, and the simulation waits for them anyway
+                            with self.__world_lock:
+                                self.__world.display.show_snapshot(None)
+                                self.__world.display.render_frame(self.__paused, self.__world.in_upgrade, self.__dead, self)
+                        else:
+                            self.__world.display.show_snapshot(snapshot)
+                            self.__world.display.render_frame(False, 0, False, self)
+                    self.__profiler.end_frame(self.__entity_counts)
+                    self.__clock.tick(settings.FPS)
+                except ResetGame:
+                    self.clear_save()
+                    return Game.RESET_EVENT
+
+                except Exception as error:
+                    # For debugging
+                    print(f'{type(error)} : {error}')
+        finally:
+            self.__running = False
+            simulation.join()
+            self.__world.display.show_snapshot(None)
+
+        # The loop may have been closed while the simulation was failing
+        if self.__simulation_error is not None:
+            raise self.__simulation_error
+
+    def __simulate_in_background(self):
+        """Simulates the world at the fixed timestep and publishes a snapshot after every tick.
+
+        An error stops the thread before the tick that failed is published, and is kept for the
+        main thread to raise it.
+        """
+        timestep = FixedTimestep()
+        profiler = self.__simulation_profiler
+        snapshot = None
+        tick = 0
+        last_time = time.perf_counter()
+
+        while self.__running:
+            now = time.perf_counter()
+            steps = timestep.advance((now - last_time) * 1000)
+            last_time = now
+
+            for _ in range(steps):
+                with self.__world_lock:
+                    if self.__is_simulation_stopped():
+                        timestep.reset()
+                        break
+
+                    try:
+                        with profiler.measure(FrameProfiler.INPUT):
+                            self.__input_handler.process_input(self.__pressed_keys)
+                        Game.simulate_tick(self.__world, profiler)
+                    except DeadPlayerException:
+                        self.__dead = True
+                    except Exception as error:
+                        self.__logger.exception("The simulation thread stopped")
+                        self.__simulation_error = error
+                        return
+
+                    tick += 1
+                    with profiler.measure(FrameProfiler.SNAPSHOT):
+                        snapshot = WorldSnapshot.capture(self.__world, tick, snapshot)
+                    self.__update_autosave()
+
+                self.__snapshots.publish(snapshot)
+                profiler.end_frame(self.__entity_counts)
+
+            # Waits until the next tick is due, without holding the world lock
+            time.sleep(timestep.step_ms * (1 - timestep.alpha) / 1000)
@@ -0,0 +1,135 @@
+"""Runs the game simulation without a window and without a frame cap.
+
+Usage: python headless.py --ticks 3600 [--render] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import time
+
+import pygame
+
+import settings
+from business.exceptions import DeadPlayerException
+from business.handlers.clock import GameClockSingleton
+from business.handlers.frame_profiler import FrameProfiler
+from business.world.entity_pool import ENTITY_POOLS
+from business.world.interfaces import IGameWorld
+from game import Game
+from presentation.display import Display
+from presentation.headless_display import HeadlessDisplay
+from presentation.image_cache import IMAGE_CACHE
+from presentation.sprite import preload_images
+from runner import initialize_game_world
+
+def choose_upgrades(world: IGameWorld):
+    """Gives a random perk to the player for every pending upgrade, as there is no one to pick them."""
+    while world.in_upgrade > 0:
+        perks = world.get_perks_for_display()
+        if perks:
+            world.give_perk_to_player(random.choice(perks))
+        world.in_upgrade -= 1
+
+def run_headless(ticks: int, render: bool = False, seed: int | None = None) -> dict:
+    """Simulates a new game as fast as possible.
+
+    Args:
+        ticks (int): The maximum amount of ticks to simulate.
+        render (bool): If every tick should also be rendered, to compare the simulation and rendering costs.
+        seed (int | None): The seed for the random generator.
+
+    Returns:
+        dict: The amount of simulated ticks, the time spent simulating and rendering, the list copies saved per tick,
+            the entities reused and created by the pools per tick and the summary of every stage.
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    display = Display() if render else HeadlessDisplay()
+    preload_images()
+
+    world = initialize_game_world(display, {})
+    display.load_world(world)
+
+    profiler = FrameProfiler(history_size=ticks)
+    simulation_time = 0.0
+    render_time = 0.0
+    simulated_ticks = 0
+    copies_saved = 0
+    pool_hits = 0
+    pool_allocations = 0
+    dead = False
+
+    while simulated_ticks < ticks and not dead and GameClockSingleton().game_clock <= settings.WIN_TIME:
+        start = time.perf_counter()
+        try:
+            Game.simulate_tick(world, profiler)
+        except DeadPlayerException:
+            dead = True
+        simulation_time += time.perf_counter() - start
+        simulated_ticks += 1
+        copies_saved += world.copies_saved
+        pool_hits += ENTITY_POOLS.last_tick['hits']
+        pool_allocations += ENTITY_POOLS.last_tick['allocations']
+
+        choose_upgrades(world)
+
+        start = time.perf_counter()
+        with profiler.measure(FrameProfiler.RENDER):
+            display.render_frame(False, 0, dead)
+        render_time += time.perf_counter() - start
+
+        profiler.end_frame(lambda: Game.count_entities(world))
+
+    return {
+        'ticks': simulated_ticks,
+        'game_clock': GameClockSingleton().game_clock,
+        'player_dead': dead,
+        'simulation_time': simulation_time,
+        'render_time': render_time,
+        'copies_saved_per_tick': copies_saved / simulated_ticks if simulated_ticks else 0.0,
+        'pool_hits_per_tick': pool_hits / simulated_ticks if simulated_ticks else 0.0,
+        'pool_allocations_per_tick': pool_allocations / simulated_ticks if simulated_ticks else 0.0,
+        'pools': ENTITY_POOLS.stats(),
+        'stages': {stage: profiler.stats(stage) for stage in profiler.stages},
+    }
+
+def main():
+    """Main function to run the headless simulation"""
+    parser = argparse.ArgumentParser(description="Runs the game simulation without a window.")
+    parser.add_argument('--ticks', type=int, default=settings.FPS * 60, help='Maximum ticks to simulate.')
+    parser.add_argument('--render', action='store_true', help='Also render every tick on an offscreen display.')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+
+    result = run_headless(args.ticks, args.render, args.seed)
+
+    ticks = result['ticks']
+    simulation_time = result['simulation_time']
+    render_time = result['render_time']
+    total_time = simulation_time + render_time
+
+    print(f"Ticks: {ticks} ({result['game_clock'] / 1000:.1f} s of game time, player dead: {result['player_dead']})")
+    print(f"Simulation: {simulation_time:.3f} s, {simulation_time / ticks * 1000:.3f} ms/tick, {ticks / simulation_time:.0f} ticks/s")
+    if args.render:
+        print(f"Rendering: {render_time:.3f} s, {render_time / ticks * 1000:.3f} ms/tick")
+        print(f"Simulation share of the tick: {simulation_time / total_time:.1%}")
+
+    print(f"Image cache: {IMAGE_CACHE.hits} hits, {IMAGE_CACHE.misses} misses")
+    print(f"List copies saved by the entity views: {result['copies_saved_per_tick']:.1f} per tick")
+    print(f"Entity pools: {result['pool_hits_per_tick']:.2f} reused and {result['pool_allocations_per_tick']:.2f} created per tick")
+    for entity_type, stats in result['pools'].items():
+        print(f"  {entity_type:<19} hit rate {stats['hit_rate']:.1%}  {stats['allocations']} created  {stats['free']} free")
+
+    for stage, stats in result['stages'].items():
+        print(f"  {stage:<11} p50 {stats['p50']:.3f} ms  p95 {stats['p95']:.3f} ms  p99 {stats['p99']:.3f} ms")
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
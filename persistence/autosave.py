@@ -0,0 +1,138 @@
+"""Module that contains the Autosave class."""
+
+import logging
+import threading
+
+import settings
+from business.handlers.clock import GameClockSingleton
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from persistence.daointerfaces import IGameDAO
+
+class Autosave:
+    """Saves the game every some time without stopping the game loop for the write.
+
+    The game thread only takes a snapshot of the game, and a background thread builds its data and writes it.
+    A save that is due while the previous one is still being written waits for it to finish,
+    so all the saves due meanwhile become a single one.
+    """
+
+    def __init__(self, dao: "IGameDAO", interval_ms: int = settings.AUTOSAVE_INTERVAL):
+        self.__logger = logging.getLogger(self.__class__.__name__)
+        self.__dao = dao
+        self.__interval_ms = interval_ms
+        self.__last_save_time = GameClockSingleton().game_clock
+        self.__postponed = False
+
+        self.__condition = threading.Condition()
+        self.__pending: dict | None = None
+        self.__writing = False
+        self.__closing = False
+        self.__writer: threading.Thread | None = None
+
+        self.__writes = 0
+        self.__coalesced = 0
+
+    @property
+    def writes(self) -> int:
+        """The amount of snapshots written."""
+        return self.__writes
+
+    @property
+    def coalesced(self) -> int:
+        """The amount of saves that were merged into a later one because a write was still running."""
+        return self.__coalesced
+
+    @property
+    def busy(self) -> bool:
+        """If a snapshot is waiting to be written or being written."""
+        with self.__condition:
+            return self.__pending is not None or self.__writing
+
+    def update(self, game):
+        """Saves the game in the background if the interval of game time has passed.
+
+        Args:
+            game (Game): The game.
+        """
+        if self.__interval_ms <= 0:
+            return
+
+        now = GameClockSingleton().game_clock
+        if now - self.__last_save_time < self.__interval_ms:
+            return
+
+        if self.busy:
+            if not self.__postponed:
+                self.__postponed = True
+                self.__coalesced += 1
+            return
+
+        self.__postponed = False
+        self.__last_save_time = now
+        self.save(game)
+
+    def save(self, game):
+        """Takes a snapshot of the game now and writes it in the background.
+
+        Args:
+            game (Game): The game.
+        """
+        snapshot = self.__dao.snapshot(game)
+
+        with self.__condition:
+            if self.__pending is not None:
+                self.__coalesced += 1
+            self.__pending = snapshot
+            self.__condition.notify_all()
+
+            if self.__writer is None:
+                self.__writer = threading.Thread(target=self.__write_in_background, name='autosave', daemon=True)
+                self.__writer.start()
+
+    def wait(self):
+        """Waits until every snapshot taken has been written."""
+        with self.__condition:
+            while self.__pending is not None or self.__writing:
+                self.__condition.wait()
+
+    def close(self):
+        """Writes the snapshot that is still pending and stops the background thread.
+
+        A later save starts the thread again.
+        """
+        with self.__condition:
+            writer = self.__writer
+            self.__closing = True
+            self.__condition.notify_all()
+
+        if writer is not None:
+            writer.join()
+
+        with self.__condition:
+            self.__writer = None
+            self.__closing = False
+
+    def __write_in_background(self):
+        """Writes the pending snapshots, one at a time, until the autosave is closed."""
+        while True:
+            with self.__condition:
+                while self.__pending is None and not self.__closing:
+                    self.__condition.wait()
+                if self.__pending is None:
+                    return
+                snapshot = self.__pending
+                self.__pending = None
+                self.__writing = True
+
+            written = False
+            try:
+                self.__dao.write_snapshot(snapshot)
+                written = True
+            except Exception as error:
+                self.__logger.error("The game could not be saved: %s", error)
+            finally:
+                with self.__condition:
+                    self.__writing = False
+                    self.__writes += written
+                    self.__condition.notify_all()
@@ -0,0 +1,155 @@
+"""Module for binary game DAO implementation"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+
+from persistence.daointerfaces import IGameDAO
+from persistence.files import write_atomically
+
+class GameBinaryDAO(IGameDAO):
+    """Binary DAO that saves the values of every entity type as columns.
+
+    The file starts with the magic bytes, the format version and the length of a JSON header.
+    The header has the player, the monster spawner, the clock and, for every entity type, its
+    amount and columns. Numeric columns follow the header as little endian arrays, one after
+    the other in the order of the header. The values that are not numbers, like the inventory
+    of the gun monsters, are kept in the header.
+
+    The loaded data has the same form as the one of GameJSONDAO, so the game restores it the same way.
+    """
+
+    BASE_GAME_DATA = {}
+
+    MAGIC = b'TUKI'
+    VERSION = 1
+    PREAMBLE = struct.Struct('<4sHI')
+    GROUPS = ('monsters', 'bullets', 'items')
+
+    INT32 = 'i'
+    INT64 = 'q'
+    FLOAT64 = 'd'
+
+    def __init__(self, save_path="data/game.sav") -> None:
+        """Initializes the DAO."""
+        self.__save_path = save_path
+
+        os.makedirs(os.path.dirname(self.__save_path), exist_ok=True)
+
+        if not os.path.exists(self.__save_path):
+            self.__save_data(self.BASE_GAME_DATA)
+
+    @staticmethod
+    def __column_type(values: list) -> str | None:
+        """Gets the array type code that fits every value of a column, or None if they aren't numbers."""
+        if all(type(value) is int for value in values):
+            if all(-2 ** 31 <= value < 2 ** 31 for value in values):
+                return GameBinaryDAO.INT32
+            return GameBinaryDAO.INT64
+        if all(type(value) in (int, float) for value in values):
+            return GameBinaryDAO.FLOAT64
+        return None
+
+    @staticmethod
+    def __encode(data: dict) -> bytes:
+        """Packs the data of a save into the binary format."""
+        header = {key: value for key, value in data.items() if key not in GameBinaryDAO.GROUPS}
+        blobs = []
+
+        for group in GameBinaryDAO.GROUPS:
+            if group not in data:
+                continue
+
+            types = {}
+            for entity_type, rows in data[group].items():
+                if not rows:
+                    continue
+
+                columns = []
+                for name in rows[0]:
+                    values = [row[name] for row in rows]
+                    type_code = GameBinaryDAO.__column_type(values)
+                    if type_code is None:
+                        columns.append({'name': name, 'values': values})
+                        continue
+
+                    column = array(type_code, values)
+                    if sys.byteorder == 'big':
+                        column.byteswap()
+                    columns.append({'name': name, 'type': type_code})
+                    blobs.append(column.tobytes())
+
+                types[entity_type] = {'count': len(rows), 'columns': columns}
+            header[group] = types
+
+        header_bytes = json.dumps(header, separators=(',', ':')).encode("utf-8")
+        preamble = GameBinaryDAO.PREAMBLE.pack(GameBinaryDAO.MAGIC, GameBinaryDAO.VERSION, len(header_bytes))
+        return b''.join([preamble, header_bytes, *blobs])
+
+    @staticmethod
+    def __decode(content: bytes) -> dict:
+        """Unpacks a save in the binary format into the data of the game."""
+        magic, version, header_length = GameBinaryDAO.PREAMBLE.unpack_from(content)
+        if magic != GameBinaryDAO.MAGIC:
+            raise ValueError("The file is not a binary save")
+        if version > GameBinaryDAO.VERSION:
+            raise ValueError(f"The save version {version} is newer than the supported {GameBinaryDAO.VERSION}")
+
+        offset = GameBinaryDAO.PREAMBLE.size
+        header = json.loads(content[offset:offset + header_length])
+        offset += header_length
+
+        data = {key: value for key, value in header.items() if key not in GameBinaryDAO.GROUPS}
+        for group in GameBinaryDAO.GROUPS:
+            if group not in header:
+                continue
+
+            entities = {}
+            for entity_type, table in header[group].items():
+                count = table['count']
+                names = []
+                columns = []
+                for column in table['columns']:
+                    names.append(column['name'])
+                    if 'values' in column:
+                        columns.append(column['values'])
+                        continue
+
+                    values = array(column['type'])
+                    size = values.itemsize * count
+                    values.frombytes(content[offset:offset + size])
+                    if sys.byteorder == 'big':
+                        values.byteswap()
+                    columns.append(values.tolist())
+                    offset += size
+
+                entities[entity_type] = [dict(zip(names, row)) for row in zip(*columns)]
+            data[group] = entities
+
+        return data
+
+    def __read_data(self) -> dict:
+        with open(self.__save_path, 'rb') as file:
+            content = file.read()
+
+        if not content:
+            return self.BASE_GAME_DATA
+
+        return self.__decode(content)
+
+    def __save_data(self, data) -> None:
+        content = self.__encode(data)
+        write_atomically(self.__save_path, lambda file: file.write(content), binary=True)
+
+    def write(self, data):
+        saved_data = dict(self.__read_data())
+        saved_data.update(data)
+        self.__save_data(saved_data)
+
+    def load_game(self):
+        return self.__read_data()
+
+    def clear_save(self):
+        self.__save_data(GameBinaryDAO.BASE_GAME_DATA)
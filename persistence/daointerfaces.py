@@ -3,17 +3,47 @@
 from abc import ABC, abstractmethod
 
 from game import Game
+from persistence.snapshot import GameSnapshot
 
 class IGameDAO(ABC):
     """Interface for data access objects for the whole game."""
 
-    @abstractmethod
     def save_game(self, game: "Game"):
         """Saves the current game.
 
         Args:
             game (Game): The game to be saved.
         """
+        self.write_snapshot(self.snapshot(game))
+
+    def snapshot(self, game: "Game") -> GameSnapshot:
+        """Copies everything that is saved of the game, so it can be written later.
+
+        Args:
+            game (Game): The game to be saved.
+
+        Returns:
+            GameSnapshot: The snapshot, which doesn't share anything that the game changes.
+        """
+        return GameSnapshot(game)
+
+    def write_snapshot(self, snapshot: GameSnapshot):
+        """Builds the data of a snapshot and writes it as the saved game. It can be called from another thread.
+
+        Args:
+            snapshot (GameSnapshot): The snapshot.
+        """
+        self.write(snapshot.data())
+
+    @abstractmethod
+    def write(self, data: dict):
+        """Writes the data of a game as the saved game. It can be called from another thread.
+
+        The keys of the saved game that the data doesn't have are kept.
+
+        Args:
+            data (dict): The data.
+        """
 
     @abstractmethod
     def load_game(self) -> dict:
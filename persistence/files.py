@@ -0,0 +1,51 @@
+"""Module with helpers to write the save files."""
+
+import os
+import shutil
+import tempfile
+from typing import IO, Callable
+
+def write_atomically(path: str, write: Callable[[IO], None], binary: bool = False) -> None:
+    """Writes a file into a temporary file that then replaces it.
+
+    The rename is atomic, so a write that is interrupted leaves the previous file intact.
+    The file keeps its permissions, or gets the default ones if it is new.
+
+    Args:
+        path (str): The path of the file.
+        write (Callable[[IO], None]): Writes the content into the open temporary file.
+        binary (bool): If the file is opened in binary mode instead of as UTF-8 text.
+    """
+    directory = os.path.dirname(path) or '.'
+    mode, encoding = ('wb', None) if binary else ('w', "utf-8")
+    with tempfile.NamedTemporaryFile(mode, encoding=encoding, dir=directory, suffix='.tmp', delete=False) as file:
+        try:
+            write(file)
+            file.flush()
+            os.fsync(file.fileno())
+            copy_permissions(path, file.name)
+        except BaseException:
+            file.close()
+            os.remove(file.name)
+            raise
+
+    os.replace(file.name, path)
+
+def copy_permissions(path: str, temporary_path: str) -> None:
+    """Gives the temporary file the permissions of the file it replaces.
+
+    The temporary files are only readable by their owner, so a new file gets the permissions of
+    a file created with open instead.
+
+    Args:
+        path (str): The path of the file that is replaced.
+        temporary_path (str): The path of the temporary file.
+    """
+    if os.path.exists(path):
+        shutil.copymode(path, temporary_path)
+        return
+
+    # The umask can only be read by changing it
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(temporary_path, 0o666 & ~umask)
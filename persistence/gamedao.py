@@ -3,9 +3,8 @@
 import os
 import json
 
-from collections import defaultdict
 from persistence.daointerfaces import IGameDAO
-from business.handlers.clock import GameClockSingleton
+from persistence.files import write_atomically
 
 class GameJSONDAO(IGameDAO):
     """JSON DAO that handles game data."""
@@ -32,41 +31,16 @@ class GameJSONDAO(IGameDAO):
         return data
 
     def __save_data(self, data) -> None:
-        with open(self.__json_path, 'w', encoding="utf-8") as file:
-            json.dump(data, file, indent=4)
+        write_atomically(self.__json_path, lambda file: json.dump(data, file, indent=4))
 
-    def save_game(self, game):
-        data = self.__read_data()
-
-        monsters = defaultdict(list)
-        for monster in game.world.monsters:
-            monsters[str(type(monster))].append(monster.to_json())
-
-        bullets = defaultdict(list)
-        for bullet in game.world.bullets:
-            bullets[str(type(bullet))].append(bullet.to_json())
-
-        items = defaultdict(list)
-        for item in game.world.items:
-            items[str(type(item))].append(item.to_json())
-
-        player = game.world.player.to_json()
-        clock = GameClockSingleton().game_clock
-
-        monster_spawner = game.world.monster_spawner.to_json()
-
-        data['monsters'] = monsters
-        data['monster_spawner'] = monster_spawner
-        data['bullets'] = bullets
-        data['items'] = items
-        data['player'] = player
-        data['clock'] = clock
-
-        self.__save_data(data)
+    def write(self, data):
+        saved_data = dict(self.__read_data())
+        saved_data.update(data)
+        self.__save_data(saved_data)
 
     def load_game(self):
         data = self.__read_data()
         return data
     
     def clear_save(self):
-        self.__save_data(GameJSONDAO.BASE_GAME_DATA)
\ No newline at end of file
+        self.__save_data(GameJSONDAO.BASE_GAME_DATA)
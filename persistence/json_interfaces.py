@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 class JSONable(ABC):
     """Interface for JSONable classes"""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_json(self) -> dict:
         """Converts the necessary information from the class to a json_format
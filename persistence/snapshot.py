@@ -0,0 +1,62 @@
+"""Module that contains the GameSnapshot class."""
+
+from collections import defaultdict
+
+from business.handlers.clock import GameClockSingleton
+from business.world.type_registry import TYPE_REGISTRY
+
+class GameSnapshot:
+    """Copy of everything that is saved of a game, taken without building the data of the save.
+
+    Taking it is the only part of a save that must run while the game is stopped, so it only
+    copies values: the saved columns of every entity store at once, the few values of the
+    attached entities that their store doesn't have, and the JSON of the other entities.
+    The data is built by `data`, which can run on another thread.
+    """
+
+    GROUPS = ('monsters', 'bullets', 'items')
+
+    def __init__(self, game):
+        world = game.world
+        self.__stores = {}
+        self.__entities = {group: self.__copy_entities(getattr(world, group)) for group in GameSnapshot.GROUPS}
+        self.__monster_spawner = world.monster_spawner.to_json()
+        self.__player = world.player.to_json()
+        self.__clock = GameClockSingleton().game_clock
+
+    def __copy_entities(self, entities) -> list[tuple]:
+        """Copies the saved values of every entity, with the tag of its type and the snapshot of its store."""
+        copies = []
+        for entity in entities:
+            store = getattr(entity, 'store', None)
+            if store is None:
+                copies.append((TYPE_REGISTRY.tag_of(entity), entity.to_json(), None, None))
+                continue
+
+            store_snapshot = self.__stores.get(store)
+            if store_snapshot is None:
+                store_snapshot = self.__stores[store] = store.snapshot()
+            copies.append((TYPE_REGISTRY.tag_of(entity), entity.unstored_json(), store_snapshot, store.slot_of(entity)))
+        return copies
+
+    def data(self) -> dict:
+        """Builds the data of the save, where the entities are grouped by the tag of their type as their JSON.
+
+        Returns:
+            dict: The data, which doesn't share anything that the game changes.
+        """
+        rows = {store_snapshot: store_snapshot.rows() for store_snapshot in self.__stores.values()}
+
+        data = {}
+        for group, entities in self.__entities.items():
+            grouped = defaultdict(list)
+            for tag, values, store_snapshot, slot in entities:
+                if store_snapshot is not None:
+                    values = {**rows[store_snapshot][slot], **values}
+                grouped[tag].append(values)
+            data[group] = grouped
+
+        data['monster_spawner'] = self.__monster_spawner
+        data['player'] = self.__player
+        data['clock'] = self.__clock
+        return data
@@ -1,15 +1,21 @@
 """Module for displaying the game world."""
 
+from collections.abc import Sequence
+
 import pygame
 import settings
 from business.world.interfaces import IGameWorld
 from business.exceptions import ResetGame
 from presentation.camera import Camera
+from presentation.hud_layer import HudLayer
 from presentation.interfaces import IDisplay
+from presentation.text_cache import TEXT_CACHE
 from presentation.tileset import Tileset
+from presentation.world_snapshot import WorldSnapshot
 from business.handlers.clock import GameClockSingleton
 from business.entities.interfaces import IPlayer, IMonster
 from business.upgrades.interfaces import IPerk
+from business.handlers.frame_profiler import FrameProfiler
 from game import Game
 
 class Display(IDisplay):
@@ -18,7 +24,9 @@ class Display(IDisplay):
     COLOR_MENUS_BG = (0, 0, 0, 210)
     COLOR_BUTTON = (255, 255, 255)
     COLOR_BUTTON_TEXT = (0, 0, 0)
-    COLOR_UI_OVERLAY = (0, 0, 0, 130)
+    COLOR_UI_OVERLAY = HudLayer.COLOR_OVERLAY
+    HEALTH_BAR_AREA_HEIGHT = 35  # Space under a sprite taken by its health bar and health value
+    MAX_DIRTY_RECTS = 64  # With more changed areas it is faster to draw the whole screen
 
     def __init__(self):
         self.__screen = pygame.display.set_mode(settings.SCREEN_DIMENSION)
@@ -30,17 +38,46 @@ class Display(IDisplay):
         self.__perks_for_display = []
 
         self.__ground_tileset = self.__load_ground_tileset()
+        self.__ground: pygame.Surface | None = None
+        self.__ground_version = None
         self.__world: IGameWorld = None
 
         self.__button_clicked = False
 
+        self.__hud = HudLayer()
+
+        # The positions before the last simulated tick, to draw the entities between ticks
+        # The generation of every sprite is kept too, as a pooled sprite can be reused somewhere else
+        self.__previous_positions: dict[pygame.sprite.Sprite, tuple[int, int, int]] = {}
+        self.__interpolation_alpha: float | None = None
+
+        self.__snapshot: WorldSnapshot | None = None
+
+        # What the last frame drew, so the dirty rectangle mode only updates what changed
+        self.__drawn_entities: dict[int, tuple] | None = None
+        self.__drawn_hud: list[pygame.Rect] = []
+        self.__drawn_camera_rect: pygame.Rect | None = None
+
     def load_world(self, world: IGameWorld):
         self.__world = world
+        self.__ground = None
+        self.__hud = HudLayer()
+        self.__previous_positions = {}
+        self.__drawn_entities = None
+        self.__snapshot = None
 
     @property
     def camera(self) -> Camera:
         return self.__camera
 
+    def show_snapshot(self, snapshot: WorldSnapshot | None):
+        self.__snapshot = snapshot
+
+    @property
+    def __scene(self) -> IGameWorld | WorldSnapshot:
+        """What the entities and the HUD are drawn from: the snapshot being shown, or else the world."""
+        return self.__world if self.__snapshot is None else self.__snapshot
+
     def __get_perks(self):
         """Gets the random set of perks."""
         if len(self.__perks_for_display) == 0:
@@ -54,58 +91,52 @@ class Display(IDisplay):
             "./assets/ground_tileset.png", settings.TILE_WIDTH, settings.TILE_HEIGHT, 2, 3
         )
 
-    def __render_ground_tiles(self):
-        """Renders the ground tiles"""
-        start_col = max(0, self.camera.camera_rect.left // settings.TILE_WIDTH)
-        end_col = min(
-            settings.WORLD_COLUMNS, (self.camera.camera_rect.right // settings.TILE_WIDTH) + 1
-        )
-        start_row = max(0, self.camera.camera_rect.top // settings.TILE_HEIGHT)
-        end_row = min(
-            settings.WORLD_ROWS, (self.camera.camera_rect.bottom // settings.TILE_HEIGHT) + 1
-        )
+    def __prerender_ground(self) -> pygame.Surface:
+        """Draws the ground tiles of the whole world once."""
+        ground = pygame.Surface(settings.WORLD_DIMENSION).convert()
 
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
+        for row in range(settings.WORLD_ROWS):
+            for col in range(settings.WORLD_COLUMNS):
                 tile_image = self.__ground_tileset.get_tile(1)
+                ground.blit(tile_image, (col * settings.TILE_WIDTH, row * settings.TILE_HEIGHT))
 
-                x = col * settings.TILE_WIDTH - self.camera.camera_rect.left
-                y = row * settings.TILE_HEIGHT - self.camera.camera_rect.top
+        return ground
 
-                self.__screen.blit(tile_image, (x, y))
+    def __is_ground_outdated(self) -> bool:
+        """If the ground has to be prerendered again, because the world or its tiles changed."""
+        return self.__ground is None or self.__ground_version != self.__world.tile_map.version
 
-    def __draw_player_health_bar(self):
-        """Draws the player's health bar and health value on the screen."""
-        player: IPlayer = self.__world.player
+    def __render_ground_tiles(self):
+        """Renders the ground tiles"""
+        if self.__is_ground_outdated():
+            self.__ground = self.__prerender_ground()
+            self.__ground_version = self.__world.tile_map.version
 
-        bar_width = settings.TILE_WIDTH
-        bar_height = 5
-        bar_x = player.sprite.rect.centerx - bar_width // 2 - self.camera.camera_rect.left
-        bar_y = player.sprite.rect.bottom + 5 - self.camera.camera_rect.top
+        self.__screen.blit(self.__ground, (0, 0), self.camera.camera_rect)
 
-        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(self.__screen, (255, 0, 0), bg_rect)
+    def __restore_ground(self, areas: list[pygame.Rect]):
+        """Draws the ground again over some areas of the screen, erasing what was drawn on them."""
+        left = self.camera.camera_rect.left
+        top = self.camera.camera_rect.top
+        for area in areas:
+            self.__screen.blit(self.__ground, area, area.move(left, top))
 
-        health_percentage = player.health / player.max_health
-        health_width = int(bar_width * health_percentage)
-        health_rect = pygame.Rect(bar_x, bar_y, health_width, bar_height)
-        pygame.draw.rect(self.__screen, (0, 255, 0), health_rect)
+    def __draw_player_health_bar(self, rect: pygame.Rect):
+        """Draws the player's health bar and health value on the screen, under the screen rect of the player."""
+        player: IPlayer = self.__scene.player
 
-        health_text = f"{int(player.health)}"
-        font = pygame.font.Font(None, 24)
-        text_surface = font.render(health_text, True, (255, 255, 255))
-        text_x = bar_x + (bar_width - text_surface.get_width()) // 2
-        text_y = bar_y + bar_height + 5
+        bar_x = rect.centerx - settings.TILE_WIDTH // 2
+        bar_y = rect.bottom + 5
 
-        self.__screen.blit(text_surface, (text_x, text_y))
+        self.__hud.draw_player_health(self.__screen, player, bar_x, bar_y)
 
-    def __draw_monster_health_bar(self, monster: IMonster):
-        """Draws the monster's health bar and health value on the screen, only if its health is under its max health."""
+    def __draw_monster_health_bar(self, monster: IMonster, rect: pygame.Rect):
+        """Draws the monster's health bar on the screen, under the screen rect of the monster."""
 
         bar_width = settings.TILE_WIDTH
         bar_height = 5
-        bar_x = monster.sprite.rect.centerx - bar_width // 2 - self.camera.camera_rect.left
-        bar_y = monster.sprite.rect.bottom + 5 - self.camera.camera_rect.top
+        bar_x = rect.centerx - bar_width // 2
+        bar_y = rect.bottom + 5
 
         bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
         pygame.draw.rect(self.__screen, (255, 0, 0), bg_rect)
@@ -117,39 +148,11 @@ class Display(IDisplay):
 
     def __draw_player(self):
         """Draws the player."""
-        adjusted_rect = self.camera.apply(self.__world.player.sprite.rect)
-        self.__screen.blit(self.__world.player.sprite.image, adjusted_rect)
-
-        self.__draw_player_health_bar()
+        player = self.__scene.player
+        adjusted_rect = self.camera.apply(self.__drawn_rect(player.sprite))
+        self.__screen.blit(player.sprite.image, adjusted_rect)
 
-    def __draw_player_inventory(self):
-        """Draws the player inventory."""
-        inventory = self.__world.player.inventory
-
-        level_font = pygame.font.SysFont(None, 20)
-        title_text = level_font.render(
-            f"Inventario:",
-            True,
-            (255, 255, 255),
-        )
-        self.__screen.blit(title_text, (10, 50))
-
-        opacity_square = pygame.Surface(((len(inventory) * 55) + 10, 65), pygame.SRCALPHA)
-        opacity_square.fill(self.COLOR_UI_OVERLAY)
-
-        self.__screen.blit(opacity_square, (10, 70))
-
-        level_font = pygame.font.SysFont(None, 30)
-        for i in range(len(inventory)):
-            perk_sprite = inventory[i].sprite
-            perk_level = level_font.render(
-                f"{inventory[i].level}",
-                True,
-                (255, 255, 255),
-            )
-
-            self.__screen.blit(perk_sprite.image, (15 + (i * 55), 75))
-            self.__screen.blit(perk_level, (45 + (i * 55), 115))
+        self.__draw_player_health_bar(adjusted_rect)
 
     def __draw_pause_menu(self, game: Game):
         """Draws the pause menu."""
@@ -165,9 +168,9 @@ class Display(IDisplay):
         continue_button = pygame.Rect(150, 150, 200, 50)
         quit_button = pygame.Rect(150, 250, 200, 50)
 
-        font = pygame.font.Font(None, 36)
-        continue_text = font.render("Continuar", True, self.COLOR_BUTTON_TEXT)
-        quit_text = font.render("Salir y guardar", True, self.COLOR_BUTTON_TEXT)
+        font = TEXT_CACHE.font(36)
+        continue_text = TEXT_CACHE.render("Continuar", font, self.COLOR_BUTTON_TEXT)
+        quit_text = TEXT_CACHE.render("Salir y guardar", font, self.COLOR_BUTTON_TEXT)
 
         continue_button.x = (settings.SCREEN_WIDTH - continue_button.x) // 2 - 200
         continue_button.y = (settings.SCREEN_HEIGHT // 2) + 200
@@ -175,10 +178,10 @@ class Display(IDisplay):
         quit_button.x = (settings.SCREEN_WIDTH - quit_button.x) // 2 + 200
         quit_button.y = (settings.SCREEN_HEIGHT // 2) + 200
 
-        pause_font = pygame.font.Font(None, 72)
-        font = pygame.font.Font(None, 36)
+        pause_font = TEXT_CACHE.font(72)
+        font = TEXT_CACHE.font(36)
 
-        pause_text = pause_font.render("En pausa", True, (255, 255, 255))
+        pause_text = TEXT_CACHE.render("En pausa", pause_font, (255, 255, 255))
 
         self.__screen.blit(opacity_square, (0, 0))
         pygame.draw.rect(self.__screen, self.COLOR_BUTTON, continue_button)
@@ -199,25 +202,6 @@ class Display(IDisplay):
                 pygame.quit()
                 return
 
-    def __draw_clock(self):
-        """Draws the clock"""
-        time = self.__time_as_text()
-
-        font = pygame.font.Font(None, 36)
-        time_text = font.render(time, True, (255, 255, 255))
-
-        text_width, text_height = time_text.get_size()
-
-        opacity_square = pygame.Surface((text_width + 20, text_height + 10), pygame.SRCALPHA)
-        opacity_square.fill(self.COLOR_UI_OVERLAY)
-
-        box_x = (settings.SCREEN_WIDTH- text_width) // 2 - 10
-        box_y = 10
-
-        self.__screen.blit(opacity_square, (box_x, box_y))
-
-        self.__screen.blit(time_text, (box_x + 10, box_y + 5))
-
     def __draw_game_over_screen(self, game: Game):
         """Draws the game over screen."""
         x = self.__world.player.pos_x
@@ -231,21 +215,21 @@ class Display(IDisplay):
 
         self.__screen.blit(opacity_square, (0, 0))
 
-        game_over_font = pygame.font.Font(None, 72)
-        font = pygame.font.Font(None, 36)
+        game_over_font = TEXT_CACHE.font(72)
+        font = TEXT_CACHE.font(36)
 
         time = self.__time_as_text()
 
-        game_over_text = game_over_font.render("Juego terminado!", True, (255, 150, 150))
-        level_text = font.render(f"Nivel: {self.__world.player.level}", True, (255, 255, 255))
-        time_text = font.render(f"Tiempo: {time}", True, (255, 255, 255))
+        game_over_text = TEXT_CACHE.render("Juego terminado!", game_over_font, (255, 150, 150))
+        level_text = TEXT_CACHE.render(f"Nivel: {self.__world.player.level}", font, (255, 255, 255))
+        time_text = TEXT_CACHE.render(f"Tiempo: {time}", font, (255, 255, 255))
 
         self.__screen.blit(game_over_text, ((settings.SCREEN_WIDTH // 2) - 210, (settings.SCREEN_HEIGHT // 2) - 60))
         self.__screen.blit(level_text, ((settings.SCREEN_WIDTH // 2) - 80, (settings.SCREEN_HEIGHT // 2) + 10))
         self.__screen.blit(time_text, ((settings.SCREEN_WIDTH // 2) - 80, (settings.SCREEN_HEIGHT // 2) + 40))
 
         reset_button = pygame.Rect(150, 250, 200, 50)
-        reset_text = font.render("Reiniciar", True, self.COLOR_BUTTON_TEXT)
+        reset_text = TEXT_CACHE.render("Reiniciar", font, self.COLOR_BUTTON_TEXT)
 
         reset_button.x = (settings.SCREEN_WIDTH // 2) - (reset_button.width // 2) - 150
         reset_button.y = (settings.SCREEN_HEIGHT // 2) + 200
@@ -255,7 +239,7 @@ class Display(IDisplay):
         self.__screen.blit(reset_text, (reset_button.x + 40, reset_button.y + 10))
 
         quit_button = pygame.Rect(150, 250, 200, 50)
-        quit_text = font.render("Salir", True, self.COLOR_BUTTON_TEXT)
+        quit_text = TEXT_CACHE.render("Salir", font, self.COLOR_BUTTON_TEXT)
 
         quit_button.x = (settings.SCREEN_WIDTH // 2) - (quit_button.width // 2) + 150
         quit_button.y = (settings.SCREEN_HEIGHT // 2) + 200
@@ -290,17 +274,17 @@ class Display(IDisplay):
 
         self.__screen.blit(opacity_square, (0, 0))
 
-        game_over_font = pygame.font.Font(None, 72)
-        font = pygame.font.Font(None, 36)
+        game_over_font = TEXT_CACHE.font(72)
+        font = TEXT_CACHE.font(36)
 
-        game_over_text = game_over_font.render("Ganaste!", True, (150, 255, 150))
-        level_text = font.render(f"Nivel: {self.__world.player.level}", True, (255, 255, 255))
+        game_over_text = TEXT_CACHE.render("Ganaste!", game_over_font, (150, 255, 150))
+        level_text = TEXT_CACHE.render(f"Nivel: {self.__world.player.level}", font, (255, 255, 255))
 
         self.__screen.blit(game_over_text, ((settings.SCREEN_WIDTH // 2) - 100, (settings.SCREEN_HEIGHT // 2) - 60))
         self.__screen.blit(level_text, ((settings.SCREEN_WIDTH // 2) - 80, (settings.SCREEN_HEIGHT // 2) + 10))
 
         reset_button = pygame.Rect(150, 250, 200, 50)
-        reset_text = font.render("Reiniciar", True, self.COLOR_BUTTON_TEXT)
+        reset_text = TEXT_CACHE.render("Reiniciar", font, self.COLOR_BUTTON_TEXT)
 
         reset_button.x = (settings.SCREEN_WIDTH // 2) - (reset_button.width // 2) - 150
         reset_button.y = (settings.SCREEN_HEIGHT // 2) + 200
@@ -310,7 +294,7 @@ class Display(IDisplay):
         self.__screen.blit(reset_text, (reset_button.x + 40, reset_button.y + 10))
 
         quit_button = pygame.Rect(150, 250, 200, 50)
-        quit_text = font.render("Salir", True, self.COLOR_BUTTON_TEXT)
+        quit_text = TEXT_CACHE.render("Salir", font, self.COLOR_BUTTON_TEXT)
 
         quit_button.x = (settings.SCREEN_WIDTH // 2) - (quit_button.width // 2) + 150
         quit_button.y = (settings.SCREEN_HEIGHT // 2) + 200
@@ -341,10 +325,10 @@ class Display(IDisplay):
 
             upgrade_buttons: list[pygame.Rect] = []
 
-            font = pygame.font.Font(None, 36)
-            header_font = pygame.font.Font(None, 72)
+            font = TEXT_CACHE.font(36)
+            header_font = TEXT_CACHE.font(72)
 
-            header_text = header_font.render("Subiste de nivel!", True, (255, 255, 255))
+            header_text = TEXT_CACHE.render("Subiste de nivel!", header_font, (255, 255, 255))
 
             self.__screen.blit(header_text, ((settings.SCREEN_WIDTH // 2) - 190, (settings.SCREEN_HEIGHT // 2) - 60))
 
@@ -361,7 +345,7 @@ class Display(IDisplay):
                     # Draw the perk sprite to the left of the button
                     self.__screen.blit(perk_sprite.image, (upgrade_button.x - 50, upgrade_button.y))
 
-                upgrade_text = font.render(str(perks[i]), True, self.COLOR_BUTTON_TEXT)
+                upgrade_text = TEXT_CACHE.render(str(perks[i]), font, self.COLOR_BUTTON_TEXT)
                 pygame.draw.rect(self.__screen, self.COLOR_BUTTON, upgrade_button)
                 self.__screen.blit(upgrade_text, (upgrade_button.x + 40, upgrade_button.y + 10))
         else:
@@ -399,57 +383,203 @@ class Display(IDisplay):
         formatted_time = f"{minutes}:{seconds}"
         return formatted_time
 
-    def __draw_player_level_bar(self):
-        """Draws the player's level bar."""
-        bar_width = 400
-        bar_height = 25
+    def __draw_hud(self) -> list[pygame.Rect]:
+        """Draws the inventory, the clock and the level bar and returns the areas they cover."""
+        return self.__hud.draw(self.__screen, self.__scene.player, self.__time_as_text())
+
+    def __draw_profiler_overlay(self, profiler: FrameProfiler, box_x: int = 10):
+        """Draws the recent times of every stage of the game loop, or of the stages measured by a profiler."""
+        font = TEXT_CACHE.font(22)
+        line_height = 20
+        bar_max_width = 120
+        stages = profiler.stages
+
+        box_width = 380
+        box_height = (len(stages) + 1) * line_height + 10
+        box_y = settings.SCREEN_HEIGHT - box_height - 10
+
+        opacity_square = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        opacity_square.fill(self.COLOR_MENUS_BG)
+        self.__screen.blit(opacity_square, (box_x, box_y))
+
+        header = TEXT_CACHE.render(f"Presupuesto por etapa: {profiler.budget_ms:.2f} ms (F3)", font, (255, 255, 255))
+        self.__screen.blit(header, (box_x + 5, box_y + 5))
 
-        bar_x = 100
-        bar_y = 20
+        for i, stage in enumerate(stages):
+            stats = profiler.stats(stage)
+            y = box_y + 5 + (i + 1) * line_height
 
-        progress_percentage = self.__world.player.experience_progress
-        filled_width = int(bar_width * progress_percentage)
+            over_budget = stats['p95'] > profiler.budget_ms
+            color = (255, 120, 120) if over_budget else (255, 255, 255)
+            # The times change every frame, so caching them would only push the HUD texts out of the cache
+            text = font.render(f"{stage}: {profiler.last(stage):.2f}  p95 {stats['p95']:.2f}", True, color)
+            self.__screen.blit(text, (box_x + 5, y))
 
-        bar_color = (50, 205, 50)
-        bg_color = (105, 105, 105)
+            bar_width = int(bar_max_width * min(1, stats['p95'] / profiler.budget_ms))
+            pygame.draw.rect(self.__screen, color, (box_x + box_width - bar_max_width - 10, y + 3, bar_width, line_height - 8))
 
-        pygame.draw.rect(self.__screen, bg_color, (bar_x, bar_y, bar_width, bar_height))
+    def __draw_layer(self, entities: Sequence) -> list[tuple[int, pygame.Rect]]:
+        """Draws the entities of a layer that are inside the camera with a single `blits` call.
 
-        pygame.draw.rect(self.__screen, bar_color, (bar_x, bar_y, filled_width, bar_height))
+        The positions are plain tuples instead of moved copies of the rects, and the entities keep
+        their order so the overlaps look the same as drawing them one by one.
 
-        font = pygame.font.Font(None, 36)
-        level_text = font.render(f"Nivel {self.__world.player.level}", True, (255, 255, 255))
+        Returns:
+            list[tuple[int, pygame.Rect]]: The index and the world rect of every drawn entity.
+        """
+        camera_rect = self.camera.camera_rect
+        left = camera_rect.left
+        top = camera_rect.top
 
-        text_x = bar_x - 100
-        text_y = bar_y
+        sprites = [entity.sprite for entity in entities]
+        if self.__interpolation_alpha is None:
+            rects = [sprite.rect for sprite in sprites]
+        else:
+            rects = [self.__drawn_rect(sprite) for sprite in sprites]
+        visible = camera_rect.collidelistall(rects)
+
+        self.__screen.blits(
+            [(sprites[index].image, (rects[index].x - left, rects[index].y - top)) for index in visible],
+            doreturn=False,
+        )
+        return [(index, rects[index]) for index in visible]
+
+    def __visible_entities(self) -> dict[int, tuple]:
+        """Gets the entities inside the camera in drawing order, by their id.
+
+        Every entity has its screen rect, the screen area it covers with its health bar
+        and the state of how it looks, which changes whenever it has to be drawn again.
+        """
+        camera_rect = self.camera.camera_rect
+        bar_width = settings.TILE_WIDTH
+        entities = {}
+
+        scene = self.__scene
+        layers = (
+            (scene.items, False),
+            (scene.monsters, True),
+            (scene.bullets, False),
+            ((scene.player,), True),
+        )
+        for layer, has_health_bar in layers:
+            for entity in layer:
+                sprite = entity.sprite
+                world_rect = self.__drawn_rect(sprite)
+                if not camera_rect.colliderect(world_rect):
+                    continue
+
+                rect = self.camera.apply(world_rect)
+                area = rect
+                health = None
+                if has_health_bar:
+                    area = rect.union((rect.centerx - bar_width // 2, rect.bottom, bar_width, self.HEALTH_BAR_AREA_HEIGHT))
+                    health = entity.health
+
+                entities[id(entity)] = (entity, rect, area, (rect.x, rect.y, rect.w, rect.h, id(sprite.image), health))
+
+        return entities
+
+    def __can_render_dirty_rects(self) -> bool:
+        """If only what changed since the last frame can be drawn, because the camera and the ground are the same.
+
+        The entities of a snapshot are new every tick, so snapshots are always drawn in full frames.
+        """
+        return (
+            self.__snapshot is None
+            and self.__drawn_entities is not None
+            and self.__drawn_camera_rect == self.camera.camera_rect
+            and not self.__is_ground_outdated()
+        )
 
-        self.__screen.blit(level_text, (text_x + 2, text_y))
+    def __render_dirty_rects(self):
+        """Draws only the entities that moved or changed, and what they overlap, and updates only those areas."""
+        entities = self.__visible_entities()
+        drawn_entities = self.__drawn_entities
+
+        dirty = list(self.__drawn_hud)
+        for key, (_, _, area, state) in entities.items():
+            drawn = drawn_entities.pop(key, None)
+            if drawn is None:
+                dirty.append(area)
+            elif drawn[3] != state:
+                dirty.append(area)
+                dirty.append(drawn[2])
+        # The entities left were not drawn this time, so their old areas have to be erased
+        dirty.extend(drawn[2] for drawn in drawn_entities.values())
+
+        whole_screen = len(dirty) > self.MAX_DIRTY_RECTS
+        if whole_screen:
+            dirty = [self.__screen.get_rect()]
+
+        self.__restore_ground(dirty)
+
+        player = self.__scene.player
+        for entity, rect, area, _ in entities.values():
+            if not whole_screen and area.collidelist(dirty) == -1:
+                continue
+
+            if entity is player:
+                self.__draw_player()
+            else:
+                self.__screen.blit(entity.sprite.image, rect)
+                if area is not rect and entity.health != entity.max_health:
+                    self.__draw_monster_health_bar(entity, rect)
+
+        hud = self.__draw_hud()
+
+        self.__drawn_entities = entities
+        self.__drawn_hud = hud
+
+        pygame.display.update(dirty + hud)
+
+    def remember_positions(self):
+        self.__previous_positions = {
+            entity.sprite: (*entity.sprite.rect.topleft, entity.sprite.generation)
+            for layer in (self.__world.monsters, self.__world.bullets, (self.__world.player,))
+            for entity in layer
+        }
+
+    def __drawn_rect(self, sprite) -> pygame.Rect:
+        """Gets the world rect where a sprite is drawn, which is between its last two positions when interpolating."""
+        rect = sprite.rect
+        previous = self.__previous_positions.get(sprite) if self.__interpolation_alpha is not None else None
+        if previous is None or previous[2] != sprite.generation:
+            return rect
+
+        behind = 1 - self.__interpolation_alpha
+        return rect.move(round((previous[0] - rect.x) * behind), round((previous[1] - rect.y) * behind))
 
     def render_frame(self, paused = None, in_upgrade = None, dead = None, game = None):
-        self.camera.update(self.__world.player.sprite.rect)
+        # A snapshot only has the positions of a single tick
+        interpolating = game is not None and self.__snapshot is None and bool(self.__previous_positions)
+        self.__interpolation_alpha = game.timestep.alpha if interpolating else None
+
+        self.camera.update(self.__drawn_rect(self.__scene.player.sprite))
+
+        won = GameClockSingleton().game_clock > settings.WIN_TIME
+        profiler_visible = game is not None and game.profiler.overlay_visible
+        # Menus and overlays cover the whole screen, so they are always drawn in full frames
+        covered = in_upgrade != 0 or paused or dead or won or profiler_visible
+
+        if settings.DIRTY_RECT_RENDERING and not covered and self.__can_render_dirty_rects():
+            self.__render_dirty_rects()
+            return
 
         # Render the ground tiles
         self.__render_ground_tiles()
 
         # Draw all the experience gems
-        for item in self.__world.items:
-            if self.camera.camera_rect.colliderect(item.sprite.rect):
-                adjusted_rect = self.camera.apply(item.sprite.rect)
-                self.__screen.blit(item.sprite.image, adjusted_rect)
+        self.__draw_layer(self.__scene.items)
 
         # Draw all monsters
-        for monster in self.__world.monsters:
-            if self.camera.camera_rect.colliderect(monster.sprite.rect):
-                adjusted_rect = self.camera.apply(monster.sprite.rect)
-                self.__screen.blit(monster.sprite.image, adjusted_rect)
-                if monster.health != monster.max_health:
-                    self.__draw_monster_health_bar(monster)
+        monsters = self.__scene.monsters
+        for index, rect in self.__draw_layer(monsters):
+            monster = monsters[index]
+            if monster.health != monster.max_health:
+                self.__draw_monster_health_bar(monster, self.camera.apply(rect))
 
         # Draw the bullets
-        for bullet in self.__world.bullets:
-            if self.camera.camera_rect.colliderect(bullet.sprite.rect):
-                adjusted_rect = self.camera.apply(bullet.sprite.rect)
-                self.__screen.blit(bullet.sprite.image, adjusted_rect)
+        self.__draw_layer(self.__scene.bullets)
 
         # Draw the player
         self.__draw_player()
@@ -460,15 +590,26 @@ class Display(IDisplay):
         if paused:
             self.__draw_pause_menu(game)
 
-        self.__draw_player_inventory()
-        self.__draw_clock()
-        self.__draw_player_level_bar()
+        hud = self.__draw_hud()
 
-        if GameClockSingleton().game_clock > 180000:
+        if won:
             self.__draw_win_screen(game)
 
         if dead:
             self.__draw_game_over_screen(game)
 
+        if profiler_visible:
+            self.__draw_profiler_overlay(game.profiler)
+            if game.simulation_profiler is not game.profiler:
+                # The simulation thread measures its stages with its own profiler
+                self.__draw_profiler_overlay(game.simulation_profiler, box_x=400)
+
+        if settings.DIRTY_RECT_RENDERING:
+            # While the camera scrolls the next frame will be full too, so there is nothing to remember
+            scrolling = self.__drawn_camera_rect != self.camera.camera_rect
+            self.__drawn_entities = None if covered or scrolling else self.__visible_entities()
+            self.__drawn_hud = hud
+            self.__drawn_camera_rect = self.camera.camera_rect
+
         # Update the display
-        pygame.display.flip()
\ No newline at end of file
+        pygame.display.flip()
@@ -0,0 +1,38 @@
+"""Module for a display that doesn't draw anything."""
+
+import os
+
+import pygame
+
+from business.world.interfaces import IGameWorld
+from presentation.camera import Camera
+from presentation.interfaces import IDisplay
+
+class HeadlessDisplay(IDisplay):
+    """Display used to run the simulation without a window.
+
+    It only keeps the camera following the player, since the monster spawner uses it to place the monsters.
+    """
+
+    def __init__(self):
+        # Without a display, SDL only uses the dummy drivers if they are chosen before it starts
+        if not pygame.display.get_init():
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+            pygame.display.init()
+
+        # Sprites need a video mode to convert their images
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        self.__camera = Camera()
+        self.__world: IGameWorld = None
+
+    def load_world(self, world: IGameWorld):
+        self.__world = world
+
+    @property
+    def camera(self) -> Camera:
+        return self.__camera
+
+    def render_frame(self, paused = None, in_upgrade = None, dead = None, game = None):
+        self.camera.update(self.__world.player.sprite.rect)
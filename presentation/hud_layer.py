@@ -0,0 +1,144 @@
+"""Module that contains the HudLayer class."""
+
+import pygame
+
+import settings
+from business.entities.interfaces import IPlayer
+from presentation.text_cache import TEXT_CACHE
+
+class HudLayer:
+    """Draws the inventory, the level bar, the clock and the player health into cached surfaces.
+
+    The surfaces are only drawn again when the values they show change, so most frames
+    just blit them.
+    """
+
+    HEIGHT = 150
+    COLOR_OVERLAY = (0, 0, 0, 130)
+    HEALTH_BAR_WIDTH = settings.TILE_WIDTH
+    HEALTH_BAR_HEIGHT = 5
+    LEVEL_BAR_WIDTH = 400
+
+    def __init__(self):
+        self.__surface = pygame.Surface((settings.SCREEN_WIDTH, self.HEIGHT), pygame.SRCALPHA)
+        self.__areas: list[pygame.Rect] = []
+        self.__values = None
+        self.__health_surface: pygame.Surface | None = None
+        self.__health_offset = 0
+        self.__health_values = None
+        self.__redraws = 0
+
+    @property
+    def redraws(self) -> int:
+        """The amount of times any of the surfaces was drawn again."""
+        return self.__redraws
+
+    def draw(self, screen: pygame.Surface, player: IPlayer, time_text: str) -> list[pygame.Rect]:
+        """Draws the inventory, the level bar and the clock.
+
+        Args:
+            screen (pygame.Surface): The screen.
+            player (IPlayer): The player.
+            time_text (str): The game clock as text, which only changes every second.
+
+        Returns:
+            list[pygame.Rect]: The areas of the screen it covers.
+        """
+        filled_width = int(self.LEVEL_BAR_WIDTH * player.experience_progress)
+        values = (player.inventory_version, player.level, filled_width, time_text)
+        if values != self.__values:
+            self.__values = values
+            self.__redraw(player, filled_width, time_text)
+
+        return screen.blits([(self.__surface, area, area) for area in self.__areas])
+
+    def draw_player_health(self, screen: pygame.Surface, player: IPlayer, bar_x: int, bar_y: int):
+        """Draws the health bar and the health value of the player.
+
+        Args:
+            screen (pygame.Surface): The screen.
+            player (IPlayer): The player.
+            bar_x (int): The screen x-coordinate of the bar.
+            bar_y (int): The screen y-coordinate of the bar.
+        """
+        health_width = int(self.HEALTH_BAR_WIDTH * player.health / player.max_health)
+        values = (health_width, int(player.health))
+        if values != self.__health_values:
+            self.__health_values = values
+            self.__redraw_player_health(*values)
+
+        screen.blit(self.__health_surface, (bar_x - self.__health_offset, bar_y))
+
+    def __redraw(self, player: IPlayer, filled_width: int, time_text: str):
+        """Draws the inventory, the level bar and the clock into the cached surface."""
+        self.__redraws += 1
+        self.__surface.fill((0, 0, 0, 0))
+        bounds = self.__surface.get_rect()
+        self.__areas = [
+            self.__draw_inventory(player).clip(bounds),
+            self.__draw_clock(time_text).clip(bounds),
+            self.__draw_level_bar(player, filled_width).clip(bounds),
+        ]
+
+    def __redraw_player_health(self, health_width: int, health: int):
+        """Draws the player health bar and value into its cached surface."""
+        self.__redraws += 1
+
+        font = TEXT_CACHE.font(24)
+        text_surface = TEXT_CACHE.render(f"{health}", font, (255, 255, 255))
+        text_width, text_height = text_surface.get_size()
+
+        width = max(self.HEALTH_BAR_WIDTH, text_width)
+        self.__health_offset = (width - self.HEALTH_BAR_WIDTH) // 2
+        surface = pygame.Surface((width, self.HEALTH_BAR_HEIGHT + 5 + text_height), pygame.SRCALPHA)
+
+        pygame.draw.rect(surface, (255, 0, 0), (self.__health_offset, 0, self.HEALTH_BAR_WIDTH, self.HEALTH_BAR_HEIGHT))
+        pygame.draw.rect(surface, (0, 255, 0), (self.__health_offset, 0, health_width, self.HEALTH_BAR_HEIGHT))
+        surface.blit(text_surface, ((width - text_width) // 2, self.HEALTH_BAR_HEIGHT + 5))
+
+        self.__health_surface = surface
+
+    def __draw_inventory(self, player: IPlayer) -> pygame.Rect:
+        """Draws the player inventory and returns the area it covers."""
+        inventory = player.inventory
+
+        level_font = TEXT_CACHE.system_font(20)
+        title_text = TEXT_CACHE.render("Inventario:", level_font, (255, 255, 255))
+        title_rect = self.__surface.blit(title_text, (10, 50))
+
+        square_rect = pygame.Rect(10, 70, (len(inventory) * 55) + 10, 65)
+        self.__surface.fill(self.COLOR_OVERLAY, square_rect)
+
+        level_font = TEXT_CACHE.system_font(30)
+        for i, perk in enumerate(inventory):
+            perk_level = TEXT_CACHE.render(f"{perk.level}", level_font, (255, 255, 255))
+
+            self.__surface.blit(perk.sprite.image, (15 + (i * 55), 75))
+            self.__surface.blit(perk_level, (45 + (i * 55), 115))
+
+        return title_rect.union(square_rect)
+
+    def __draw_clock(self, time_text: str) -> pygame.Rect:
+        """Draws the clock and returns the area it covers."""
+        font = TEXT_CACHE.font(36)
+        text = TEXT_CACHE.render(time_text, font, (255, 255, 255))
+        text_width, text_height = text.get_size()
+
+        box_rect = pygame.Rect((settings.SCREEN_WIDTH - text_width) // 2 - 10, 10, text_width + 20, text_height + 10)
+        self.__surface.fill(self.COLOR_OVERLAY, box_rect)
+        self.__surface.blit(text, (box_rect.x + 10, box_rect.y + 5))
+
+        return box_rect
+
+    def __draw_level_bar(self, player: IPlayer, filled_width: int) -> pygame.Rect:
+        """Draws the player's level bar and returns the area it covers."""
+        bar_rect = pygame.Rect(100, 20, self.LEVEL_BAR_WIDTH, 25)
+
+        pygame.draw.rect(self.__surface, (105, 105, 105), bar_rect)
+        pygame.draw.rect(self.__surface, (50, 205, 50), (bar_rect.x, bar_rect.y, filled_width, bar_rect.height))
+
+        font = TEXT_CACHE.font(36)
+        level_text = TEXT_CACHE.render(f"Nivel {player.level}", font, (255, 255, 255))
+        text_rect = self.__surface.blit(level_text, (bar_rect.x - 100 + 2, bar_rect.y))
+
+        return bar_rect.union(text_rect)
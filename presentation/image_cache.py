@@ -0,0 +1,74 @@
+"""Module that contains the ImageCache class."""
+
+import pygame
+
+class ImageCache:
+    """Loads every image once and shares the surface between all the sprites that use it.
+
+    The surfaces are shared, so the sprites must copy them before drawing on them.
+    """
+
+    def __init__(self):
+        self.__surfaces: dict[tuple, pygame.Surface] = {}
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self):
+        return len(self.__surfaces)
+
+    @property
+    def hits(self) -> int:
+        """The amount of times an image was already loaded."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """The amount of times an image had to be loaded or scaled."""
+        return self.__misses
+
+    def get(self, path: str, size: tuple[int, int] | None = None,
+            tint: tuple[int, int, int] | None = None) -> pygame.Surface:
+        """Gets an image, loading it from disk only the first time.
+
+        Args:
+            path (str): The path of the image file.
+            size (tuple[int, int] | None): The size to scale the image to, or None to keep its size.
+            tint (tuple[int, int, int] | None): A color to multiply the image by, or None to keep its colors.
+
+        Returns:
+            pygame.Surface: The shared surface.
+        """
+        key = (path, size, tint)
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.__hits += 1
+            return surface
+
+        self.__misses += 1
+        if tint is not None:
+            surface = self.get(path, size).copy()
+            surface.fill(tint, special_flags=pygame.BLEND_RGBA_MULT)
+        elif size is not None:
+            surface = pygame.transform.scale(self.get(path), size)
+        else:
+            surface = pygame.image.load(path).convert_alpha()
+
+        self.__surfaces[key] = surface
+        return surface
+
+    def preload(self, images: list[tuple]):
+        """Loads images ahead of time, so getting them later doesn't read the disk.
+
+        Args:
+            images (list[tuple]): The arguments of `get` for every image.
+        """
+        for image in images:
+            self.get(*image)
+
+    def clear(self):
+        """Forgets every image and resets the counters."""
+        self.__surfaces.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+IMAGE_CACHE = ImageCache()
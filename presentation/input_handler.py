@@ -12,6 +12,8 @@ class InputHandler(IInputHandler):
 
     def __init__(self, world: IGameWorld):
         self.__world = world
+        self.__pause_key_down = False
+        self.__profiler_key_down = False
 
     def __get_player_movement(self, keys):
         """Converts input to player movement."""
@@ -52,9 +54,25 @@ class InputHandler(IInputHandler):
             self.__pause_key_down = False
         return False
 
-    def process_input(self):
-        """Process the inputs of the player."""
+    def is_profiler_toggle_pressed(self):
+        """Detects if F3 key has just been pressed."""
         keys = pygame.key.get_pressed()
+        if keys[pygame.K_F3]:
+            if not self.__profiler_key_down:
+                self.__profiler_key_down = True
+                return True
+        else:
+            self.__profiler_key_down = False
+        return False
+
+    def sample_input(self):
+        """Reads the keys that are being pressed."""
+        return pygame.key.get_pressed()
+
+    def process_input(self, keys = None):
+        """Process the inputs of the player."""
+        if keys is None:
+            keys = self.sample_input()
         self.__get_player_movement(keys)
 
     def process_pause(self, game: Game):
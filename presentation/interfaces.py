@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from business.world.interfaces import IGameWorld
+    from presentation.world_snapshot import WorldSnapshot
 
 
 class IDisplay(ABC):
@@ -25,6 +26,19 @@ class IDisplay(ABC):
     def render_frame(self):
         """Render the current frame."""
 
+    def show_snapshot(self, snapshot: "WorldSnapshot | None"):
+        """Draw the next frames from a snapshot of the world instead of the world itself.
+
+        Args:
+            snapshot (WorldSnapshot | None): The snapshot, or None to draw the world again.
+        """
+
+    def remember_positions(self):
+        """Remember where the entities are before a tick is simulated, to draw them between ticks.
+
+        Displays that don't interpolate the positions can ignore it.
+        """
+
     @property
     @abstractmethod
     def camera(self) -> Camera:
@@ -38,8 +52,20 @@ class IInputHandler(ABC):
     """Interface for handling user input."""
 
     @abstractmethod
-    def process_input(self):
-        """Process the input from the user."""
+    def sample_input(self):
+        """Read the state of the input devices, which can only be done from the main thread.
+
+        Returns:
+            The state, which doesn't change after it is read.
+        """
+
+    @abstractmethod
+    def process_input(self, keys = None):
+        """Process the input from the user.
+
+        Args:
+            keys: The state read by `sample_input`, or None to read it now.
+        """
 
     @abstractmethod
     def is_pause_pressed(self):
@@ -48,3 +74,7 @@ class IInputHandler(ABC):
     @abstractmethod
     def process_pause(self):
         """Toggles the paused state of the game."""
+
+    @abstractmethod
+    def is_profiler_toggle_pressed(self):
+        """If the profiler overlay button has just been pressed."""
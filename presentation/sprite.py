@@ -1,14 +1,31 @@
 """Module for the Sprite class."""
 
+import weakref
+
 import pygame
 
 import settings
-from presentation.tileset import Tileset
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
 
+UPGRADES_TILESET = ("./assets/upgrades_set.png", settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1)
+EXPERIENCE_GEMS_TILESET = ("./assets/experience_gems.png", settings.TILE_HEIGHT, settings.TILE_HEIGHT, 2, 2)
 
 class Sprite(pygame.sprite.Sprite):
     """A class representing a sprite."""
 
+    # pygame sprites have a __dict__ anyway, but the attributes of this class don't need it
+    __slots__ = (
+        '_image', '_rect', '__is_in_damage_countdown', '__is_in_heal_countdown', '__original_image', '__generation',
+        '__store', '__store_key', '__synced_version'
+    )
+
+    DAMAGE_COLOR = (255, 0, 0)
+    HEAL_COLOR = (0, 255, 0)
+
+    # The tinted versions of every image, shared by all the sprites with that image
+    __tinted_images: "weakref.WeakKeyDictionary[pygame.Surface, dict]" = weakref.WeakKeyDictionary()
+
     def __init__(self, image: pygame.Surface, rect: pygame.Rect, *groups):
         self._image: pygame.Surface = image
         self._rect: pygame.Rect = rect
@@ -16,6 +33,28 @@ class Sprite(pygame.sprite.Sprite):
         self.__is_in_damage_countdown = 0
         self.__is_in_heal_countdown = 0
         self.__original_image: pygame.Surface = image
+        self.__generation = 0
+        self.__store = None
+        self.__store_key = None
+        self.__synced_version = None
+
+    @property
+    def generation(self) -> int:
+        """The amount of times the sprite was reset, so a reused sprite can be told apart."""
+        return self.__generation
+
+    def reset(self, pos_x: float, pos_y: float):
+        """Restores the original image and moves the sprite, as if it was just created.
+
+        Args:
+            pos_x (float): The x-coordinate of the center.
+            pos_y (float): The y-coordinate of the center.
+        """
+        self.__is_in_damage_countdown = 0
+        self.__is_in_heal_countdown = 0
+        self._image = self.__original_image
+        self.update_pos(pos_x, pos_y)
+        self.__generation += 1
 
     @property
     def image(self) -> pygame.Surface:
@@ -29,6 +68,8 @@ class Sprite(pygame.sprite.Sprite):
     @property
     def rect(self) -> pygame.Rect:
         """The rect of the sprite."""
+        if self.__store is not None:
+            self.__sync_rect()
         return self._rect
 
     @rect.setter
@@ -39,15 +80,61 @@ class Sprite(pygame.sprite.Sprite):
         """Update the position of the sprite."""
         self._rect.center = (int(pos_x), int(pos_y))
 
+    def follow(self, store, key=None):
+        """Makes the rect follow a position kept by a store, which changes without `update_pos` being called.
+
+        The store has a `version` that changes every time its positions may have changed, and
+        `center_of(key)`. The rect is only moved when it is read, so a position that changes
+        many times between two reads is copied once, and one that is never read is never copied.
+
+        Args:
+            store: The store, or None to stop following it.
+            key: What the store knows the position by.
+        """
+        if self.__store is not None:
+            self.__sync_rect()
+        self.__store = store
+        self.__store_key = key
+        self.__synced_version = None if store is None else store.version
+
+    def __sync_rect(self):
+        """Moves the rect to the position in the followed store if it may have changed."""
+        store = self.__store
+        if store.version != self.__synced_version:
+            self.__synced_version = store.version
+            self._rect.center = store.center_of(self.__store_key)
+
     def __restore_image(self):
         """Restores the original image."""
-        self._image = self.__original_image.copy()
+        self._image = self.__original_image
 
     def __change_color(self, color: tuple[int, int, int]):
         """Changes the sprite color."""
-        self._image = self.__original_image.copy()
-        self._image.fill(color, special_flags=pygame.BLEND_MULT)
-        self._image.set_colorkey((0, 0, 0))
+        self._image = Sprite.tinted(self.__original_image, color)
+
+    @staticmethod
+    def tinted(image: pygame.Surface, color: tuple[int, int, int]) -> pygame.Surface:
+        """Gets an image multiplied by a color, creating it only the first time.
+
+        Args:
+            image (pygame.Surface): The original image.
+            color (tuple[int, int, int]): The color.
+
+        Returns:
+            pygame.Surface: The shared tinted image.
+        """
+        variants = Sprite.__tinted_images.get(image)
+        if variants is None:
+            variants = {}
+            Sprite.__tinted_images[image] = variants
+
+        tinted_image = variants.get(color)
+        if tinted_image is None:
+            tinted_image = image.copy()
+            tinted_image.fill(color, special_flags=pygame.BLEND_MULT)
+            tinted_image.set_colorkey((0, 0, 0))
+            variants[color] = tinted_image
+        return tinted_image
 
     def __decrease_damage_countdown(self):
         """Decreases the damaged state cooldown."""
@@ -65,12 +152,12 @@ class Sprite(pygame.sprite.Sprite):
 
     def take_damage(self):
         """Takes damage."""
-        self.__change_color((255, 0, 0))
+        self.__change_color(Sprite.DAMAGE_COLOR)
         self.__is_in_damage_countdown = 20
 
     def heal(self):
         """Heals the player by turning the sprite green for 0.2 seconds."""
-        self.__change_color((0, 255, 0))
+        self.__change_color(Sprite.HEAL_COLOR)
 
         self.__is_in_heal_countdown = 24
 
@@ -88,79 +175,107 @@ class PlayerSprite(Sprite):
     ASSET = "./assets/adventurer.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(PlayerSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(image, settings.TILE_DIMENSION)
+        image: pygame.Surface = PlayerSprite.scaled_image()
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
         super().__init__(image, rect)
 
+    @staticmethod
+    def scaled_image() -> pygame.Surface:
+        """Gets the image scaled to a tile."""
+        return IMAGE_CACHE.get(PlayerSprite.ASSET, settings.TILE_DIMENSION)
+
 class MonsterSprite(Sprite):
     """A class representing the monster sprite."""
 
     ASSET = "./assets/monster.png"
+    # The size of the monsters until the difficulty goes up
+    BASE_SIZE = 1
 
     def __init__(self, pos_x: float, pos_y: float, size: float):
-        image = pygame.image.load(MonsterSprite.ASSET).convert_alpha()
-        original_width, original_height = image.get_size()
+        image = MonsterSprite.scaled_image(size)
+        rect = image.get_rect(center=(int(pos_x), int(pos_y)))
+
+        super().__init__(image, rect)
+
+    @staticmethod
+    def scaled_image(size: float) -> pygame.Surface:
+        """Gets the image scaled to a size."""
+        original_width, original_height = IMAGE_CACHE.get(MonsterSprite.ASSET).get_size()
 
         new_width = int((original_width + 30) * size)
         new_height = int((original_height + 30) * size)
 
-        image = pygame.transform.scale(image, (new_width, new_height))
-        rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-
-        super().__init__(image, rect)
+        return IMAGE_CACHE.get(MonsterSprite.ASSET, (new_width, new_height))
 
 class GunMonsterSprite(Sprite):
     """A class representing the gun monster sprite."""
 
     ASSET = "./assets/gunmonster.png"
+    # The size of the gun monsters until the difficulty goes up
+    BASE_SIZE = 1
 
     def __init__(self, pos_x: float, pos_y: float, size: float):
-        image = pygame.image.load(GunMonsterSprite.ASSET).convert_alpha()
-        original_width, original_height = image.get_size()
+        image = GunMonsterSprite.scaled_image(size)
+        rect = image.get_rect(center=(int(pos_x), int(pos_y)))
+
+        super().__init__(image, rect)
+
+    @staticmethod
+    def scaled_image(size: float) -> pygame.Surface:
+        """Gets the image scaled to a size."""
+        original_width, original_height = IMAGE_CACHE.get(GunMonsterSprite.ASSET).get_size()
 
         new_width = int((original_width + 30) * size)
         new_height = int((original_height + 30) * size)
 
-        image = pygame.transform.scale(image, (new_width, new_height))
-        rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-
-        super().__init__(image, rect)
+        return IMAGE_CACHE.get(GunMonsterSprite.ASSET, (new_width, new_height))
 
 class BossMonsterSprite(Sprite):
     """A class representing the boss monster sprite."""
 
     ASSET = "./assets/boss1.png"
+    # The size of the boss, which doesn't change with the difficulty
+    BASE_SIZE = 5
 
     def __init__(self, pos_x: float, pos_y: float, size: float):
-        image = pygame.image.load(BossMonsterSprite.ASSET).convert_alpha()
-        original_width, original_height = image.get_size()
+        image = BossMonsterSprite.scaled_image(size)
+        rect = image.get_rect(center=(int(pos_x), int(pos_y)))
+
+        super().__init__(image, rect)
+
+    @staticmethod
+    def scaled_image(size: float) -> pygame.Surface:
+        """Gets the image scaled to a size."""
+        original_width, original_height = IMAGE_CACHE.get(BossMonsterSprite.ASSET).get_size()
 
         new_width = int(original_width * size)
         new_height = int(original_height * size)
 
-        image = pygame.transform.scale(image, (new_width, new_height))
-        rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-
-        super().__init__(image, rect)
+        return IMAGE_CACHE.get(BossMonsterSprite.ASSET, (new_width, new_height))
 
 class BigBossMonsterSprite(Sprite):
     """A class representing the big boss monster sprite."""
 
     ASSET = "./assets/boss2.png"
+    # The size of the big boss, which doesn't change with the difficulty
+    BASE_SIZE = 0.5
 
     def __init__(self, pos_x: float, pos_y: float, size: float):
-        image = pygame.image.load(BigBossMonsterSprite.ASSET).convert_alpha()
-        original_width, original_height = image.get_size()
+        image = BigBossMonsterSprite.scaled_image(size)
+        rect = image.get_rect(center=(int(pos_x), int(pos_y)))
+
+        super().__init__(image, rect)
+
+    @staticmethod
+    def scaled_image(size: float) -> pygame.Surface:
+        """Gets the image scaled to a size."""
+        original_width, original_height = IMAGE_CACHE.get(BigBossMonsterSprite.ASSET).get_size()
 
         new_width = int((original_width + 200) * size)
         new_height = int((original_height + 200) * size)
 
-        image = pygame.transform.scale(image, (new_width, new_height))
-        rect = image.get_rect(center=(int(pos_x), int(pos_y)))
-
-        super().__init__(image, rect)
+        return IMAGE_CACHE.get(BigBossMonsterSprite.ASSET, (new_width, new_height))
 
 class BulletSprite(Sprite):
     """A class representing the bullet sprite."""
@@ -168,9 +283,7 @@ class BulletSprite(Sprite):
     ASSET = "./assets/upgrades_set.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            BulletSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1
-        )
+        tileset = TILESETS.get(*UPGRADES_TILESET)
         image: pygame.Surface = tileset.get_tile(0)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -180,19 +293,22 @@ class MonsterBulletSprite(Sprite):
     """A class representing the monster bullet sprite."""
 
     ASSET = "./assets/monsterbullet.png"
+    TINT = (255, 150, 150)
 
     def __init__(self, pos_x: float, pos_y: float):
-        image = pygame.image.load(MonsterBulletSprite.ASSET).convert_alpha()
-        
-        scaled_width = int(image.get_width() * 0.3)
-        scaled_height = int(image.get_height() * 0.3)
-        image = pygame.transform.scale(image, (scaled_width, scaled_height))
-
-        image.fill((255, 150, 150), special_flags=pygame.BLEND_RGBA_MULT)
-
+        image = MonsterBulletSprite.scaled_image()
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
         super().__init__(image, rect)
+
+    @staticmethod
+    def scaled_image() -> pygame.Surface:
+        """Gets the image scaled down and tinted."""
+        image = IMAGE_CACHE.get(MonsterBulletSprite.ASSET)
+
+        scaled_width = int(image.get_width() * 0.3)
+        scaled_height = int(image.get_height() * 0.3)
+        return IMAGE_CACHE.get(MonsterBulletSprite.ASSET, (scaled_width, scaled_height), MonsterBulletSprite.TINT)
     
 class TurretBulletSprite(Sprite):
     """A class representing the turret bullet sprite."""
@@ -200,9 +316,7 @@ class TurretBulletSprite(Sprite):
     ASSET = "./assets/upgrades_set.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            TurretBulletSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1
-        )
+        tileset = TILESETS.get(*UPGRADES_TILESET)
         image: pygame.Surface = tileset.get_tile(3)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -214,9 +328,7 @@ class FollowingBulletSprite(Sprite):
     ASSET = "./assets/upgrades_set.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            FollowingBulletSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1
-        )
+        tileset = TILESETS.get(*UPGRADES_TILESET)
         image: pygame.Surface = tileset.get_tile(2)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -228,9 +340,7 @@ class ExperienceGemSprite(Sprite):
     ASSET = "./assets/experience_gems.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            ExperienceGemSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 2, 2
-        )
+        tileset = TILESETS.get(*EXPERIENCE_GEMS_TILESET)
         image: pygame.Surface = tileset.get_tile(3)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -242,9 +352,7 @@ class RedExperienceGemSprite(Sprite):
     ASSET = "./assets/experience_gems.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            RedExperienceGemSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 2, 2
-        )
+        tileset = TILESETS.get(*EXPERIENCE_GEMS_TILESET)
         image: pygame.Surface = tileset.get_tile(2)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -256,9 +364,7 @@ class GreenExperienceGemSprite(Sprite):
     ASSET = "./assets/experience_gems.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            GreenExperienceGemSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 2, 2
-        )
+        tileset = TILESETS.get(*EXPERIENCE_GEMS_TILESET)
         image: pygame.Surface = tileset.get_tile(1)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -270,9 +376,7 @@ class BlueExperienceGemSprite(Sprite):
     ASSET = "./assets/experience_gems.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            BlueExperienceGemSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 2, 2
-        )
+        tileset = TILESETS.get(*EXPERIENCE_GEMS_TILESET)
         image: pygame.Surface = tileset.get_tile(0)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -284,9 +388,7 @@ class GuaymallenSprite(Sprite):
     ASSET = "./assets/upgrades_set.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            BulletSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1
-        )
+        tileset = TILESETS.get(*UPGRADES_TILESET)
         image: pygame.Surface = tileset.get_tile(4)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -298,9 +400,7 @@ class RegenerationPerkSprite(Sprite):
     ASSET = "./assets/upgrades_set.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            RegenerationPerkSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1
-        )
+        tileset = TILESETS.get(*UPGRADES_TILESET)
         image: pygame.Surface = tileset.get_tile(5)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -312,9 +412,7 @@ class MaxHealthPerkSprite(Sprite):
     ASSET = "./assets/upgrades_set.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            MaxHealthPerkSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1
-        )
+        tileset = TILESETS.get(*UPGRADES_TILESET)
         image: pygame.Surface = tileset.get_tile(7)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -326,9 +424,7 @@ class DamageMultiplierPerkSprite(Sprite):
     ASSET = "./assets/upgrades_set.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            DamageMultiplierPerkSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1
-        )
+        tileset = TILESETS.get(*UPGRADES_TILESET)
         image: pygame.Surface = tileset.get_tile(1)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
@@ -340,10 +436,23 @@ class SpeedPerkSprite(Sprite):
     ASSET = "./assets/upgrades_set.png"
 
     def __init__(self, pos_x: float, pos_y: float):
-        tileset = Tileset(
-            SpeedPerkSprite.ASSET, settings.TILE_HEIGHT, settings.TILE_HEIGHT, 8, 1
-        )
+        tileset = TILESETS.get(*UPGRADES_TILESET)
         image: pygame.Surface = tileset.get_tile(6)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
         super().__init__(image, rect)
+
+def preload_images():
+    """Loads the image of every sprite, its tilesets and its scaled images, so creating sprites while playing doesn't read the disk.
+
+    The images are scaled to every size known before playing. The monsters spawned once the
+    difficulty goes up have a size that depends on the game clock, so each of those sizes is
+    scaled the first time a monster has it.
+    """
+    IMAGE_CACHE.preload([(sprite_type.ASSET,) for sprite_type in Sprite.__subclasses__()])
+    TILESETS.preload([UPGRADES_TILESET, EXPERIENCE_GEMS_TILESET])
+
+    PlayerSprite.scaled_image()
+    MonsterBulletSprite.scaled_image()
+    for sprite_type in (MonsterSprite, GunMonsterSprite, BossMonsterSprite, BigBossMonsterSprite):
+        sprite_type.scaled_image(sprite_type.BASE_SIZE)
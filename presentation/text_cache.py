@@ -0,0 +1,101 @@
+"""Module that contains the TextCache class."""
+
+from collections import OrderedDict
+
+import pygame
+
+class TextCache:
+    """Loads every font once and keeps the most recently rendered texts.
+
+    The rendered surfaces are shared, so they must not be drawn on.
+    """
+
+    MAX_TEXTS = 256
+
+    def __init__(self, max_texts: int = MAX_TEXTS):
+        self.__max_texts = max_texts
+        self.__fonts: dict[tuple, pygame.font.Font] = {}
+        self.__texts: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self):
+        return len(self.__texts)
+
+    @property
+    def hits(self) -> int:
+        """The amount of texts that were already rendered."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """The amount of texts that had to be rendered."""
+        return self.__misses
+
+    def font(self, size: int, name: str | None = None) -> pygame.font.Font:
+        """Gets a font from a file, loading it only the first time.
+
+        Args:
+            size (int): The size of the font.
+            name (str | None): The path of the font file, or None for the default font.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        key = ('file', name, size)
+        font = self.__fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.__fonts[key] = font
+        return font
+
+    def system_font(self, size: int, name: str | None = None) -> pygame.font.Font:
+        """Gets a system font, looking it up only the first time.
+
+        Args:
+            size (int): The size of the font.
+            name (str | None): The name of the system font, or None for the default font.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        key = ('system', name, size)
+        font = self.__fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            self.__fonts[key] = font
+        return font
+
+    def render(self, text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+        """Renders an antialiased text, or gets it if it was rendered recently.
+
+        Args:
+            text (str): The text.
+            font (pygame.font.Font): The font, which should come from this cache.
+            color (tuple): The color of the text.
+
+        Returns:
+            pygame.Surface: The shared rendered text.
+        """
+        key = (text, font, color)
+        surface = self.__texts.get(key)
+        if surface is not None:
+            self.__hits += 1
+            self.__texts.move_to_end(key)
+            return surface
+
+        self.__misses += 1
+        surface = font.render(text, True, color)
+        self.__texts[key] = surface
+        if len(self.__texts) > self.__max_texts:
+            self.__texts.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Forgets every font and text and resets the counters."""
+        self.__fonts.clear()
+        self.__texts.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+TEXT_CACHE = TextCache()
@@ -2,6 +2,8 @@
 
 import pygame
 
+from presentation.image_cache import IMAGE_CACHE
+
 
 class Tileset:
     """A class representing a tileset."""
@@ -11,8 +13,7 @@ class Tileset:
         self.tile_height = tile_height
         self.tiles = []
 
-        image = pygame.image.load(filename).convert_alpha()
-        image = pygame.transform.scale(image, (columns * tile_width, rows * tile_height))
+        image = IMAGE_CACHE.get(filename, (columns * tile_width, rows * tile_height))
         image_width, image_height = image.get_size()
 
         for y in range(0, image_height, tile_height):
@@ -24,3 +25,48 @@ class Tileset:
     def get_tile(self, index):
         """Get a tile by index."""
         return self.tiles[index]
+
+
+class TilesetRegistry:
+    """Slices every tileset once and shares its tiles between all the sprites that use it."""
+
+    def __init__(self):
+        self.__tilesets: dict[tuple, Tileset] = {}
+
+    def __len__(self):
+        return len(self.__tilesets)
+
+    def get(self, filename, tile_width, tile_height, columns, rows) -> Tileset:
+        """Gets a tileset, creating it only the first time.
+
+        Args:
+            filename (str): The path of the image file.
+            tile_width (int): The width of every tile.
+            tile_height (int): The height of every tile.
+            columns (int): The amount of tile columns in the image.
+            rows (int): The amount of tile rows in the image.
+
+        Returns:
+            Tileset: The shared tileset.
+        """
+        key = (filename, tile_width, tile_height, columns, rows)
+        tileset = self.__tilesets.get(key)
+        if tileset is None:
+            tileset = Tileset(*key)
+            self.__tilesets[key] = tileset
+        return tileset
+
+    def preload(self, tilesets: list[tuple]):
+        """Creates tilesets ahead of time.
+
+        Args:
+            tilesets (list[tuple]): The arguments of `get` for every tileset.
+        """
+        for tileset in tilesets:
+            self.get(*tileset)
+
+    def clear(self):
+        """Forgets every tileset."""
+        self.__tilesets.clear()
+
+TILESETS = TilesetRegistry()
@@ -0,0 +1,147 @@
+"""Module with the snapshots of the world that the renderer draws while the simulation runs in another thread."""
+
+import threading
+from typing import NamedTuple
+
+import pygame
+
+from business.entities.interfaces import IPlayer
+from business.world.interfaces import IGameWorld
+
+class SpriteSnapshot(NamedTuple):
+    """Where a sprite was and how it looked."""
+
+    rect: pygame.Rect
+    image: pygame.Surface
+
+class EntitySnapshot(NamedTuple):
+    """What is drawn of an entity."""
+
+    sprite: SpriteSnapshot
+    health: float | None = None
+    max_health: float | None = None
+
+class PerkSnapshot(NamedTuple):
+    """What the inventory shows of a perk."""
+
+    sprite: SpriteSnapshot
+    level: int
+
+class PlayerSnapshot(NamedTuple):
+    """What is drawn of the player, including the values of the HUD."""
+
+    sprite: SpriteSnapshot
+    health: float
+    max_health: float
+    level: int
+    experience_progress: float
+    inventory: tuple[PerkSnapshot, ...]
+    inventory_version: int
+    pos_x: float
+    pos_y: float
+
+class WorldSnapshot(NamedTuple):
+    """The state of the world after a tick, with the same attributes the display reads from the world.
+
+    The rects are copies, and the images are shared surfaces that nobody draws on, so a snapshot
+    doesn't change after it is taken.
+    """
+
+    tick: int
+    items: tuple[EntitySnapshot, ...]
+    monsters: tuple[EntitySnapshot, ...]
+    bullets: tuple[EntitySnapshot, ...]
+    player: PlayerSnapshot
+
+    @staticmethod
+    def capture(world: IGameWorld, tick: int, previous: "WorldSnapshot | None" = None) -> "WorldSnapshot":
+        """Takes a snapshot of the world.
+
+        Args:
+            world (IGameWorld): The world, which must not change while it is captured.
+            tick (int): The number of the simulated tick.
+            previous (WorldSnapshot | None): The last snapshot, to reuse its inventory if it didn't change.
+
+        Returns:
+            WorldSnapshot: The snapshot.
+        """
+        return WorldSnapshot(
+            tick,
+            tuple(EntitySnapshot(SpriteSnapshot(item.sprite.rect.copy(), item.sprite.image)) for item in world.items),
+            tuple(
+                EntitySnapshot(SpriteSnapshot(monster.sprite.rect.copy(), monster.sprite.image), monster.health, monster.max_health)
+                for monster in world.monsters
+            ),
+            tuple(EntitySnapshot(SpriteSnapshot(bullet.sprite.rect.copy(), bullet.sprite.image)) for bullet in world.bullets),
+            WorldSnapshot.__capture_player(world.player, previous.player if previous else None),
+        )
+
+    @staticmethod
+    def __capture_player(player: IPlayer, previous: PlayerSnapshot | None) -> PlayerSnapshot:
+        """Takes a snapshot of the player."""
+        if previous is not None and previous.inventory_version == player.inventory_version:
+            inventory = previous.inventory
+        else:
+            inventory = tuple(PerkSnapshot(SpriteSnapshot(None, perk.sprite.image), perk.level) for perk in player.inventory)
+
+        return PlayerSnapshot(
+            SpriteSnapshot(player.sprite.rect.copy(), player.sprite.image),
+            player.health,
+            player.max_health,
+            player.level,
+            player.experience_progress,
+            inventory,
+            player.inventory_version,
+            player.pos_x,
+            player.pos_y,
+        )
+
+class SnapshotBuffer:
+    """Double buffer between the simulation, which publishes a snapshot after every tick, and the renderer.
+
+    The simulation writes the back slot and then swaps the slots, so the renderer always gets the
+    latest complete snapshot without waiting for a tick to finish.
+    """
+
+    def __init__(self):
+        self.__slots: list[WorldSnapshot | None] = [None, None]
+        self.__front = 0
+        self.__lock = threading.Lock()
+        self.__published = 0
+        self.__skipped = 0
+        self.__front_read = True
+
+    @property
+    def published(self) -> int:
+        """The amount of published snapshots."""
+        return self.__published
+
+    @property
+    def skipped(self) -> int:
+        """The amount of snapshots that were replaced before being read."""
+        return self.__skipped
+
+    def publish(self, snapshot: WorldSnapshot):
+        """Makes a snapshot the latest one.
+
+        Args:
+            snapshot (WorldSnapshot): The snapshot.
+        """
+        back = 1 - self.__front
+        self.__slots[back] = snapshot
+        with self.__lock:
+            if not self.__front_read:
+                self.__skipped += 1
+            self.__front = back
+            self.__front_read = False
+            self.__published += 1
+
+    def latest(self) -> WorldSnapshot | None:
+        """Gets the latest snapshot.
+
+        Returns:
+            WorldSnapshot | None: The snapshot, or None if nothing was published yet.
+        """
+        with self.__lock:
+            self.__front_read = True
+            return self.__slots[self.__front]
@@ -9,7 +9,8 @@ from business.handlers.clock import GameClockSingleton
 from game import Game
 from presentation.display import Display
 from presentation.input_handler import InputHandler
-from presentation.sprite import PlayerSprite
+from presentation.sprite import PlayerSprite, preload_images
+from persistence.binarydao import GameBinaryDAO
 from persistence.gamedao import GameJSONDAO
 
 def initialize_player(saved_data: dict | None):
@@ -28,20 +29,25 @@ def main():
     """Main function to run the game"""
     pygame.init()
 
-    partidadao = GameJSONDAO()
+    partidadao = GameBinaryDAO() if settings.BINARY_SAVES else GameJSONDAO()
 
     saved_data = partidadao.load_game()
     time = saved_data.get('clock')
     GameClockSingleton(time)
 
     display = Display()
+    preload_images()
     world = initialize_game_world(display, saved_data)
     display.load_world(world)
     input_handler = InputHandler(world)
 
     game = Game(world, input_handler, partidadao)
 
-    event = game.run()
+    try:
+        event = game.run()
+    finally:
+        # Writes the save that is still pending and stops its thread
+        game.autosave.close()
 
     if event == Game.RESET_EVENT:
         GameClockSingleton().reset()
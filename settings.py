@@ -2,7 +2,27 @@
 
 # Display
 GAME_TITLE = "Tuki Survivors"
-FPS = 60
+FPS = 60  # Frames rendered per second
+DIRTY_RECT_RENDERING = False  # Update only the screen areas that changed while the camera doesn't move
+
+# Game
+WIN_TIME = 180000  # Game clock ms the player has to survive to win
+MAX_MONSTERS = 20  # The spawner stops while there are more monsters than this
+AUTOSAVE_INTERVAL = 30000  # Game clock ms between autosaves, 0 turns them off
+BINARY_SAVES = False  # Save the entities as binary columns in data/game.sav instead of JSON in data/game.json
+
+# Simulation
+SIMULATION_RATE = 60  # Ticks simulated per second, it can be lower than the FPS to save CPU
+SPEED_SCALE = 60 / SIMULATION_RATE  # The speeds are in pixels per tick at 60 ticks per second
+# Draw the entities between their last two positions. Even with SIMULATION_RATE == FPS the frames don't last
+# exactly one tick, so without it some frames simulate no tick and others two, which is seen as stutter.
+# It costs remembering every position once a frame and moving every drawn rect.
+INTERPOLATE_POSITIONS = True
+THREADED_SIMULATION = False  # Simulate in a worker thread while the main thread draws the latest snapshot
+MAX_CATCH_UP_STEPS = 5  # Most simulation steps run in a single frame to catch up with the real time
+MONSTER_STORE = True  # Move the monsters with NumPy arrays, only used if NumPy is installed
+PROJECTILE_STORE = True  # Move the straight bullets with NumPy arrays, only used if NumPy is installed
+ENTITY_POOLS = True  # Reuse the removed bullets, gems and monsters instead of creating new ones
 
 # Tile dimensions
 TILE_HEIGHT = 48  # 32
@@ -0,0 +1,187 @@
+import unittest
+import os
+import json
+import stat
+import tempfile
+import threading
+import settings
+from unittest.mock import patch
+from business.handlers.clock import GameClockSingleton
+from persistence.autosave import Autosave
+from persistence.daointerfaces import IGameDAO
+from persistence.gamedao import GameJSONDAO
+
+class FakeGameDAO(IGameDAO):
+    def __init__(self):
+        self.snapshots = 0
+        self.written = []
+        self.writing = threading.Event()
+        self.can_write = threading.Event()
+        self.can_write.set()
+        self.fail = False
+
+    def snapshot(self, game):
+        self.snapshots += 1
+        return {'snapshot': self.snapshots}
+
+    def write_snapshot(self, snapshot):
+        self.write(snapshot)
+
+    def write(self, snapshot):
+        self.writing.set()
+        self.can_write.wait()
+        if self.fail:
+            raise OSError("disk full")
+        self.written.append(snapshot)
+
+    def load_game(self):
+        return {}
+
+    def clear_save(self):
+        pass
+
+class TestAutosave(unittest.TestCase):
+    def setUp(self):
+        GameClockSingleton().reset()
+        self.dao = FakeGameDAO()
+        self.autosave = Autosave(self.dao, interval_ms=100)
+
+    def tearDown(self):
+        self.dao.can_write.set()
+        self.autosave.close()
+
+    def advance(self, ms):
+        for _ in range(round(ms * settings.SIMULATION_RATE / 1000)):
+            GameClockSingleton().update()
+
+    def test_update_saves_after_the_interval(self):
+        self.autosave.update(None)
+        self.autosave.wait()
+        self.assertEqual(self.dao.written, [])
+
+        self.advance(100)
+        self.autosave.update(None)
+        self.autosave.wait()
+
+        self.assertEqual(self.dao.written, [{'snapshot': 1}])
+        self.assertEqual(self.autosave.writes, 1)
+
+    def test_zero_interval_never_saves(self):
+        autosave = Autosave(self.dao, interval_ms=0)
+        self.advance(1000)
+
+        autosave.update(None)
+
+        self.assertEqual(self.dao.snapshots, 0)
+
+    def test_snapshot_is_written_in_another_thread(self):
+        self.dao.can_write.clear()
+
+        self.autosave.save(None)
+
+        self.assertTrue(self.dao.writing.wait(1))
+        self.assertTrue(self.autosave.busy)
+        self.dao.can_write.set()
+        self.autosave.wait()
+        self.assertFalse(self.autosave.busy)
+        self.assertEqual(self.dao.written, [{'snapshot': 1}])
+
+    def test_saves_during_a_write_are_coalesced(self):
+        self.dao.can_write.clear()
+        self.autosave.save(None)
+        self.assertTrue(self.dao.writing.wait(1))
+
+        self.autosave.save(None)
+        self.autosave.save(None)
+        self.dao.can_write.set()
+        self.autosave.wait()
+
+        self.assertEqual(self.dao.written, [{'snapshot': 1}, {'snapshot': 3}])
+        self.assertEqual(self.autosave.coalesced, 1)
+
+    def test_due_save_waits_for_the_running_write(self):
+        self.dao.can_write.clear()
+        self.autosave.save(None)
+        self.assertTrue(self.dao.writing.wait(1))
+
+        self.advance(100)
+        self.autosave.update(None)
+        self.autosave.update(None)
+
+        self.assertEqual(self.dao.snapshots, 1)
+        self.assertEqual(self.autosave.coalesced, 1)
+
+        self.dao.can_write.set()
+        self.autosave.wait()
+        self.autosave.update(None)
+        self.autosave.wait()
+
+        self.assertEqual(self.dao.snapshots, 2)
+        self.assertEqual(self.autosave.writes, 2)
+
+    def test_failed_write_is_logged_and_not_counted(self):
+        self.dao.fail = True
+
+        with self.assertLogs('Autosave', level='ERROR'):
+            self.autosave.save(None)
+            self.autosave.wait()
+
+        self.assertEqual(self.autosave.writes, 0)
+
+    def test_close_writes_the_pending_snapshot_and_stops_the_thread(self):
+        self.dao.can_write.clear()
+        self.autosave.save(None)
+        self.assertTrue(self.dao.writing.wait(1))
+        self.autosave.save(None)
+
+        self.dao.can_write.set()
+        self.autosave.close()
+
+        self.assertEqual(self.dao.written, [{'snapshot': 1}, {'snapshot': 2}])
+        self.assertNotIn('autosave', [thread.name for thread in threading.enumerate()])
+
+        self.autosave.save(None)
+        self.autosave.close()
+        self.assertEqual(self.dao.written[-1], {'snapshot': 3})
+
+class TestAtomicSave(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'save.json')
+        self.dao = GameJSONDAO(json_path=self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_replaces_the_save_without_leaving_temporary_files(self):
+        self.dao.write({'clock': 1})
+        self.dao.write({'clock': 2})
+
+        self.assertEqual(os.listdir(self.directory.name), ['save.json'])
+        with open(self.path, 'r', encoding="utf-8") as file:
+            self.assertEqual(json.load(file), {'clock': 2})
+
+    def test_write_keeps_the_permissions_of_the_save(self):
+        self.dao.write({'clock': 1})
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o666 & ~umask)
+
+        os.chmod(self.path, 0o640)
+        self.dao.write({'clock': 2})
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    def test_failed_write_keeps_the_previous_save(self):
+        self.dao.write({'clock': 1})
+
+        with patch('persistence.gamedao.json.dump', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.dao.write({'clock': 2})
+
+        self.assertEqual(os.listdir(self.directory.name), ['save.json'])
+        with open(self.path, 'r', encoding="utf-8") as file:
+            self.assertEqual(json.load(file), {'clock': 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+import os
+import tempfile
+import pygame
+from unittest.mock import Mock
+from business.entities.bullets import NormalBullet, TurretBullet, FollowingBullet
+from business.entities.items.experience_gem import ExperienceGem, RedExperienceGem, BlueExperienceGem
+from business.entities.items.guaymallen import Guaymallen
+from business.entities.monsters.bullets import MonsterBullet
+from business.entities.monsters.gunner import GunMonster
+from business.entities.monsters.monster import Monster
+from business.handlers.clock import GameClockSingleton
+from persistence.binarydao import GameBinaryDAO
+from persistence.gamedao import GameJSONDAO
+from presentation.headless_display import HeadlessDisplay
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
+from runner import initialize_game_world
+
+class TestGameBinaryDAO(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'game.sav')
+        self.dao = GameBinaryDAO(save_path=self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_new_save_is_empty(self):
+        self.assertEqual(self.dao.load_game(), GameBinaryDAO.BASE_GAME_DATA)
+
+    def test_write_and_load_keep_every_value(self):
+        data = {
+            'monsters': {
+                'monster': [{'pos_x': 1.5, 'pos_y': 2, 'health': 10, 'attack_cooldown': 16.5}],
+                'gunner': [{'pos_x': 3.0, 'pos_y': 4.0, 'health': 5, 'inventory': {'gun': {'level': 1}}}],
+            },
+            'bullets': {'bullet': [{'pos_x': 1.0, 'pos_y': 2.0, 'damage': 2 ** 40}, {'pos_x': 3.0, 'pos_y': 4.0, 'damage': 1}]},
+            'items': {},
+            'monster_spawner': {'minute_boss_added': True, 'second_minute_boss_added': False},
+            'player': {'pos_x': 10, 'pos_y': 20, 'static': {}},
+            'clock': 1000.5,
+        }
+
+        self.dao.write(data)
+
+        self.assertEqual(self.dao.load_game(), data)
+
+    def test_write_keeps_the_other_saved_keys(self):
+        self.dao.write({'clock': 1, 'settings': {'volume': 3}, 'monsters': {'monster': [{'pos_x': 1.0}]}})
+
+        self.dao.write({'clock': 2, 'monsters': {}})
+
+        self.assertEqual(self.dao.load_game(), {'clock': 2, 'settings': {'volume': 3}, 'monsters': {}})
+
+    def test_file_starts_with_the_header(self):
+        self.dao.write({'clock': 0, 'monsters': {'monster': [{'pos_x': 1.0, 'pos_y': 2.0}]}})
+
+        with open(self.path, 'rb') as file:
+            magic, version, _ = GameBinaryDAO.PREAMBLE.unpack(file.read(GameBinaryDAO.PREAMBLE.size))
+
+        self.assertEqual((magic, version), (GameBinaryDAO.MAGIC, GameBinaryDAO.VERSION))
+
+    def test_numeric_columns_are_not_in_the_header(self):
+        rows = [{'pos_x': float(i), 'pos_y': float(i)} for i in range(1000)]
+        self.dao.write({'monsters': {'monster': rows}})
+
+        self.assertLess(os.path.getsize(self.path), 1000 * 2 * 8 + 200)
+
+    def test_newer_version_is_not_loaded(self):
+        with open(self.path, 'wb') as file:
+            file.write(GameBinaryDAO.PREAMBLE.pack(GameBinaryDAO.MAGIC, GameBinaryDAO.VERSION + 1, 2) + b'{}')
+
+        with self.assertRaises(ValueError):
+            self.dao.load_game()
+
+    def test_other_file_is_not_loaded(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'{"monsters": {}, "bullets": {}}')
+
+        with self.assertRaises(ValueError):
+            self.dao.load_game()
+
+    def test_clear_save(self):
+        self.dao.write({'clock': 10, 'monsters': {}})
+
+        self.dao.clear_save()
+
+        self.assertEqual(self.dao.load_game(), GameBinaryDAO.BASE_GAME_DATA)
+
+class TestGameBinaryDAORestore(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        GameClockSingleton().reset()
+        self.display = HeadlessDisplay()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.dao = GameBinaryDAO(save_path=os.path.join(self.directory.name, 'game.sav'))
+        self.json_dao = GameJSONDAO(json_path=os.path.join(self.directory.name, 'game.json'))
+
+    def tearDown(self):
+        self.directory.cleanup()
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.quit()
+
+    @staticmethod
+    def entities(world) -> dict:
+        return {
+            'monsters': sorted(str(monster.to_json()) for monster in world.monsters),
+            'bullets': sorted(str(bullet.to_json()) for bullet in world.bullets),
+            'items': sorted(str(item.to_json()) for item in world.items),
+        }
+
+    def test_saved_world_is_restored_like_the_json_save(self):
+        world = initialize_game_world(self.display, {})
+        monster = Monster(100, 200)
+        monster.take_damage(1)
+        world.add_monster(monster)
+        world.add_monster(GunMonster(300, 400))
+        world.add_bullet(NormalBullet(10, 10, 50, 60, 4, 5, 50))
+        world.add_bullet(TurretBullet(10, 10, 70, 20, 10, 3, 5))
+        world.add_bullet(FollowingBullet(30, 30, None, 3, 10, 20))
+        world.add_bullet(MonsterBullet(40, 40, 10, 10, 5, 4, 1))
+        world.add_item(ExperienceGem(5, 6, 1))
+        world.add_item(RedExperienceGem(7, 8, 2))
+        world.add_item(BlueExperienceGem(9, 10, 3))
+        world.add_item(Guaymallen(11, 12))
+        world.flush_changes()
+
+        self.dao.save_game(Mock(world=world))
+        self.json_dao.save_game(Mock(world=world))
+        restored = initialize_game_world(self.display, self.dao.load_game())
+        restored_from_json = initialize_game_world(self.display, self.json_dao.load_game())
+
+        self.assertEqual(len(restored.monsters), 2)
+        self.assertEqual(len(restored.bullets), 4)
+        self.assertEqual(len(restored.items), 4)
+        self.assertEqual(self.entities(restored), self.entities(restored_from_json))
+        self.assertEqual(restored.player.to_json(), restored_from_json.player.to_json())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@ import unittest
 import pygame
 from unittest.mock import patch, MagicMock
 from business.entities.bullets import NormalBullet
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
 
 class TestBullet(unittest.TestCase):
     @patch('pygame.transform.scale')
@@ -79,6 +81,9 @@ class TestBullet(unittest.TestCase):
         self.assertAlmostEqual(y, 5.707, 2)
 
     def tearDown(self):
+        # The loaded images are mocks, so they must not stay in the shared caches
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
         pygame.display.quit()
         pygame.quit()
 
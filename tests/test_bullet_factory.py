@@ -17,7 +17,7 @@ class TestNormalBulletFactory(unittest.TestCase):
         self.player.pos_y = 0
         self.player.inventory = []
 
-        self.world = Mock()
+        self.world = Mock(monster_index=None)
         self.world.monsters = []
 
         self.bullet_factory = NormalBulletFactory(self.player)
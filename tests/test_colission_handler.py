@@ -1,5 +1,7 @@
+import random
 import unittest
 from unittest.mock import Mock, create_autospec
+import pygame
 from business.entities.interfaces import IBullet, IMonster, IPlayer, IItem
 from business.entities.monsters.interfaces import IMonsterBullet
 from business.world.interfaces import IGameWorld
@@ -82,5 +84,41 @@ class TestCollisionHandler(unittest.TestCase):
         self.player.pickup_item.assert_not_called()
         self.world.remove_item.assert_not_called()
 
+    def test_spatial_hash_gives_same_hits_as_brute_force(self):
+        random.seed(7)
+
+        def create_entities(spec, amount, size):
+            entities = []
+            for _ in range(amount):
+                entity = create_autospec(spec)
+                entity.damage_amount = 1
+                entity.sprite = Mock()
+                entity.sprite.rect = pygame.Rect(random.randint(0, 600), random.randint(0, 600), size, size)
+                entities.append(entity)
+            return entities
+
+        monsters = create_entities(IMonster, 80, 48)
+        bullets = create_entities(IBullet, 60, 20) + create_entities(IMonsterBullet, 10, 10)
+        player = create_autospec(IPlayer)
+        player.sprite = Mock()
+        player.sprite.rect = pygame.Rect(300, 300, 48, 48)
+
+        def hits():
+            calls = [(monster, call) for monster in monsters for call in monster.take_damage.call_args_list]
+            calls += [(bullet, call) for bullet in bullets for call in bullet.take_damage.call_args_list]
+            calls += [(player, call) for call in player.take_damage.call_args_list]
+            for entity in monsters + bullets + [player]:
+                entity.take_damage.reset_mock()
+            return calls
+
+        CollisionHandler._CollisionHandler__handle_bullets_brute_force(bullets, monsters, player)
+        brute_force_hits = hits()
+
+        CollisionHandler._CollisionHandler__handle_bullets_spatial_hash(bullets, monsters, player)
+        spatial_hash_hits = hits()
+
+        self.assertTrue(brute_force_hits)
+        self.assertEqual(brute_force_hits, spatial_hash_hits)
+
 if __name__ == '__main__':
     unittest.main()
@@ -21,7 +21,7 @@ class TestDeathHandler(unittest.TestCase):
         pygame.quit()
 
     def setUp(self):
-        self.world = Mock()
+        self.world = Mock(projectile_store=None)
         self.bullet = NormalBullet(0, 0, 0, 0, 0, 0, 10)
         self.item = ExperienceGem(0, 0, 0)
 
@@ -43,8 +43,8 @@ class TestDeathHandler(unittest.TestCase):
     @patch('business.handlers.boundaries_handler.BoundariesHandler.is_entity_within_world_boundaries', return_value=False)
     def test_remove_bullet_when_out_of_bounds(self, mock_is_within_bounds):
         self.bullet._NormalBullet__health = 10
-        self.bullet.can_despawn = False
-        DeathHandler.check_deaths(self.world)
+        with patch.object(NormalBullet, 'can_despawn', False, create=True):
+            DeathHandler.check_deaths(self.world)
         self.world.remove_bullet.assert_called_once_with(self.bullet)
 
     @patch.object(ExperienceGem, 'can_despawn', new_callable=PropertyMock)
@@ -0,0 +1,202 @@
+import os
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+import settings
+from business.entities.monsters.monster import Monster
+from business.handlers.clock import GameClockSingleton
+from business.handlers.frame_profiler import FrameProfiler
+from presentation.display import Display
+from presentation.image_cache import IMAGE_CACHE
+from presentation.text_cache import TEXT_CACHE
+from presentation.tileset import TILESETS
+from presentation.world_snapshot import WorldSnapshot
+from runner import initialize_game_world
+
+class TestDisplayDirtyRects(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+        GameClockSingleton().reset()
+
+        self.display = Display()
+        self.world = initialize_game_world(self.display, {})
+        self.display.load_world(self.world)
+
+        self.monster = Monster(300, 300)
+        self.world.add_monster(self.monster)
+        self.world.add_monster(Monster(900, 500))
+        self.world.flush_changes()
+
+        self.dirty_rect_rendering = settings.DIRTY_RECT_RENDERING
+        settings.DIRTY_RECT_RENDERING = True
+
+    def tearDown(self):
+        # The fonts can't be used after pygame.quit
+        TEXT_CACHE.clear()
+        settings.DIRTY_RECT_RENDERING = self.dirty_rect_rendering
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.quit()
+
+    def __render(self, **kwargs):
+        with patch('pygame.display.flip') as flip, patch('pygame.display.update') as update:
+            self.display.render_frame(False, 0, False, **kwargs)
+        return flip, update
+
+    def __render_still_camera(self):
+        """Renders the first frames, which are full until the camera has been still for a frame."""
+        self.__render()
+        self.__render()
+
+    def __full_frame(self) -> bytes:
+        settings.DIRTY_RECT_RENDERING = False
+        self.__render()
+        settings.DIRTY_RECT_RENDERING = True
+        return pygame.image.tobytes(pygame.display.get_surface(), 'RGB')
+
+    def test_profiler_overlay_does_not_fill_the_text_cache(self):
+        game = Mock()
+        game.profiler = FrameProfiler()
+        game.profiler.overlay_visible = True
+        game.simulation_profiler = game.profiler
+        self.__render(game=game)
+        texts = len(TEXT_CACHE)
+
+        for frame in range(10):
+            with game.profiler.measure(FrameProfiler.UPDATE):
+                pygame.time.wait(frame % 3)
+            game.profiler.end_frame()
+            self.__render(game=game)
+
+        self.assertEqual(len(TEXT_CACHE), texts)
+
+    def test_first_frames_are_full(self):
+        for _ in range(2):
+            flip, update = self.__render()
+
+            flip.assert_called_once()
+            update.assert_not_called()
+
+    def test_still_camera_updates_only_the_changed_areas(self):
+        self.__render_still_camera()
+        self.monster.move(1, 0)
+
+        flip, update = self.__render()
+
+        flip.assert_not_called()
+        dirty = update.call_args.args[0]
+        screen_area = settings.SCREEN_WIDTH * settings.SCREEN_HEIGHT
+        self.assertLess(sum(rect.width * rect.height for rect in dirty), screen_area // 10)
+
+    def test_dirty_frames_look_like_full_frames(self):
+        self.__render_still_camera()
+        for _ in range(3):
+            self.monster.move(1, 1)
+            self.monster.take_damage(1)
+            self.__render()
+
+        dirty_frame = pygame.image.tobytes(pygame.display.get_surface(), 'RGB')
+
+        self.assertEqual(dirty_frame, self.__full_frame())
+
+    def test_removed_entities_are_erased(self):
+        self.__render_still_camera()
+        self.world.remove_monster(self.monster)
+        self.world.flush_changes()
+
+        self.__render()
+        dirty_frame = pygame.image.tobytes(pygame.display.get_surface(), 'RGB')
+
+        self.assertEqual(dirty_frame, self.__full_frame())
+
+    def test_camera_scroll_draws_a_full_frame(self):
+        self.__render_still_camera()
+        self.world.player.move(1, 0)
+
+        flip, update = self.__render()
+
+        flip.assert_called_once()
+        update.assert_not_called()
+
+class TestDisplaySnapshots(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+        GameClockSingleton().reset()
+
+        self.display = Display()
+        self.world = initialize_game_world(self.display, {})
+        self.display.load_world(self.world)
+
+        self.monster = Monster(300, 300)
+        self.world.add_monster(self.monster)
+        self.world.flush_changes()
+
+    def tearDown(self):
+        TEXT_CACHE.clear()
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.quit()
+
+    def __frame(self) -> bytes:
+        with patch('pygame.display.flip'):
+            self.display.render_frame(False, 0, False)
+        return pygame.image.tobytes(pygame.display.get_surface(), 'RGB')
+
+    def test_snapshot_is_drawn_like_the_world_it_was_taken_from(self):
+        self.monster.take_damage(1)
+        world_frame = self.__frame()
+        snapshot = WorldSnapshot.capture(self.world, 1)
+
+        self.monster.move(10, 0)
+        self.display.show_snapshot(snapshot)
+
+        self.assertEqual(self.__frame(), world_frame)
+
+        self.display.show_snapshot(None)
+        self.assertNotEqual(self.__frame(), world_frame)
+
+class TestDisplayInterpolation(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+        GameClockSingleton().reset()
+
+        self.display = Display()
+        self.world = initialize_game_world(self.display, {})
+        self.display.load_world(self.world)
+
+        self.monster = Monster(300, 300)
+        self.world.add_monster(self.monster)
+        self.world.flush_changes()
+
+        self.game = Mock()
+        self.game.profiler.overlay_visible = False
+
+    def tearDown(self):
+        TEXT_CACHE.clear()
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.quit()
+
+    def __frame(self, game=None) -> bytes:
+        with patch('pygame.display.flip'):
+            self.display.render_frame(False, 0, False, game)
+        return pygame.image.tobytes(pygame.display.get_surface(), 'RGB')
+
+    def test_entities_are_drawn_between_their_last_two_positions(self):
+        before = self.__frame()
+        self.display.remember_positions()
+        self.monster.move(10, 0)
+        after = self.__frame()
+
+        self.game.timestep.alpha = 0
+        self.assertEqual(self.__frame(self.game), before)
+        self.game.timestep.alpha = 1
+        self.assertEqual(self.__frame(self.game), after)
+        self.game.timestep.alpha = 0.5
+        self.assertNotIn(self.__frame(self.game), (before, after))
+
+if __name__ == '__main__':
+    unittest.main()
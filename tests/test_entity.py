@@ -1,7 +1,19 @@
 import unittest
 from unittest.mock import MagicMock
+import pygame
 from presentation.sprite import Sprite
 from business.entities.entity import Entity
+from presentation.sprite import PlayerSprite
+from business.entities.bullets import NormalBullet, TurretBullet, FollowingBullet
+from business.entities.items.experience_gem import ExperienceGem, RedExperienceGem, GreenExperienceGem, BlueExperienceGem
+from business.entities.items.guaymallen import Guaymallen
+from business.entities.monsters.boss import BossMonster
+from business.entities.monsters.boss2 import BigBossMonster
+from business.entities.monsters.bullets import MonsterBullet
+from business.entities.monsters.gunner import GunMonster
+from business.entities.monsters.monster import Monster
+from business.entities.player import Player
+from business.handlers.cooldown_handler import CooldownHandler
 
 class TestEntity(unittest.TestCase):
     class TestEntityImplementation(Entity):
@@ -20,5 +32,45 @@ class TestEntity(unittest.TestCase):
         self.entity.update(None)
         self.entity.sprite.update.assert_called_once()
 
+class TestEntitySlots(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_entities_have_no_dict(self):
+        entities = [
+            Player(10, 10, PlayerSprite(10, 10)),
+            Monster(10, 10),
+            GunMonster(10, 10),
+            BossMonster(10, 10),
+            BigBossMonster(10, 10),
+            NormalBullet(0, 0, 10, 10, 5, 5, 5),
+            TurretBullet(0, 0, 10, 10, 5, 5, 5),
+            FollowingBullet(0, 0, Monster(10, 10), 5, 5, 5),
+            MonsterBullet(0, 0, 10, 10, 5, 5, 5),
+            ExperienceGem(10, 10, 1),
+            RedExperienceGem(10, 10, 1),
+            GreenExperienceGem(10, 10, 1),
+            BlueExperienceGem(10, 10, 1),
+            Guaymallen(10, 10),
+            CooldownHandler(100),
+        ]
+
+        for entity in entities:
+            with self.subTest(type(entity).__name__):
+                self.assertFalse(hasattr(entity, '__dict__'))
+                with self.assertRaises(AttributeError):
+                    entity.misspelled_attribute = 1
+
+    def test_private_attributes_keep_working(self):
+        monster = Monster(10, 10)
+
+        monster.take_damage(4)
+
+        self.assertEqual(monster._Monster__health, monster.max_health - 4)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,185 @@
+import random
+import unittest
+from unittest.mock import patch
+import pygame
+import settings
+from business.entities.bullets import NormalBullet
+from business.entities.items.experience_gem import ExperienceGem
+from business.entities.monsters.monster import Monster
+from business.handlers.clock import GameClockSingleton
+from business.world.entity_pool import EntityPool, EntityPools, ENTITY_POOLS
+from business.exceptions import DeadPlayerException
+from game import Game
+from presentation.headless_display import HeadlessDisplay
+from runner import initialize_game_world
+
+class Pooled:
+    def __init__(self, value):
+        self.value = value
+        self.resets = 0
+
+    def reset(self, value):
+        self.value = value
+        self.resets += 1
+
+class TestEntityPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = EntityPool(Pooled, capacity=2)
+
+    def test_acquire_creates_an_entity_when_there_is_no_free_one(self):
+        entity = self.pool.acquire(1)
+
+        self.assertEqual(entity.value, 1)
+        self.assertEqual(self.pool.allocations, 1)
+        self.assertEqual(self.pool.hits, 0)
+
+    def test_released_entities_are_reset_and_reused(self):
+        entity = self.pool.acquire(1)
+        self.pool.release(entity)
+
+        reused = self.pool.acquire(2)
+
+        self.assertIs(reused, entity)
+        self.assertEqual(reused.value, 2)
+        self.assertEqual(reused.resets, 1)
+        self.assertEqual(self.pool.hit_rate, 0.5)
+
+    def test_release_keeps_up_to_the_capacity(self):
+        for entity in [Pooled(i) for i in range(3)]:
+            self.pool.release(entity)
+
+        self.assertEqual(len(self.pool), 2)
+
+    def test_entity_released_twice_is_kept_once(self):
+        entity = self.pool.acquire(1)
+        self.pool.release(entity)
+        self.pool.release(entity)
+
+        self.assertEqual(len(self.pool), 1)
+
+class TestEntityPools(unittest.TestCase):
+    def setUp(self):
+        self.pools = EntityPools()
+
+    def test_entities_without_a_pool_are_not_kept(self):
+        self.pools.release(Pooled(1))
+
+        self.assertEqual(self.pools.stats(), {})
+
+    def test_last_tick_counts_only_its_acquired_entities(self):
+        entity = self.pools.acquire(Pooled, 1)
+        self.pools.acquire(Pooled, 2)
+        self.pools.release(entity)
+        self.pools.end_tick()
+        self.pools.acquire(Pooled, 3)
+        self.pools.end_tick()
+
+        self.assertEqual(self.pools.last_tick, {'hits': 1, 'allocations': 0})
+        self.assertEqual(self.pools.stats()['Pooled']['allocations'], 2)
+
+    def test_released_entities_are_not_reused_in_the_same_tick(self):
+        entity = self.pools.acquire(Pooled, 1)
+        self.pools.release(entity)
+
+        self.assertIsNot(self.pools.acquire(Pooled, 2), entity)
+        self.assertEqual(entity.resets, 0)
+
+        self.pools.end_tick()
+        self.assertIs(self.pools.acquire(Pooled, 3), entity)
+
+    def test_disabled_pools_always_create_entities(self):
+        with patch.object(settings, 'ENTITY_POOLS', False):
+            entity = self.pools.acquire(Pooled, 1)
+            self.pools.release(entity)
+
+            self.assertIsNot(self.pools.acquire(Pooled, 2), entity)
+
+class TestEntityPoolsInTheWorld(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        GameClockSingleton().reset()
+        ENTITY_POOLS.clear()
+        self.world = initialize_game_world(HeadlessDisplay(), {})
+
+    def tearDown(self):
+        ENTITY_POOLS.clear()
+        pygame.quit()
+
+    def test_entity_removed_during_a_tick_is_kept_until_the_next_one(self):
+        player = self.world.player
+        gem = ENTITY_POOLS.acquire(ExperienceGem, player.pos_x, player.pos_y, 1)
+        self.world.add_item(gem)
+
+        Game.simulate_tick(self.world)
+
+        # It was picked up, and what runs after the tick still sees it as it was
+        self.assertNotIn(gem, self.world.items)
+        self.assertIsNot(ENTITY_POOLS.acquire(ExperienceGem, 0, 0, 1), gem)
+        self.assertEqual((gem.pos_x, gem.pos_y), (player.pos_x, player.pos_y))
+
+        self.world.update()
+        self.assertIs(ENTITY_POOLS.acquire(ExperienceGem, 0, 0, 1), gem)
+
+    def trace(self, ticks: int, pools: bool) -> list:
+        """Simulates a seeded game and gets what every entity was like after each tick."""
+        random.seed(0)
+        GameClockSingleton().reset()
+        ENTITY_POOLS.clear()
+        world = initialize_game_world(HeadlessDisplay(), {})
+
+        trace = []
+        with patch.object(settings, 'ENTITY_POOLS', pools):
+            for _ in range(ticks):
+                try:
+                    Game.simulate_tick(world)
+                except DeadPlayerException:
+                    break
+                trace.append([
+                    (type(entity).__name__, entity.pos_x, entity.pos_y, entity.health, tuple(entity.sprite.rect))
+                    for entity in (world.player, *world.monsters, *world.bullets)
+                ])
+        return trace
+
+    def test_reused_entities_play_like_new_ones(self):
+        without_pools = self.trace(300, pools=False)
+        with_pools = self.trace(300, pools=True)
+
+        self.assertGreater(sum(pool.hits for pool in ENTITY_POOLS), 0)
+        self.assertEqual(len(with_pools), len(without_pools))
+        for tick, (reused, created) in enumerate(zip(with_pools, without_pools)):
+            self.assertEqual(reused, created, f"tick {tick}")
+
+class TestEntityReset(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        GameClockSingleton().reset()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_reset_bullet_is_like_a_new_one(self):
+        bullet = NormalBullet(0, 0, 10, 0, 5, 5, 5)
+        bullet.move(1, 0)
+        bullet.take_damage(3)
+
+        bullet.reset(20, 20, 20, 30, 4, 6, 7)
+
+        self.assertEqual(bullet.to_json(), NormalBullet(20, 20, 20, 30, 4, 6, 7).to_json())
+        self.assertEqual(bullet.sprite.rect.center, (20, 20))
+
+    def test_reset_monster_is_healed_and_its_sprite_restored(self):
+        monster = Monster(100, 100)
+        image = monster.sprite.image
+        monster.take_damage(5)
+
+        monster.reset(200, 300)
+
+        self.assertEqual(monster.health, monster.max_health)
+        self.assertEqual((monster.pos_x, monster.pos_y), (200, 300))
+        self.assertIs(monster.sprite.image, image)
+        self.assertEqual(monster.sprite.generation, 1)
+        self.assertEqual(monster.sprite.rect, Monster(200, 300).sprite.rect)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import MagicMock, patch
 from business.entities.items.experience_gem import ExperienceGem
 import pygame
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
 
 
 class TestExperienceGem(unittest.TestCase):
@@ -45,13 +47,16 @@ class TestExperienceGem(unittest.TestCase):
         mock_player.pos_x = 12
         mock_player.pos_y = 18
 
-        with patch.object(self.gem, '_get_distance_to', return_value=8):
+        with patch.object(ExperienceGem, '_get_distance_to', return_value=8):
             self.assertTrue(self.gem.in_player_range(mock_player))
 
-        with patch.object(self.gem, '_get_distance_to', return_value=12):
+        with patch.object(ExperienceGem, '_get_distance_to', return_value=12):
             self.assertFalse(self.gem.in_player_range(mock_player))
 
     def tearDown(self):
+        # The loaded images are mocks, so they must not stay in the shared caches
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
         pygame.display.quit()
         pygame.quit()
 
@@ -0,0 +1,34 @@
+import unittest
+from business.handlers.fixed_timestep import FixedTimestep
+
+class TestFixedTimestep(unittest.TestCase):
+    def setUp(self):
+        self.timestep = FixedTimestep(step_ms=10, max_steps=3)
+
+    def test_steps_follow_the_real_time(self):
+        self.assertEqual(self.timestep.advance(25), 2)
+        self.assertAlmostEqual(self.timestep.alpha, 0.5)
+
+        self.assertEqual(self.timestep.advance(5), 1)
+        self.assertAlmostEqual(self.timestep.alpha, 0)
+
+    def test_short_frames_accumulate(self):
+        steps = sum(self.timestep.advance(4) for _ in range(10))
+
+        self.assertEqual(steps, 4)
+
+    def test_catch_up_steps_are_capped(self):
+        self.assertEqual(self.timestep.advance(1000), 3)
+        self.assertAlmostEqual(self.timestep.dropped_ms, 970)
+
+        # The dropped time is not simulated later
+        self.assertEqual(self.timestep.advance(10), 1)
+
+    def test_reset_forgets_the_remaining_time(self):
+        self.timestep.advance(9)
+        self.timestep.reset()
+
+        self.assertEqual(self.timestep.advance(9), 0)
+
+if __name__ == '__main__':
+    unittest.main()
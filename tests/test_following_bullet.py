@@ -81,6 +81,14 @@ class TestFollowingBullet(unittest.TestCase):
         def items(self):
             return self._items
 
+        @property
+        def monster_index(self):
+            return None
+
+        @property
+        def projectile_store(self):
+            return None
+
         @property
         def player(self):
             return MagicMock()
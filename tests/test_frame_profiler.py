@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import Mock, patch
+from business.handlers.frame_profiler import FrameProfiler
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = FrameProfiler(history_size=3, budget_ms=10)
+
+    def record_frame(self, times: dict, entity_counts=None):
+        with patch('business.handlers.frame_profiler.time.perf_counter') as mock_counter:
+            for stage, elapsed_ms in times.items():
+                mock_counter.side_effect = [0, elapsed_ms / 1000]
+                with self.profiler.measure(stage):
+                    pass
+            self.profiler.end_frame(entity_counts)
+
+    def test_measure_stage(self):
+        self.record_frame({FrameProfiler.UPDATE: 4})
+
+        self.assertEqual(self.profiler.stages, [FrameProfiler.UPDATE])
+        self.assertAlmostEqual(self.profiler.last(FrameProfiler.UPDATE), 4)
+        self.assertEqual(self.profiler.frames, 1)
+
+    def test_history_is_rolling(self):
+        for elapsed_ms in [1, 2, 3, 4]:
+            self.record_frame({FrameProfiler.RENDER: elapsed_ms})
+
+        stats = self.profiler.stats(FrameProfiler.RENDER)
+        self.assertAlmostEqual(stats['mean'], 3)
+        self.assertAlmostEqual(stats['max'], 4)
+
+    def test_histogram(self):
+        self.record_frame({FrameProfiler.DEATHS: 0.1})
+        self.record_frame({FrameProfiler.DEATHS: 50})
+
+        histogram = self.profiler.histogram(FrameProfiler.DEATHS)
+        self.assertEqual(histogram[0], 1)
+        self.assertEqual(histogram[-1], 1)
+        self.assertEqual(sum(histogram), 2)
+
+    def test_over_budget_is_logged_with_entity_counts(self):
+        entity_counts = Mock(return_value={'monsters': 100})
+
+        with self.assertLogs('FrameProfiler', level='WARNING') as logs:
+            self.record_frame({FrameProfiler.COLLISIONS: 20}, entity_counts)
+
+        entity_counts.assert_called_once()
+        self.assertIn('collisions', logs.output[0])
+        self.assertIn("'monsters': 100", logs.output[0])
+
+    def test_under_budget_does_not_count_entities(self):
+        entity_counts = Mock(return_value={})
+        self.record_frame({FrameProfiler.COLLISIONS: 5}, entity_counts)
+
+        entity_counts.assert_not_called()
+
+    def test_disabled_profiler_measures_nothing(self):
+        profiler = FrameProfiler(enabled=False)
+        with profiler.measure(FrameProfiler.UPDATE):
+            pass
+        profiler.end_frame()
+
+        self.assertEqual(profiler.stages, [])
+        self.assertEqual(profiler.stats(FrameProfiler.UPDATE), {})
+
+    def test_toggle_overlay(self):
+        self.assertFalse(self.profiler.overlay_visible)
+        self.profiler.toggle_overlay()
+        self.assertTrue(self.profiler.overlay_visible)
+
+if __name__ == '__main__':
+    unittest.main()
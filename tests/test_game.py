@@ -0,0 +1,80 @@
+import threading
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+from business.handlers.clock import GameClockSingleton
+from game import Game
+from presentation.headless_display import HeadlessDisplay
+from presentation.image_cache import IMAGE_CACHE
+from presentation.interfaces import IInputHandler
+from presentation.tileset import TILESETS
+from runner import initialize_game_world
+
+class TestThreadedSimulation(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        GameClockSingleton().reset()
+        self.world = initialize_game_world(HeadlessDisplay(), {})
+
+        self.keys = object()
+        self.sampled_in: set[str] = set()
+        self.processed: list[tuple[str, object]] = []
+        self.input_handler = Mock(spec=IInputHandler)
+        self.input_handler.is_pause_pressed.return_value = False
+        self.input_handler.is_profiler_toggle_pressed.return_value = False
+        self.input_handler.sample_input.side_effect = self.sample_input
+        self.input_handler.process_input.side_effect = self.process_input
+
+        self.settings = patch('game.settings.THREADED_SIMULATION', True)
+        self.settings.start()
+        self.game = Game(self.world, self.input_handler, None)
+
+    def tearDown(self):
+        self.settings.stop()
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.quit()
+
+    def sample_input(self):
+        self.sampled_in.add(threading.current_thread().name)
+        return self.keys
+
+    def process_input(self, keys=None):
+        self.processed.append((threading.current_thread().name, keys))
+
+    def run_for(self, seconds: float):
+        timer = threading.Timer(seconds, self.game.close_game_loop)
+        timer.start()
+        try:
+            return self.game.run()
+        finally:
+            timer.cancel()
+
+    def test_simulation_gets_the_keys_sampled_by_the_main_thread(self):
+        self.run_for(0.3)
+
+        self.assertEqual(self.sampled_in, {threading.current_thread().name})
+        self.assertTrue(self.processed)
+        self.assertEqual(set(self.processed), {('simulation', self.keys)})
+        self.assertGreater(self.game.snapshots.published, 0)
+
+    def test_display_draws_the_world_again_when_the_loop_ends(self):
+        with patch.object(self.world.display, 'show_snapshot') as show_snapshot:
+            self.run_for(0.2)
+
+        self.assertTrue(any(call.args[0] is not None for call in show_snapshot.call_args_list))
+        show_snapshot.assert_called_with(None)
+
+    def test_simulation_error_is_raised_in_the_main_thread(self):
+        error = RuntimeError("broken tick")
+        self.input_handler.process_input.side_effect = error
+
+        with self.assertLogs('Game', 'ERROR'):
+            with self.assertRaises(RuntimeError) as raised:
+                self.run_for(5)
+
+        self.assertIs(raised.exception, error)
+        self.assertEqual(self.game.snapshots.published, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@ class TestGameClockSingleton(unittest.TestCase):
     def test_update_game_clock(self):
         GameClockSingleton().update()
 
-        expected_time = 1000 / settings.FPS
+        expected_time = 1000 / settings.SIMULATION_RATE
         self.assertAlmostEqual(GameClockSingleton().game_clock, expected_time, places=2)
 
         GameClockSingleton().update()
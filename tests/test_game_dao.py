@@ -12,6 +12,7 @@ from business.entities.items.experience_gem import ExperienceGem
 from business.entities.player import Player
 from presentation.sprite import Sprite
 from business.handlers.clock import GameClockSingleton
+from business.world.type_registry import TYPE_REGISTRY
 import os
 
 class TestGameJSONDAO(unittest.TestCase):
@@ -36,10 +37,10 @@ class TestGameJSONDAO(unittest.TestCase):
 
         bullet = NormalBullet(15, 25, 0, 0, 0, 0, 10)
         bullet._NormalBullet__health = 5
-        bullet.__damage = 10
+        bullet._NormalBullet__damage = 10
 
         item = ExperienceGem(30, 40, 1)
-        item.__amount = 1
+        item._ExperienceGem__amount = 1
 
         player = Player(50, 60, Mock(spec=Sprite))
         player._Player__experience = 100
@@ -52,18 +53,18 @@ class TestGameJSONDAO(unittest.TestCase):
         bullet_factory = NormalBulletFactory(player)
         bullet_factory._NormalBulletFactory__level = 3
 
-        player.__static_inventory = [regeneration_perk]
-        player.__updatable_inventory = [bullet_factory]
-        player.to_json = Mock(return_value={
+        static_inventory = [regeneration_perk]
+        updatable_inventory = [bullet_factory]
+        player_json = {
             'pos_x': player._pos_x,
             'pos_y': player._pos_y,
             'experience': player._Player__experience,
             'level': player._Player__level,
             'health': player._Player__health,
             'health_regen_cooldown': player._Player__health_regen_cooldown.last_action_time,
-            'static': {str(type(perk)): perk.to_json() for perk in player.__static_inventory},
-            'updatable': {str(type(perk)): perk.to_json() for perk in player.__updatable_inventory},
-        })
+            'static': {str(type(perk)): perk.to_json() for perk in static_inventory},
+            'updatable': {str(type(perk)): perk.to_json() for perk in updatable_inventory},
+        }
 
         monster_spawner = Mock()
         monster_spawner.__minute_boss_added = 10
@@ -80,7 +81,9 @@ class TestGameJSONDAO(unittest.TestCase):
         game.world.player = player
         game.world.monster_spawner = monster_spawner
 
-        self.dao.save_game(game)
+        # The entities have no __dict__, so the method is patched on the class
+        with patch.object(Player, 'to_json', return_value=player_json):
+            self.dao.save_game(game)
 
         with open(self.temp_file.name, 'r', encoding="utf-8") as file:
             saved_data = json.load(file)
@@ -92,14 +95,14 @@ class TestGameJSONDAO(unittest.TestCase):
         self.assertIn('monster_spawner', saved_data)
         self.assertIn('clock', saved_data)
 
-        self.assertEqual(saved_data['monsters'][str(type(monster))][0], {
+        self.assertEqual(saved_data['monsters'][TYPE_REGISTRY.tag_of(monster)][0], {
             'pos_x': monster.pos_x,
             'pos_y': monster.pos_y,
             'health': monster.health,
             'attack_cooldown': monster._Monster__attack_cooldown.last_action_time
         })
 
-        self.assertEqual(saved_data['bullets'][str(type(bullet))][0], {
+        self.assertEqual(saved_data['bullets'][TYPE_REGISTRY.tag_of(bullet)][0], {
             'pos_x': bullet.pos_x,
             'pos_y': bullet.pos_y,
             'dir_x': bullet._NormalBullet__dir_x,
@@ -109,7 +112,7 @@ class TestGameJSONDAO(unittest.TestCase):
             'speed': bullet.speed
         })
 
-        self.assertEqual(saved_data['items'][str(type(item))][0], {
+        self.assertEqual(saved_data['items'][TYPE_REGISTRY.tag_of(item)][0], {
             'pos_x': item.pos_x,
             'pos_y': item.pos_y,
             'amount': item.amount,
@@ -135,6 +138,21 @@ class TestGameJSONDAO(unittest.TestCase):
 
         self.assertEqual(saved_data['clock'], GameClockSingleton().game_clock)
 
+    def test_save_game_keeps_the_other_saved_keys(self):
+        self.dao._GameJSONDAO__save_data({'clock': 0, 'settings': {'volume': 3}})
+
+        game = Mock()
+        game.world.monsters = []
+        game.world.bullets = []
+        game.world.items = []
+        game.world.monster_spawner.to_json = Mock(return_value={})
+        game.world.player.to_json = Mock(return_value={})
+        self.dao.save_game(game)
+
+        saved_data = self.dao.load_game()
+        self.assertEqual(saved_data['settings'], {'volume': 3})
+        self.assertEqual(saved_data['clock'], GameClockSingleton().game_clock)
+
     def test_load_game_returns_data(self):
         initial_data = {
             'monsters': {},
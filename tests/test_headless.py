@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import patch
+import pygame
+from business.handlers.clock import GameClockSingleton
+from business.handlers.frame_profiler import FrameProfiler
+from business.world.entity_pool import ENTITY_POOLS
+from headless import run_headless
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
+
+class OverBudgetProfiler(FrameProfiler):
+    """Profiler with no budget, so every frame is logged."""
+
+    def __init__(self, history_size: int):
+        super().__init__(history_size, budget_ms=0)
+
+class TestRunHeadless(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        GameClockSingleton().reset()
+
+    def tearDown(self):
+        ENTITY_POOLS.clear()
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.quit()
+
+    def test_frames_over_budget_are_logged_with_the_entities(self):
+        with patch('headless.FrameProfiler', OverBudgetProfiler):
+            with self.assertLogs(level='WARNING') as logs:
+                result = run_headless(3, seed=0)
+
+        self.assertEqual(result['ticks'], 3)
+        self.assertEqual(len(logs.records), 3)
+        for record in logs.records:
+            self.assertIn("'monsters': ", record.getMessage())
+            self.assertIn("'pool_allocations': ", record.getMessage())
+
+if __name__ == '__main__':
+    unittest.main()
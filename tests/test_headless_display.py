@@ -0,0 +1,36 @@
+import os
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+import settings
+from presentation.headless_display import HeadlessDisplay
+
+class TestHeadlessDisplay(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.display = HeadlessDisplay()
+
+        self.world = Mock()
+        self.world.player.sprite.rect = pygame.Rect(settings.WORLD_WIDTH // 2, settings.WORLD_HEIGHT // 2, 48, 48)
+        self.display.load_world(self.world)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_camera_follows_player(self):
+        self.display.render_frame()
+
+        self.assertEqual(self.display.camera.camera_rect.center, self.world.player.sprite.rect.center)
+
+    def test_uses_the_dummy_driver_when_the_display_is_not_started(self):
+        pygame.quit()
+        environ = {key: value for key, value in os.environ.items() if not key.startswith('SDL_')}
+
+        with patch.dict(os.environ, environ, clear=True):
+            HeadlessDisplay()
+
+            self.assertEqual(pygame.display.get_driver(), 'dummy')
+            self.assertEqual(os.environ['SDL_AUDIODRIVER'], 'dummy')
+
+if __name__ == '__main__':
+    unittest.main()
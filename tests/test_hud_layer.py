@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import Mock
+import pygame
+from presentation.hud_layer import HudLayer
+from presentation.text_cache import TEXT_CACHE
+
+class TestHudLayer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.Surface((1368, 768))
+        self.hud = HudLayer()
+
+        self.player = Mock()
+        self.player.inventory = []
+        self.player.inventory_version = 0
+        self.player.level = 1
+        self.player.experience_progress = 0.5
+        self.player.health = 100
+        self.player.max_health = 100
+
+    def tearDown(self):
+        # The fonts can't be used after pygame.quit
+        TEXT_CACHE.clear()
+        pygame.quit()
+
+    def test_same_values_are_not_drawn_again(self):
+        self.hud.draw(self.screen, self.player, "00:01")
+        self.hud.draw(self.screen, self.player, "00:01")
+
+        self.assertEqual(self.hud.redraws, 1)
+
+    def test_changed_values_are_drawn_again(self):
+        self.hud.draw(self.screen, self.player, "00:01")
+
+        self.hud.draw(self.screen, self.player, "00:02")
+        self.player.inventory_version = 1
+        self.hud.draw(self.screen, self.player, "00:02")
+        self.player.experience_progress = 0.75
+        self.hud.draw(self.screen, self.player, "00:02")
+
+        self.assertEqual(self.hud.redraws, 4)
+
+    def test_draw_returns_the_covered_areas(self):
+        areas = self.hud.draw(self.screen, self.player, "00:01")
+
+        for point in [(110, 30), (15, 75), (684, 20)]:
+            self.assertTrue(any(area.collidepoint(point) for area in areas))
+
+    def test_player_health_is_drawn_again_only_when_it_changes(self):
+        self.hud.draw_player_health(self.screen, self.player, 10, 10)
+        self.hud.draw_player_health(self.screen, self.player, 20, 20)
+
+        self.player.health = 50
+        self.hud.draw_player_health(self.screen, self.player, 20, 20)
+
+        self.assertEqual(self.hud.redraws, 2)
+        self.assertEqual(self.screen.get_at((20, 20)), pygame.Color(0, 255, 0))
+        self.assertEqual(self.screen.get_at((20 + 30, 20)), pygame.Color(255, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import patch
+import pygame
+from presentation.image_cache import ImageCache, IMAGE_CACHE
+from presentation.sprite import (
+    PlayerSprite, MonsterSprite, GunMonsterSprite, BossMonsterSprite, BigBossMonsterSprite, MonsterBulletSprite, preload_images
+)
+
+class TestImageCache(unittest.TestCase):
+    ASSET = "./assets/monster.png"
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.cache = ImageCache()
+
+    def tearDown(self):
+        IMAGE_CACHE.clear()
+        pygame.display.quit()
+
+    def test_loads_every_image_once(self):
+        first = self.cache.get(self.ASSET, (10, 20))
+        second = self.cache.get(self.ASSET, (10, 20))
+
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (10, 20))
+        self.assertEqual(self.cache.misses, 2)  # The original and the scaled one
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_tint_does_not_change_the_shared_image(self):
+        original = self.cache.get(self.ASSET, (10, 10))
+        color = original.get_at((5, 5))
+
+        tinted = self.cache.get(self.ASSET, (10, 10), (255, 0, 0))
+
+        self.assertIsNot(tinted, original)
+        self.assertEqual(original.get_at((5, 5)), color)
+
+    def test_preloaded_images_do_not_read_the_disk(self):
+        self.cache.preload([(self.ASSET,)])
+
+        with patch('pygame.image.load') as mock_load:
+            self.cache.get(self.ASSET, (30, 30))
+            mock_load.assert_not_called()
+
+    def test_clear(self):
+        self.cache.get(self.ASSET)
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_sprites_share_their_images(self):
+        preload_images()
+
+        with patch('pygame.image.load') as mock_load:
+            first, second = MonsterSprite(0, 0, 1), MonsterSprite(10, 10, 1)
+            MonsterBulletSprite(0, 0)
+            mock_load.assert_not_called()
+
+        self.assertIs(first.image, second.image)
+
+    def test_preload_scales_the_known_sizes(self):
+        preload_images()
+        misses = IMAGE_CACHE.misses
+
+        PlayerSprite(0, 0)
+        MonsterBulletSprite(0, 0)
+        for sprite_type in (MonsterSprite, GunMonsterSprite, BossMonsterSprite, BigBossMonsterSprite):
+            sprite_type(0, 0, sprite_type.BASE_SIZE)
+
+        self.assertEqual(IMAGE_CACHE.misses, misses)
+
+if __name__ == '__main__':
+    unittest.main()
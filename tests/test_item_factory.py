@@ -5,6 +5,8 @@ from business.entities.items.guaymallen import Guaymallen
 from business.world.interfaces import IGameWorld
 from business.entities.items.item_factory import ItemFactory
 import pygame
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
 
 class TestItemFactory(unittest.TestCase):
     @patch('business.entities.items.experience_gem.ExperienceGemSprite')
@@ -51,25 +53,41 @@ class TestItemFactory(unittest.TestCase):
     def test_load_items(self):
         saved_data = {
             'items': {
-                'experience_gem.ExperienceGem': [{'pos_x': 1, 'pos_y': 2, 'amount': 50, 'despawn_cooldown': 10}],
-                'RedExperienceGem': [{'pos_x': 3, 'pos_y': 4, 'amount': 75, 'despawn_cooldown': 8}],
-                'GreenExperienceGem': [{'pos_x': 5, 'pos_y': 6, 'amount': 100, 'despawn_cooldown': 6}],
-                'BlueExperienceGem': [{'pos_x': 7, 'pos_y': 8, 'amount': 125, 'despawn_cooldown': 4}],
-                'Guaymallen': [{'pos_x': 9, 'pos_y': 10}]
+                'gem': [{'pos_x': 1, 'pos_y': 2, 'amount': 50, 'despawn_cooldown': 10}],
+                'red_gem': [{'pos_x': 3, 'pos_y': 4, 'amount': 75, 'despawn_cooldown': 8}],
+                'green_gem': [{'pos_x': 5, 'pos_y': 6, 'amount': 100, 'despawn_cooldown': 6}],
+                'blue_gem': [{'pos_x': 7, 'pos_y': 8, 'amount': 125, 'despawn_cooldown': 4},
+                             {'pos_x': 9, 'pos_y': 8, 'amount': 150, 'despawn_cooldown': 4}],
+                'guaymallen': [{'pos_x': 9, 'pos_y': 10}]
             }
         }
 
         ItemFactory.load_items(self.world, saved_data)
 
-        self.world.add_item.assert_any_call(ANY)
-        self.world.add_item.assert_any_call(ANY)
-        self.world.add_item.assert_any_call(ANY)
-        self.world.add_item.assert_any_call(ANY)
-        self.world.add_item.assert_any_call(ANY)
+        loaded = [call.args[0] for call in self.world.add_items.call_args_list]
+        self.assertEqual([[type(item) for item in items] for items in loaded], [
+            [ExperienceGem], [RedExperienceGem], [GreenExperienceGem], [BlueExperienceGem, BlueExperienceGem], [Guaymallen]
+        ])
+        self.assertEqual(loaded[3][1].amount, 150)
 
-        self.assertEqual(self.world.add_item.call_count, 5)
+    def test_load_items_of_older_saves(self):
+        saved_data = {
+            'items': {
+                str(RedExperienceGem): [{'pos_x': 3, 'pos_y': 4, 'amount': 75, 'despawn_cooldown': 8}],
+                'RemovedItem': [{'pos_x': 1, 'pos_y': 2}],
+            }
+        }
+
+        ItemFactory.load_items(self.world, saved_data)
+
+        (items,), _ = self.world.add_items.call_args
+        self.assertEqual([type(item) for item in items], [RedExperienceGem])
+        self.assertEqual(self.world.add_items.call_count, 1)
 
     def tearDown(self):
+        # The loaded images are mocks, so they must not stay in the shared caches
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
         pygame.display.quit()
         pygame.quit()
 
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 import pygame
 from business.entities.interfaces import IDamageable
 from business.entities.monsters.monster import Monster
+from business.handlers.cooldown_handler import CooldownHandler
 
 class TestMonster(unittest.TestCase):
     def setUp(self):
@@ -20,11 +21,11 @@ class TestMonster(unittest.TestCase):
         target_mock.pos_y = 3
 
         with patch.object(
-            self.monster._Monster__attack_cooldown,
+            CooldownHandler,
             "is_action_ready",
             return_value=True,
         ):
-            with patch.object(self.monster, '_get_distance_to', return_value=30):
+            with patch.object(Monster, '_get_distance_to', return_value=30):
                 self.monster.attack(target_mock)
 
         target_mock.take_damage.assert_called_once_with(self.monster.damage_amount)
@@ -41,7 +42,7 @@ class TestMonster(unittest.TestCase):
         target_mock.health = 10
 
         with patch.object(
-            self.monster._Monster__attack_cooldown,
+            CooldownHandler,
             "is_action_ready",
             return_value=False,
         ):
@@ -0,0 +1,76 @@
+import random
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+from business.world.monster_index import MonsterIndex
+
+class TestMonsterIndex(unittest.TestCase):
+    def setUp(self):
+        self.monsters = []
+        self.index = MonsterIndex(self.monsters, cell_size=50, linear_scan_max=0)
+
+    def __linear_nearest(self, pos_x, pos_y):
+        return min(self.monsters, key=lambda monster: (monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2)
+
+    def test_no_monsters(self):
+        self.assertIsNone(self.index.nearest(10, 10))
+
+    def test_same_result_as_linear_scan(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            self.monsters.append(SimpleNamespace(pos_x=rng.uniform(0, 1000), pos_y=rng.uniform(0, 1000)))
+
+        for _ in range(200):
+            pos_x, pos_y = rng.uniform(-200, 1200), rng.uniform(-200, 1200)
+            self.assertIs(self.index.nearest(pos_x, pos_y), self.__linear_nearest(pos_x, pos_y))
+
+    def test_ties_are_won_by_the_first_monster(self):
+        self.monsters.extend([
+            SimpleNamespace(pos_x=200, pos_y=100),
+            SimpleNamespace(pos_x=0, pos_y=100),
+            SimpleNamespace(pos_x=100, pos_y=0),
+        ])
+
+        self.assertIs(self.index.nearest(100, 100), self.monsters[0])
+
+    def test_rebuilds_only_when_dirty(self):
+        monster = SimpleNamespace(pos_x=10, pos_y=10)
+        self.monsters.append(monster)
+        self.index.nearest(0, 0)
+        self.index.nearest(500, 500)
+        self.assertEqual(self.index.builds, 1)
+
+        other = SimpleNamespace(pos_x=400, pos_y=400)
+        self.monsters.append(other)
+        self.assertIs(self.index.nearest(500, 500), monster)
+
+        self.index.mark_dirty()
+        self.assertIs(self.index.nearest(500, 500), other)
+        self.assertEqual(self.index.builds, 2)
+
+    def test_few_monsters_are_scanned_without_the_grid(self):
+        index = MonsterIndex(self.monsters, linear_scan_max=5)
+        self.monsters.extend([SimpleNamespace(pos_x=10, pos_y=0), SimpleNamespace(pos_x=5, pos_y=0)])
+
+        self.assertIs(index.nearest(0, 0), self.monsters[1])
+        self.assertEqual(index.builds, 0)
+
+    def test_find_nearest_without_an_index(self):
+        world = Mock(monster_index=None)
+        world.monsters = [SimpleNamespace(pos_x=10, pos_y=0), SimpleNamespace(pos_x=5, pos_y=0)]
+
+        self.assertIs(MonsterIndex.find_nearest(world, 0, 0), world.monsters[1])
+
+        world.monsters = []
+        self.assertIsNone(MonsterIndex.find_nearest(world, 0, 0))
+
+    def test_find_nearest_uses_the_world_index(self):
+        world = Mock()
+        world.monster_index = self.index
+        world.monsters = []
+        self.monsters.append(SimpleNamespace(pos_x=10, pos_y=0))
+
+        self.assertIs(MonsterIndex.find_nearest(world, 0, 0), self.monsters[0])
+
+if __name__ == '__main__':
+    unittest.main()
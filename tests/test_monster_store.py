@@ -0,0 +1,162 @@
+import json
+import random
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+import settings
+from business.entities.monsters.monster import Monster
+from business.entities.monsters.boss import BossMonster
+from business.entities.monsters.gunner import GunMonster
+from business.exceptions import DeadPlayerException
+from business.handlers.clock import GameClockSingleton
+from business.world.entity_pool import ENTITY_POOLS
+from business.world.monster_store import MonsterStore
+from game import Game
+from presentation.headless_display import HeadlessDisplay
+from runner import initialize_game_world
+
+@unittest.skipUnless(MonsterStore.available(), "NumPy is not installed")
+class TestMonsterStore(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.store = MonsterStore(capacity=2)
+        self.world = Mock()
+        self.world.player.pos_x = 100
+        self.world.player.pos_y = 50
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def test_attributes_are_views_onto_the_store(self):
+        monster = Monster(5, 10)
+        monster._Monster__health = 10
+
+        self.assertTrue(self.store.attach(monster))
+        self.assertTrue(monster.in_store)
+        self.assertEqual((monster.pos_x, monster.pos_y, monster.health), (5, 10, 10))
+
+        monster.take_damage(3)
+        self.store.columns['pos_x'][0] = 42
+
+        self.assertEqual(monster.health, 7)
+        self.assertEqual(monster.pos_x, 42)
+        self.assertEqual(self.store.columns['health'][0], 7)
+
+    def test_step_moves_like_every_monster_on_its_own(self):
+        stored = [Monster(5, 10), BossMonster(300, 400), Monster(90, 60)]
+        alone = [Monster(5, 10), BossMonster(300, 400), Monster(90, 60)]
+        for monster in stored:
+            self.store.attach(monster)
+
+        for _ in range(3):
+            self.store.step_towards(self.world.player.pos_x, self.world.player.pos_y)
+            for monster in stored:
+                monster.update(self.world)
+            for monster in alone:
+                monster.update(self.world)
+
+        for stored_monster, monster in zip(stored, alone):
+            self.assertAlmostEqual(stored_monster.pos_x, monster.pos_x)
+            self.assertAlmostEqual(stored_monster.pos_y, monster.pos_y)
+            self.assertEqual(stored_monster.sprite.rect.center, monster.sprite.rect.center)
+
+    def test_detach_keeps_values_and_slots_packed(self):
+        monsters = [Monster(i * 10, i * 10) for i in range(3)]
+        for monster in monsters:
+            self.store.attach(monster)
+        monsters[0].take_damage(4)
+
+        self.store.detach(monsters[0])
+
+        self.assertFalse(monsters[0].in_store)
+        self.assertEqual(monsters[0].pos_x, 0)
+        self.assertEqual(monsters[0].health, monsters[0].max_health - 4)
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(monsters[2].pos_x, 20)
+        self.assertEqual(monsters[1].pos_x, 10)
+
+    def test_rects_are_moved_when_they_are_read(self):
+        monster = Monster(5, 10)
+        self.store.attach(monster)
+        center = monster.sprite._rect.center
+
+        for _ in range(3):
+            self.store.step_towards(self.world.player.pos_x, self.world.player.pos_y)
+
+        # The steps only move the columns, the rect is moved once when it is read
+        self.assertEqual(monster.sprite._rect.center, center)
+        self.assertEqual(monster.sprite.rect.center, (int(monster.pos_x), int(monster.pos_y)))
+
+    def test_detached_entities_keep_their_rect_up_to_date(self):
+        monster, last_monster = Monster(5, 10), Monster(300, 20)
+        self.store.attach(monster)
+        self.store.attach(last_monster)
+        self.store.step_towards(self.world.player.pos_x, self.world.player.pos_y)
+
+        self.store.detach(monster)
+        self.store.step_towards(self.world.player.pos_x, self.world.player.pos_y)
+
+        self.assertEqual(monster.sprite._rect.center, (int(monster.pos_x), int(monster.pos_y)))
+        self.assertEqual(monster.sprite.rect.center, (int(monster.pos_x), int(monster.pos_y)))
+        # The last monster took the freed slot
+        self.assertEqual(last_monster.sprite.rect.center, (int(last_monster.pos_x), int(last_monster.pos_y)))
+
+    def test_integer_values_are_saved_as_ints(self):
+        monster = Monster(5, 10)
+        self.store.attach(monster)
+        monster.take_damage(3)
+
+        self.assertIs(type(monster.health), int)
+        self.assertIn('"health": 7,', json.dumps(monster.to_json()))
+
+        # A value set as a float keeps being a float
+        monster.take_damage(0.5)
+        self.assertEqual(monster.health, 6.5)
+
+    def test_unsupported_entities_are_not_attached(self):
+        self.assertFalse(self.store.attach(Mock()))
+        self.assertEqual(len(self.store), 0)
+
+@unittest.skipUnless(MonsterStore.available(), "NumPy is not installed")
+class TestMonsterStoreGame(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        ENTITY_POOLS.clear()
+        pygame.quit()
+
+    def trace(self, ticks: int, store: bool) -> list:
+        """Simulates a seeded game and gets what every entity was like after each tick."""
+        random.seed(0)
+        GameClockSingleton().reset()
+        ENTITY_POOLS.clear()
+        with patch.object(settings, 'MONSTER_STORE', store):
+            world = initialize_game_world(HeadlessDisplay(), {})
+
+        trace = []
+        self.stored_gunners = 0
+        for _ in range(ticks):
+            try:
+                Game.simulate_tick(world)
+            except DeadPlayerException:
+                break
+            self.stored_gunners += sum(isinstance(monster, GunMonster) and monster.in_store for monster in world.monsters)
+            trace.append([
+                (type(entity).__name__, entity.pos_x, entity.pos_y, entity.health, tuple(entity.sprite.rect))
+                for entity in (world.player, *world.monsters, *world.bullets)
+            ])
+        return trace
+
+    def test_stored_monsters_play_like_the_others(self):
+        without_store = self.trace(400, store=False)
+        with_store = self.trace(400, store=True)
+
+        self.assertGreater(self.stored_gunners, 0)
+        self.assertEqual(len(with_store), len(without_store))
+        for tick, (stored, unstored) in enumerate(zip(with_store, without_store)):
+            self.assertEqual(stored, unstored, f"tick {tick}")
+
+if __name__ == '__main__':
+    unittest.main()
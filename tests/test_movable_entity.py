@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+import settings
 from presentation.sprite import Sprite
 from business.entities.entity import MovableEntity
 
@@ -17,3 +18,9 @@ class TestMovableEntity(unittest.TestCase):
         self.assertEqual(self.movable_entity.pos_x, 3.0)
         self.assertEqual(self.movable_entity.pos_y, 4.0)
         self.movable_entity.sprite.update_pos.assert_called_once_with(3.0, 4.0)
+
+    def test_move_is_scaled_by_the_simulation_rate(self):
+        with patch.object(settings, 'SPEED_SCALE', 2):
+            self.movable_entity.move(3, 4)
+
+        self.assertEqual((self.movable_entity.pos_x, self.movable_entity.pos_y), (6.0, 8.0))
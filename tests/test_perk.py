@@ -3,6 +3,8 @@ from unittest.mock import Mock, patch
 from business.entities.interfaces import IPlayer
 from business.upgrades.perks import RegenerationPerk
 import pygame
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
 
 class TestRegenerationPerk(unittest.TestCase):
 
@@ -19,6 +21,9 @@ class TestRegenerationPerk(unittest.TestCase):
         self.perk = RegenerationPerk(self.mock_player)
 
     def tearDown(self):
+        # The loaded images are mocks, so they must not stay in the shared caches
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
         pygame.display.quit()
         pygame.quit()
 
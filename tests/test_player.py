@@ -66,6 +66,16 @@ class TestPlayer(unittest.TestCase):
         self.player.handle_perk(speed_perk)
         self.assertEqual(self.player.speed_multiplier, 1.2)
 
+    def test_handle_perk_changes_the_inventory_version(self):
+        perk_mock = MagicMock(spec=SpeedPerk)
+        version = self.player.inventory_version
+
+        self.player.handle_perk(perk_mock)
+        self.player.handle_perk(perk_mock)
+
+        self.assertEqual(self.player.inventory_version, version + 2)
+        perk_mock.upgrade.assert_called_once()
+
     def test_take_damage(self):
         initial_health = self.player.health
         self.player.take_damage(20)
@@ -0,0 +1,108 @@
+import json
+import unittest
+from unittest.mock import Mock
+import pygame
+import settings
+from business.entities.bullets import NormalBullet, TurretBullet, FollowingBullet
+from business.entities.monsters.bullets import MonsterBullet
+from business.handlers.death_handler import DeathHandler
+from business.upgrades.bullet_factories import NormalBulletFactory
+from business.world.projectile_store import ProjectileStore
+
+@unittest.skipUnless(ProjectileStore.available(), "NumPy is not installed")
+class TestProjectileStore(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.store = ProjectileStore(capacity=2)
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def __bullets(self):
+        return [
+            NormalBullet(100, 100, 200, 150, 5, 10, 1),
+            TurretBullet(300, 300, 100, 300, 7, 20, 2),
+            MonsterBullet(500, 200, 500, 100, 3, 5, 1),
+        ]
+
+    def test_only_straight_bullets_are_attached(self):
+        self.assertTrue(all(self.store.attach(bullet) for bullet in self.__bullets()))
+        self.assertFalse(self.store.attach(FollowingBullet(0, 0, None, 1, 1, 1)))
+        self.assertEqual(len(self.store), 3)
+
+    def test_integrate_moves_like_every_bullet_on_its_own(self):
+        stored = self.__bullets()
+        alone = self.__bullets()
+        for bullet in stored:
+            self.store.attach(bullet)
+
+        for _ in range(4):
+            self.store.integrate()
+            for bullet in stored + alone:
+                bullet.update(None)
+
+        for stored_bullet, bullet in zip(stored, alone):
+            self.assertAlmostEqual(stored_bullet.pos_x, bullet.pos_x)
+            self.assertAlmostEqual(stored_bullet.pos_y, bullet.pos_y)
+            self.assertEqual(stored_bullet.sprite.rect.center, bullet.sprite.rect.center)
+            self.assertEqual(stored_bullet.to_json(), bullet.to_json())
+
+    def test_expired_finds_dead_and_escaped_bullets(self):
+        alive, dead, escaped = self.__bullets()
+        escaped_x = settings.WORLD_WIDTH + 100
+        escaped = NormalBullet(escaped_x, 100, escaped_x + 1, 100, 5, 10, 1)
+        for bullet in (alive, dead, escaped):
+            self.store.attach(bullet)
+
+        dead.take_damage(10)
+
+        self.assertEqual(self.store.expired(), [dead, escaped])
+
+    def test_death_handler_removes_expired_bullets_once(self):
+        alive, dead, _ = self.__bullets()
+        for bullet in (alive, dead):
+            self.store.attach(bullet)
+        dead.take_damage(10)
+
+        world = Mock()
+        world.projectile_store = self.store
+        world.bullets = [alive, dead]
+        world.items = []
+        world.monsters = []
+        world.player.health = 100
+
+        DeathHandler.check_deaths(world)
+
+        world.remove_bullet.assert_called_once_with(dead)
+
+    def test_saved_bullets_load_back_into_the_store(self):
+        bullet = NormalBullet(100, 100, 200, 150, 5, 10, 1)
+        self.store.attach(bullet)
+        self.store.integrate()
+
+        world = Mock()
+        world.add_bullet.side_effect = self.store.attach
+        NormalBulletFactory.load_bullets([bullet.to_json()], world)
+
+        loaded = world.add_bullet.call_args.args[0]
+        self.assertTrue(loaded.in_store)
+        self.assertEqual(loaded.to_json(), bullet.to_json())
+
+    def test_integer_values_are_saved_as_ints(self):
+        bullet = NormalBullet(100, 100, 200, 150, 5, 10, 1)
+        alone = NormalBullet(100, 100, 200, 150, 5, 10, 1)
+        self.store.attach(bullet)
+        bullet.take_damage(1)
+        alone.take_damage(1)
+
+        saved = bullet.to_json()
+        for field in ('speed', 'damage', 'health'):
+            self.assertIs(type(saved[field]), int)
+            self.assertEqual(json.dumps(saved[field]), json.dumps(alone.to_json()[field]))
+
+        self.store.detach(bullet)
+        self.assertIs(type(bullet.to_json()['damage']), int)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+import pygame
+from business.handlers.death_handler import DeathHandler
+from business.world.game_world import GameWorld
+from business.world.slot_map import SlotMap, EntityHandle
+
+class TestSlotMap(unittest.TestCase):
+    def setUp(self):
+        self.slot_map = SlotMap('monsters')
+
+    def test_add_and_remove(self):
+        entities = [Mock() for _ in range(4)]
+        for entity in entities:
+            self.slot_map.add(entity)
+
+        self.slot_map.remove(entities[1])
+
+        self.assertEqual(len(self.slot_map), 3)
+        self.assertNotIn(entities[1], self.slot_map)
+        self.assertEqual(self.slot_map.entities, [entities[0], entities[2], entities[3]])
+
+    def test_removals_keep_the_order_of_the_others(self):
+        entities = [Mock() for _ in range(6)]
+        handles = [self.slot_map.add(entity) for entity in entities]
+
+        self.slot_map.remove(entities[4])
+        self.slot_map.remove(entities[1])
+        self.assertEqual(len(self.slot_map), 4)
+        added = Mock()
+        self.slot_map.add(added)
+
+        self.assertEqual(list(self.slot_map.view), [entities[0], entities[2], entities[3], entities[5], added])
+        self.assertIs(self.slot_map.get(handles[5]), entities[5])
+        self.assertIs(self.slot_map.view[3], entities[5])
+
+    def test_remove_missing_entity_raises_value_error(self):
+        entity = Mock()
+        with self.assertRaises(ValueError):
+            self.slot_map.remove(entity)
+
+        self.slot_map.add(entity)
+        self.slot_map.remove(entity)
+        with self.assertRaises(ValueError):
+            self.slot_map.remove(entity)
+
+    def test_add_twice_raises_value_error(self):
+        entity = Mock()
+        self.slot_map.add(entity)
+        with self.assertRaises(ValueError):
+            self.slot_map.add(entity)
+
+    def test_handles_detect_removed_entities(self):
+        first, second, third = Mock(), Mock(), Mock()
+        first_handle = self.slot_map.add(first)
+        second_handle = self.slot_map.add(second)
+
+        self.slot_map.remove(first)
+        third_handle = self.slot_map.add(third)
+
+        self.assertEqual(third_handle.index, first_handle.index)
+        self.assertIsNone(self.slot_map.get(first_handle))
+        self.assertIs(self.slot_map.get(second_handle), second)
+        self.assertIs(self.slot_map.get(third_handle), third)
+        self.assertEqual(self.slot_map.handle_of(third), third_handle)
+        self.assertIsNone(self.slot_map.get(EntityHandle('bullets', 0, 0)))
+
+class TestGameWorldEntities(unittest.TestCase):
+    AMOUNT = 5000
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.world = GameWorld(Mock(), Mock(), Mock(), Mock())
+        self.world.player.health = 100
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def test_handles_from_the_world(self):
+        monster = SimpleNamespace(pos_x=100, pos_y=100)
+        self.world.add_monster(monster)
+        self.world.flush_changes()
+        handle = self.world.handle_of(monster)
+
+        self.assertIs(self.world.resolve(handle), monster)
+        self.world.remove_monster(monster)
+        self.world.flush_changes()
+        self.assertIsNone(self.world.resolve(handle))
+        self.assertIsNone(self.world.handle_of(monster))
+
+    def test_removed_monsters_keep_the_order_of_the_world(self):
+        monsters = [SimpleNamespace(pos_x=100 + i, pos_y=100) for i in range(5)]
+        self.world.add_monsters(monsters)
+        self.world.flush_changes()
+
+        self.world.remove_monster(monsters[0])
+        self.world.remove_monster(monsters[2])
+        self.world.flush_changes()
+
+        self.assertEqual(list(self.world.monsters), [monsters[1], monsters[3], monsters[4]])
+
+    def test_thousands_of_deaths_in_one_tick(self):
+        monsters = [SimpleNamespace(pos_x=100 + i % 500, pos_y=100, health=0) for i in range(self.AMOUNT)]
+        bullets = [SimpleNamespace(pos_x=100, pos_y=100 + i % 500, health=0) for i in range(self.AMOUNT)]
+        survivor = SimpleNamespace(pos_x=100, pos_y=100, health=10)
+        for monster in monsters:
+            self.world.add_monster(monster)
+        self.world.add_monster(survivor)
+        for bullet in bullets:
+            self.world.add_bullet(bullet)
+        self.world.flush_changes()
+
+        start = time.perf_counter()
+        DeathHandler.check_deaths(self.world)
+        self.world.flush_changes()
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(self.world.monsters, [survivor])
+        self.assertEqual(self.world.bullets, [])
+        # With list.remove this was quadratic and took seconds
+        self.assertLess(elapsed, 1)
+
+    def test_changes_wait_until_the_flush(self):
+        first = SimpleNamespace(pos_x=100, pos_y=100)
+        second = SimpleNamespace(pos_x=200, pos_y=100)
+        self.world.add_monster(first)
+        self.world.flush_changes()
+
+        monsters = self.world.monsters
+        for monster in monsters:
+            self.world.remove_monster(monster)
+            self.world.add_monster(second)
+
+        self.assertEqual(monsters, [first])
+        self.world.flush_changes()
+        self.assertEqual(monsters, [second])
+
+    def test_entities_added_in_a_tick_are_updated_in_it(self):
+        bullet = Mock(pos_x=100, pos_y=100)
+        monster = Mock(pos_x=200, pos_y=100)
+        item = Mock(pos_x=300, pos_y=100)
+        monster_bullet = Mock(pos_x=200, pos_y=100)
+        self.world.player.update.side_effect = lambda world: world.add_bullet(bullet)
+        self.world.monster_spawner.update.side_effect = lambda world: world.add_monster(monster)
+        bullet.update.side_effect = lambda world: world.add_item(item)
+        monster.update.side_effect = lambda world: world.add_bullet(monster_bullet)
+
+        self.world.update()
+
+        bullet.update.assert_called_once_with(self.world)
+        monster.update.assert_called_once_with(self.world)
+        item.update.assert_called_once_with(self.world)
+        # Like with the copies of the lists, the bullets only move in the tick after the monsters fire them
+        monster_bullet.update.assert_not_called()
+
+    def test_queued_changes_are_checked_right_away(self):
+        monster = SimpleNamespace(pos_x=100, pos_y=100)
+        with self.assertRaises(ValueError):
+            self.world.remove_monster(monster)
+
+        self.world.add_monster(monster)
+        with self.assertRaises(ValueError):
+            self.world.add_monster(monster)
+
+        self.world.remove_monster(monster)
+        with self.assertRaises(ValueError):
+            self.world.remove_monster(monster)
+
+    def test_bulk_additions_wait_until_the_flush(self):
+        monsters = [SimpleNamespace(pos_x=100 + i, pos_y=100) for i in range(3)]
+        items = [SimpleNamespace(pos_x=100, pos_y=100 + i) for i in range(2)]
+        self.world.add_monsters(monsters)
+        self.world.add_items(items)
+
+        self.assertEqual(self.world.monsters, [])
+        self.world.remove_monster(monsters[0])
+        self.world.flush_changes()
+
+        self.assertCountEqual(self.world.monsters, monsters[1:])
+        self.assertEqual(self.world.items, items)
+
+    def test_bulk_addition_with_an_added_entity_adds_none(self):
+        present = SimpleNamespace(pos_x=100, pos_y=100)
+        new = SimpleNamespace(pos_x=200, pos_y=100)
+        self.world.add_bullet(present)
+
+        with self.assertRaises(ValueError):
+            self.world.add_bullets([new, present])
+        with self.assertRaises(ValueError):
+            self.world.add_bullets([new, new])
+
+        self.world.flush_changes()
+        self.assertEqual(self.world.bullets, [present])
+
+    def test_views_are_read_only_and_counted(self):
+        self.assertIs(self.world.items, self.world.items)
+        with self.assertRaises(TypeError):
+            self.world.items[0] = Mock()
+
+        self.world.update()
+        self.world.bullets
+        self.world.monsters
+        self.world.update()
+
+        # The update reads the monsters, bullets and items once more
+        self.assertGreaterEqual(self.world.copies_saved, 5)
+
+if __name__ == '__main__':
+    unittest.main()
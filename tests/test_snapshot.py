@@ -0,0 +1,74 @@
+import unittest
+import pygame
+from unittest.mock import Mock
+from business.entities.bullets import NormalBullet, TurretBullet, FollowingBullet
+from business.entities.items.experience_gem import ExperienceGem
+from business.entities.monsters.boss import BossMonster
+from business.entities.monsters.boss2 import BigBossMonster
+from business.entities.monsters.bullets import MonsterBullet
+from business.entities.monsters.gunner import GunMonster
+from business.entities.monsters.monster import Monster
+from business.handlers.clock import GameClockSingleton
+from business.world.type_registry import TYPE_REGISTRY
+from persistence.snapshot import GameSnapshot
+from presentation.headless_display import HeadlessDisplay
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
+from runner import initialize_game_world
+
+class TestGameSnapshot(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        GameClockSingleton().reset()
+        self.world = initialize_game_world(HeadlessDisplay(), {})
+
+        monster = Monster(100, 200)
+        monster.take_damage(1)
+        for entity in (monster, GunMonster(300, 400), BossMonster(50, 60), BigBossMonster(70, 80)):
+            self.world.add_monster(entity)
+        for bullet in (NormalBullet(10, 10, 50, 60, 4, 5, 50), TurretBullet(10, 10, 70, 20, 10, 3, 5),
+                       FollowingBullet(30, 30, None, 3, 10, 20), MonsterBullet(40, 40, 10, 10, 5, 4, 1)):
+            self.world.add_bullet(bullet)
+        self.world.add_item(ExperienceGem(5, 6, 1))
+        self.world.flush_changes()
+        self.world.update()
+
+    def tearDown(self):
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.quit()
+
+    def saved_json(self) -> dict:
+        return {
+            group: sorted((TYPE_REGISTRY.tag_of(entity), str(entity.to_json())) for entity in getattr(self.world, group))
+            for group in GameSnapshot.GROUPS
+        }
+
+    @staticmethod
+    def data_json(data: dict) -> dict:
+        return {
+            group: sorted((tag, str(values)) for tag, rows in data[group].items() for values in rows)
+            for group in GameSnapshot.GROUPS
+        }
+
+    def test_data_is_the_json_of_every_entity(self):
+        self.assertTrue(any(monster.in_store for monster in self.world.monsters))
+        self.assertTrue(any(getattr(bullet, 'in_store', False) for bullet in self.world.bullets))
+
+        data = GameSnapshot(Mock(world=self.world)).data()
+
+        self.assertEqual(self.data_json(data), self.saved_json())
+        self.assertEqual(data['player'], self.world.player.to_json())
+
+    def test_data_is_not_changed_by_the_game(self):
+        expected = self.saved_json()
+        snapshot = GameSnapshot(Mock(world=self.world))
+
+        for monster in self.world.monsters:
+            monster.take_damage(1)
+        self.world.update()
+
+        self.assertEqual(self.data_json(snapshot.data()), expected)
+
+if __name__ == '__main__':
+    unittest.main()
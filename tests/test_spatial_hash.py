@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import Mock
+import pygame
+from business.handlers.spatial_hash import SpatialHash
+
+class TestSpatialHash(unittest.TestCase):
+
+    def create_entity(self, x, y, width=48, height=48):
+        entity = Mock()
+        entity.sprite.rect = pygame.Rect(x, y, width, height)
+        return entity
+
+    def setUp(self):
+        self.grid = SpatialHash(48, 48)
+
+    def test_query_returns_entities_in_nearby_cells(self):
+        near = self.create_entity(10, 10)
+        far = self.create_entity(1000, 1000)
+        self.grid.rebuild([near, far])
+
+        result = self.grid.query(pygame.Rect(20, 20, 10, 10))
+
+        self.assertEqual(result, [near])
+
+    def test_query_keeps_insertion_order_without_duplicates(self):
+        big = self.create_entity(0, 0, 200, 200)
+        small = self.create_entity(50, 50, 10, 10)
+        self.grid.rebuild([big, small])
+
+        result = self.grid.query(pygame.Rect(0, 0, 150, 150))
+
+        self.assertEqual(result, [big, small])
+
+    def test_entities_in_negative_cells(self):
+        entity = self.create_entity(-100, -100, 10, 10)
+        self.grid.rebuild([entity])
+
+        self.assertEqual(self.grid.query(pygame.Rect(-95, -95, 1, 1)), [entity])
+
+    def test_clear(self):
+        self.grid.rebuild([self.create_entity(0, 0)])
+        self.grid.clear()
+
+        self.assertEqual(len(self.grid), 0)
+        self.assertEqual(self.grid.query(pygame.Rect(0, 0, 48, 48)), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import pygame
+from presentation.sprite import Sprite
+
+class CountingSurface(pygame.Surface):
+    """A surface that counts how many copies are made of it."""
+
+    copies = 0
+
+    def copy(self):
+        CountingSurface.copies += 1
+        return super().copy()
+
+class TestSprite(unittest.TestCase):
+    def setUp(self):
+        CountingSurface.copies = 0
+        self.image = CountingSurface((4, 4))
+        self.image.fill((200, 200, 200))
+        self.sprites = [Sprite(self.image, self.image.get_rect()) for _ in range(10)]
+
+    def test_hits_do_not_allocate_surfaces(self):
+        for sprite in self.sprites:
+            sprite.take_damage()
+        red = self.sprites[0].image
+
+        for _ in range(20):
+            for sprite in self.sprites:
+                sprite.update()
+                sprite.take_damage()
+
+        # Only the first hit creates the red image, and every sprite shares it
+        self.assertEqual(CountingSurface.copies, 1)
+        self.assertTrue(all(sprite.image is red for sprite in self.sprites))
+
+    def test_flashes_restore_the_original_image(self):
+        sprite = self.sprites[0]
+        sprite.heal()
+        self.assertEqual(sprite.image.get_at((0, 0))[:3], (0, 200, 0))
+
+        for _ in range(24):
+            sprite.update()
+
+        self.assertIs(sprite.image, self.image)
+        sprite.take_damage()
+        self.assertEqual(sprite.image.get_at((0, 0))[:3], (200, 0, 0))
+        self.assertEqual(CountingSurface.copies, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import pygame
+from presentation.text_cache import TextCache
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.cache = TextCache(max_texts=2)
+
+    def tearDown(self):
+        pygame.font.quit()
+
+    def test_fonts_are_loaded_once(self):
+        self.assertIs(self.cache.font(36), self.cache.font(36))
+        self.assertIsNot(self.cache.font(36), self.cache.font(24))
+
+    def test_texts_are_rendered_once(self):
+        font = self.cache.font(36)
+
+        first = self.cache.render("Nivel 1", font, (255, 255, 255))
+        second = self.cache.render("Nivel 1", font, (255, 255, 255))
+        other_color = self.cache.render("Nivel 1", font, (0, 0, 0))
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other_color)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_least_recently_used_text_is_forgotten(self):
+        font = self.cache.font(36)
+        old = self.cache.render("a", font, (255, 255, 255))
+        recent = self.cache.render("b", font, (255, 255, 255))
+        self.cache.render("a", font, (255, 255, 255))
+
+        self.cache.render("c", font, (255, 255, 255))
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIs(self.cache.render("a", font, (255, 255, 255)), old)
+        self.assertIsNot(self.cache.render("b", font, (255, 255, 255)), recent)
+
+if __name__ == '__main__':
+    unittest.main()
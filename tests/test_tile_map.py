@@ -0,0 +1,22 @@
+import unittest
+from business.world.tile_map import TileMap
+
+class TestTileMap(unittest.TestCase):
+    def setUp(self):
+        self.tile_map = TileMap()
+
+    def test_set_changes_the_tile_and_the_version(self):
+        version = self.tile_map.version
+
+        self.tile_map.set(2, 3, 1)
+
+        self.assertEqual(self.tile_map.get(2, 3), 1)
+        self.assertEqual(self.tile_map.version, version + 1)
+
+    def test_get_does_not_change_the_version(self):
+        version = self.tile_map.version
+        self.tile_map.get(0, 0)
+        self.assertEqual(self.tile_map.version, version)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import patch
+import pygame
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TilesetRegistry, TILESETS
+from presentation.sprite import TurretBulletSprite, ExperienceGemSprite, UPGRADES_TILESET, preload_images
+
+class TestTilesetRegistry(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.registry = TilesetRegistry()
+
+    def tearDown(self):
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.display.quit()
+
+    def test_tilesets_are_sliced_once(self):
+        first = self.registry.get(*UPGRADES_TILESET)
+        second = self.registry.get(*UPGRADES_TILESET)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(first.tiles), 8)
+        self.assertEqual(len(self.registry), 1)
+
+    def test_sprites_are_created_without_reading_the_disk(self):
+        preload_images()
+
+        with patch('pygame.image.load') as mock_load, patch('pygame.transform.scale') as mock_scale:
+            first, second = TurretBulletSprite(0, 0), TurretBulletSprite(5, 5)
+            ExperienceGemSprite(0, 0)
+            mock_load.assert_not_called()
+            mock_scale.assert_not_called()
+
+        self.assertIs(first.image, second.image)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import pygame
+from business.entities.bullets import NormalBullet
+from business.entities.items.experience_gem import BlueExperienceGem
+from business.entities.monsters.gunner import GunMonster
+from business.entities.monsters.monster import Monster
+from business.handlers.clock import GameClockSingleton
+from business.upgrades.bullet_factories import NormalBulletFactory
+from business.upgrades.perks import SpeedPerk
+from business.world.type_registry import TypeRegistry, TYPE_REGISTRY
+from presentation.headless_display import HeadlessDisplay
+from presentation.image_cache import IMAGE_CACHE
+from presentation.tileset import TILESETS
+from runner import initialize_game_world
+
+class Saved:
+    pass
+
+class TestTypeRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = TypeRegistry()
+        self.registry.register('saved')(Saved)
+
+    def test_type_is_found_by_its_tag_and_by_its_older_key(self):
+        self.assertEqual(self.registry.tag_of(Saved()), 'saved')
+        self.assertIs(self.registry.type_of('saved'), Saved)
+        self.assertIs(self.registry.type_of(str(Saved)), Saved)
+
+    def test_unregistered_types_keep_the_str_of_the_type(self):
+        self.assertEqual(self.registry.tag_of(1), str(int))
+        self.assertIsNone(self.registry.type_of(str(int)))
+
+    def test_tag_of_another_class_is_not_replaced(self):
+        with self.assertRaises(ValueError):
+            self.registry.register('saved')(int)
+
+class TestSavedTypes(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        GameClockSingleton().reset()
+
+    def tearDown(self):
+        IMAGE_CACHE.clear()
+        TILESETS.clear()
+        pygame.quit()
+
+    def test_monsters_are_saved_with_their_tags(self):
+        self.assertEqual(TYPE_REGISTRY.tag_of(Monster(10, 10)), 'monster')
+        self.assertEqual(list(GunMonster(10, 10).to_json()['inventory']), ['monster_gun'])
+
+    def test_load_all_restores_every_monster(self):
+        saved_data = [{'pos_x': 100 + i, 'pos_y': 200, 'health': i + 1, 'attack_cooldown': 50} for i in range(3)]
+
+        monsters = TYPE_REGISTRY.load_all(TYPE_REGISTRY.type_of('monster'), saved_data)
+
+        self.assertEqual([monster.to_json() for monster in monsters], saved_data)
+
+    def test_gun_cooldown_is_restored_with_older_and_current_keys(self):
+        for gun_key in ('monster_gun', "<class 'business.entities.monsters.upgrades.bullet_factory.MonsterBulletFactory'>"):
+            saved_data = {'pos_x': 100, 'pos_y': 200, 'health': 5, 'inventory': {gun_key: {'level': 1, 'attack_cooldown': 1234}}}
+
+            (gun_monster,) = TYPE_REGISTRY.load_all(GunMonster, [saved_data])
+
+            self.assertEqual(gun_monster.to_json()['inventory']['monster_gun']['attack_cooldown'], 1234)
+
+    def test_saves_of_older_versions_are_restored(self):
+        display = HeadlessDisplay()
+        player = initialize_game_world(display, {}).player.to_json()
+        player['static'] = {str(SpeedPerk): {'level': 2}}
+        player['updatable'] = {str(NormalBulletFactory): {'level': 1, 'attack_cooldown': 0}}
+        saved_data = {
+            'monsters': {str(Monster): [Monster(100, 100).to_json(), Monster(200, 100).to_json()]},
+            'bullets': {str(NormalBullet): [NormalBullet(100, 100, 200, 100, 4, 5, 50).to_json()]},
+            'items': {str(BlueExperienceGem): [BlueExperienceGem(300, 300, 1).to_json()]},
+            'monster_spawner': {'minute_boss_added': False, 'second_minute_boss_added': False},
+            'player': player,
+            'clock': 0,
+        }
+
+        world = initialize_game_world(display, saved_data)
+
+        self.assertEqual([type(monster) for monster in world.monsters], [Monster, Monster])
+        self.assertEqual([type(bullet) for bullet in world.bullets], [NormalBullet])
+        self.assertEqual([type(item) for item in world.items], [BlueExperienceGem])
+        self.assertEqual(world.player.to_json()['static'], {'speed': {'level': 2}})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import Mock
+import pygame
+from presentation.world_snapshot import SnapshotBuffer, WorldSnapshot
+
+class TestWorldSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.world = Mock()
+        self.monster = self.__entity(10, 10)
+        self.monster.health = 5
+        self.monster.max_health = 10
+        self.world.monsters = [self.monster]
+        self.world.items = [self.__entity(20, 20)]
+        self.world.bullets = []
+
+        player = self.__entity(30, 30)
+        player.inventory_version = 1
+        player.inventory = [Mock(level=2)]
+        self.world.player = player
+
+    def __entity(self, x, y):
+        entity = Mock()
+        entity.sprite.rect = pygame.Rect(x, y, 48, 48)
+        return entity
+
+    def test_capture_copies_the_rects(self):
+        snapshot = WorldSnapshot.capture(self.world, 1)
+
+        self.monster.sprite.rect.x = 100
+
+        self.assertEqual(snapshot.monsters[0].sprite.rect.x, 10)
+        self.assertEqual(snapshot.monsters[0].health, 5)
+        self.assertEqual(snapshot.items[0].sprite.image, self.world.items[0].sprite.image)
+        self.assertEqual(snapshot.player.inventory[0].level, 2)
+
+    def test_inventory_is_reused_while_its_version_is_the_same(self):
+        first = WorldSnapshot.capture(self.world, 1)
+        self.world.player.inventory = [Mock(level=3)]
+
+        second = WorldSnapshot.capture(self.world, 2, first)
+        self.world.player.inventory_version = 2
+        third = WorldSnapshot.capture(self.world, 3, second)
+
+        self.assertIs(second.player.inventory, first.player.inventory)
+        self.assertEqual(third.player.inventory[0].level, 3)
+
+class TestSnapshotBuffer(unittest.TestCase):
+    def setUp(self):
+        self.buffer = SnapshotBuffer()
+
+    def test_latest_is_the_last_published(self):
+        self.assertIsNone(self.buffer.latest())
+
+        self.buffer.publish('first')
+        self.buffer.publish('second')
+
+        self.assertEqual(self.buffer.latest(), 'second')
+        self.assertEqual(self.buffer.published, 2)
+
+    def test_snapshots_replaced_before_being_read_are_counted(self):
+        self.buffer.publish('first')
+        self.buffer.publish('second')
+        self.buffer.latest()
+        self.buffer.publish('third')
+
+        self.assertEqual(self.buffer.skipped, 1)
+
+if __name__ == '__main__':
+    unittest.main()